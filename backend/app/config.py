@@ -36,14 +36,18 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24시간 (1440분)
     EMAIL_VERIFICATION_EXPIRE_MINUTES: int = 60 * 24  # 임시 사용자 토큰 만료 시간 (기본 24시간)
     TEMP_USER_CLEANUP_INTERVAL_SECONDS: int = 60 * 60  # 만료된 임시 사용자 정리 주기 (기본 1시간)
+    HOME_STATS_CACHE_SECONDS: int = 30  # 홈 통계 캐시 유지 시간 (만료 후 백그라운드 갱신)
+    SEO_FEED_CACHE_SECONDS: int = 600  # sitemap/rss 캐시 유지 시간 (공지/FAQ 변경 시 즉시 무효화)
+    DASHBOARD_SUMMARY_CACHE_SECONDS: int = 60  # 관리자 대시보드 요약 캐시 유지 시간 (테이블 변경 시 즉시 무효화)
+    COUNT_CACHE_SECONDS: int = 60  # 목록 total 캐시 유지 시간 (테이블 변경 시 즉시 무효화)
+    COUNT_ESTIMATE_MIN_ROWS: int = 100_000  # 필터 없는 목록에서 이 행 수 이상이면 정확한 count 대신 플래너 추정치 사용
+    NOTIFICATION_UNREAD_RECONCILE_SECONDS: int = 60  # 읽지 않은 알림 카운터를 DB count로 맞추는 주기
+    QUIZ_HISTORY_PARTITION_MONTHS_AHEAD: int = 2  # user_quiz_history 월 파티션을 이번 달 이후 몇 개월까지 미리 만들어 둘지
+    QUIZ_HISTORY_PARTITION_CHECK_SECONDS: int = 21600  # 월 파티션 생성 확인 주기 (백그라운드)
+    QUIZ_HISTORY_RETENTION_MONTHS: int = 24  # 보관 스크립트 기본값: 이보다 오래된 월 파티션을 파일로 내림 (통계는 집계로 유지)
+    QUIZ_HISTORY_ARCHIVE_DIR: str = os.path.join(BASE_DIR, "archives", "quiz_history")  # 보관 파일(.csv.gz) 저장 위치
     
-    # DB 자동 마이그레이션 설정
-    # none: 마이그레이션 없음 (프로덕션)
-    # validate: 테이블 존재만 확인
-    # update: 누락된 컬럼만 추가 (권장)
-    # create: 테이블 없으면 생성
-    # create-drop: 시작 시 drop_all 후 create_all (개발용, 데이터 삭제됨!)
-    DB_AUTO_MIGRATE: str = "update"
+    # DB 스키마는 Alembic으로 관리 (backend에서 `alembic upgrade head`, 서버 시작 시 자동 생성 없음)
     
     # 이메일 설정 (SMTP)
     MAIL_USERNAME: str = ""  # 이메일 주소 또는 사용자명
@@ -62,20 +66,47 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_SECRET: str = ""  # Google OAuth Client Secret
     GOOGLE_REDIRECT_URI: str = ""  # Google OAuth Redirect URI
     GOOGLE_CALENDAR_ID: str = ""  # Google Calendar ID (예: calendar-id@group.calendar.google.com)
+    GOOGLE_CALENDAR_FAKE: bool = False  # True면 Google 대신 메모리 기반 가짜 캘린더 사용 (개발/테스트용)
+    CALENDAR_SYNC_INTERVAL_SECONDS: int = 300  # 로컬 일정 저장소 증분 동기화 주기
+    CALENDAR_SYNC_PAST_DAYS: int = 365  # 로컬 저장소에 보관할 과거 일정 범위 (일)
+    CALENDAR_FULL_RESYNC_HOURS: int = 24  # 보관 범위를 앞으로 당기기 위한 전체 재동기화 주기
+    CALENDAR_ICS_CACHE_SECONDS: int = 300  # ICS 피드 캐시 유지 시간 (일정 변경 시 즉시 무효화)
+    CALENDAR_ICS_PAST_DAYS: int = 90  # ICS 피드에 포함할 과거 일정 범위 (일)
+    CALENDAR_ICS_MAX_EVENTS: int = 1000  # ICS 피드에 포함할 최대 일정 수
     GOOGLE_TOKEN_REDIRECT_URI: str | None = None  # 토큰 발급 전용 Redirect URI
     GOOGLE_TOKEN_FILE: str = os.path.join(BASE_DIR, "token.json")  # Google OAuth 토큰 저장 경로
+    GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS: int = 300  # 만료 몇 초 전에 백그라운드에서 토큰을 갱신할지
+    GOOGLE_DISCOVERY_CACHE_DIR: str = os.path.join(BASE_DIR, ".google_discovery_cache")  # API discovery 문서 캐시 경로
     GOOGLE_DRIVE_FOLDER_ID_EXCEL: str | None = None  # 대상자 엑셀 업로드용 Google Drive 폴더
     GOOGLE_DRIVE_FOLDER_ID_NOTICE_IMAGE: str | None = None  # 공지 이미지 업로드용 Google Drive 폴더
     GOOGLE_DRIVE_FOLDER_ID_QUIZ_IMAGE: str | None = None  # 퀴즈 이미지 업로드용 Google Drive 폴더
 
+    DRIVE_UPLOAD_MAX_ATTEMPTS: int = 5  # Drive 업로드 큐 최대 재시도 횟수
+    DRIVE_UPLOAD_RETRY_BASE_SECONDS: int = 30  # 재시도 간격 기준 (시도마다 2배, 최대 1시간)
+    DRIVE_UPLOAD_POLL_SECONDS: int = 60  # 대기 중인 업로드가 없을 때 큐 확인 주기
+    DRIVE_UPLOAD_LEASE_SECONDS: int = 1800  # 업로드 점유 유지 시간 (워커가 업로드 중 죽으면 이 시간 뒤 다시 시도)
+    DRIVE_UPLOAD_CHUNK_SIZE_MB: int = 8  # resumable 업로드 청크 크기 (업로드당 메모리 사용량 기준)
+    GOOGLE_DRIVE_FAKE_ROOT: str | None = None  # 설정 시 Google Drive 대신 이 로컬 디렉터리에 업로드 (개발/테스트용)
+
     # Naver OAuth (로그인)
     NAVER_CLIENT_ID: str = ""
     NAVER_CLIENT_SECRET: str = ""
+
+    # 외부 HTTP 호출 (소셜 로그인 토큰 교환 등, 공유 AsyncClient)
+    GOOGLE_OAUTH_TIMEOUT_SECONDS: float = 10.0  # Google 토큰 교환/프로필 조회 타임아웃
+    NAVER_OAUTH_TIMEOUT_SECONDS: float = 10.0  # 네이버 토큰 교환/프로필 조회 타임아웃
+    HTTP_CLIENT_DEFAULT_TIMEOUT_SECONDS: float = 10.0  # 그 밖의 외부 호출 기본 타임아웃
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20  # 공유 연결 풀 크기
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = 60.0  # 유휴 keep-alive 연결 유지 시간
+    HTTP_CLIENT_SLOW_LOG_MS: int = 2000  # 이 시간 이상 걸린 외부 호출은 로그로 남김
     
     # 미디어/업로드 설정
     MEDIA_URL: str = "/uploads"
     MEDIA_ROOT: str = os.path.join(BASE_DIR, "uploads")
     QUIZ_IMAGE_UPLOAD_SUBDIR: str = "quiz-images"
+    NOTICE_IMAGE_UPLOAD_SUBDIR: str = "notice-images"
+    # 공개 정적 경로(MEDIA_ROOT)로 노출되면 안 되는 업로드(대상자 명단 등)의 로컬 저장 위치
+    PRIVATE_MEDIA_ROOT: str = os.path.join(BASE_DIR, "private_uploads")
     MAX_QUIZ_IMAGE_SIZE_MB: int = 5
 
     class Config:
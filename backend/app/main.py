@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from fastapi import FastAPI, Request
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
-from app import settings, engine, Base
+from app import settings
 from app.config import FRONTEND_DIST
 from app.database.connection import SessionLocal
 from fastapi.middleware.cors import CORSMiddleware
@@ -46,6 +46,12 @@ from app.routers.admin.admin_setting_api_router import router as admin_setting_a
 from app.routers.admin.google_oauth_router import router as google_oauth_router
 from app.routers.client.seo_router import router as seo_router
 from app.routers.client.quiz_router import router as quiz_router
+from app.services.notification_stream_service import notification_broadcaster
+from app.services.drive_upload_queue_service import drive_upload_queue
+from app.services.google_credentials_service import google_credentials
+from app.services.calendar_sync_service import calendar_event_store
+from app.services.quiz_history_partition_service import quiz_history_partitions
+from app.utils.http_client import shared_http_client
 
 
 async def cleanup_expired_temp_users_task(interval_seconds: int = 3600):
@@ -88,57 +94,9 @@ async def lifespan(app: FastAPI):
 
     # 🚀 Startup
     try:
-        # 디버깅: 실제 설정값 확인
-        print("=" * 60)
-        print("🔍 디버깅 정보:")
-        print(f"  settings.DB_AUTO_MIGRATE (raw): {repr(settings.DB_AUTO_MIGRATE)}")
-        print(f"  settings.DB_AUTO_MIGRATE (type): {type(settings.DB_AUTO_MIGRATE)}")
-        
-        db_mode = settings.DB_AUTO_MIGRATE.lower() if settings.DB_AUTO_MIGRATE else "none"
-        print(f"  db_mode (processed): {repr(db_mode)}")
-        print("=" * 60)
-        
-        print(f"🔄 서버 시작 중...")
-        print(f"📋 DB_AUTO_MIGRATE 설정값: '{settings.DB_AUTO_MIGRATE}'")
-        print(f"📋 적용될 모드: '{db_mode}'")
-        print("=" * 60)
-        
-        if db_mode == "create-drop":
-            # JPA의 create-drop과 동일: 모든 테이블 삭제 후 재생성
-            print("⚠️  경고: create-drop 모드 - 모든 테이블을 삭제하고 재생성합니다!")
-            print("⚠️  이 작업은 모든 데이터를 삭제합니다!")
-            print("🔄 테이블 삭제 중...")
-            try:
-                Base.metadata.drop_all(bind=engine)
-                print("✓ 기존 테이블 삭제 완료")
-            except Exception as drop_error:
-                print(f"⚠️  테이블 삭제 실패 (권한 문제일 수 있음): {drop_error}")
-                print("ℹ️  기존 테이블은 그대로 두고 컬럼만 추가/업데이트합니다.")
-            print("🔄 테이블 재생성/업데이트 중...")
-            Base.metadata.create_all(bind=engine)
-            print("✅ DB 테이블 재생성/업데이트 완료.")
-            print("=" * 60)
-            
-        elif db_mode == "create":
-            # 테이블 없으면 생성
-            Base.metadata.create_all(bind=engine)
-            print("✅ DB 테이블 생성 완료.")
-            
-        elif db_mode == "update":
-            # 테이블 없으면 생성, 있으면 누락된 컬럼만 추가 (권장)
-            Base.metadata.create_all(bind=engine)
-            print("✅ DB 테이블 생성/업데이트 완료.")
-            print("ℹ️  모델 변경사항이 자동으로 반영됩니다.")
-            
-        elif db_mode == "validate":
-            # 테이블 존재만 확인
-            from sqlalchemy import inspect
-            inspector = inspect(engine)
-            tables = inspector.get_table_names()
-            print(f"✅ DB 연결 확인 완료. 테이블 수: {len(tables)}")
-            
-        else:  # none
-            print(f"ℹ️  DB 자동 마이그레이션 비활성화됨 (모드: {db_mode})")
+        # 스키마 생성/변경은 배포 단계의 `alembic upgrade head`에서 한 번만 수행
+        # (워커 시작 시에는 create_all/테이블 조회 등 DDL 관련 작업을 하지 않음)
+        print("🔄 서버 시작 중... (DB 스키마: alembic upgrade head로 관리)")
         cleanup_interval = max(int(getattr(settings, "TEMP_USER_CLEANUP_INTERVAL_SECONDS", 3600)), 0)
         if cleanup_interval > 0:
             app.state.temp_user_cleanup_task = asyncio.create_task(
@@ -148,6 +106,23 @@ async def lifespan(app: FastAPI):
         else:
             print("[TempUser Cleanup] 주기가 0 이하로 설정되어 있어 실행하지 않습니다.")
 
+        drive_upload_queue.start()
+        print("[Drive Upload Queue] Google Drive 업로드 워커 시작")
+
+        await shared_http_client.start()
+
+        calendar_event_store.start()
+        print(f"[Calendar Sync] 일정 동기화 시작 (주기: {settings.CALENDAR_SYNC_INTERVAL_SECONDS}초)")
+
+        quiz_history_partitions.start()
+        print(f"[Quiz History] 월 파티션 확인 시작 (주기: {settings.QUIZ_HISTORY_PARTITION_CHECK_SECONDS}초)")
+
+        try:
+            if notification_broadcaster.start_listening():
+                print("[Notification Stream] Postgres LISTEN 연결 완료 (워커 간 알림 전달)")
+        except Exception as listen_error:
+            print(f"[Notification Stream] LISTEN 연결 실패, 프로세스 내 전달만 사용: {listen_error}")
+
     except SQLAlchemyError as e:
         print(f"❌ DB 초기화 중 오류 발생: {e}")
         import traceback
@@ -168,6 +143,13 @@ async def lifespan(app: FastAPI):
             await cleanup_task
         print("[TempUser Cleanup] 정리 작업이 중단되었습니다.")
 
+    notification_broadcaster.stop_listening()
+    drive_upload_queue.stop()
+    calendar_event_store.stop()
+    quiz_history_partitions.stop()
+    await shared_http_client.aclose()
+    google_credentials.stop()
+
     print("🧹 서버 종료 중... 연결 정리 완료.")
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 
@@ -25,7 +25,7 @@ class FAQ(Base):
     __tablename__ = "faqs"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    category_id = Column(Integer, ForeignKey('faq_categories.id'), nullable=True, comment="카테고리 ID")
+    category_id = Column(Integer, ForeignKey('faq_categories.id'), nullable=True, index=True, comment="카테고리 ID")
     question = Column(String(300), nullable=False, comment="질문")
     answer = Column(Text, nullable=False, comment="답변")
     order = Column(Integer, nullable=False, default=0, comment="정렬 순서")
@@ -39,5 +39,10 @@ class FAQ(Base):
     # 관계 설정
     category = relationship("FAQCategory", back_populates="faqs")
 
+    __table_args__ = (
+        # 관리자 목록 keyset (order ASC, created_at DESC, id DESC)
+        Index("ix_faqs_admin_order", order, created_at.desc(), id.desc(), postgresql_where=(is_deleted == False)),
+    )
+
     def __repr__(self):
         return f"<FAQ(id={self.id}, question='{self.question}', category_id={self.category_id})>"
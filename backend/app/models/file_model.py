@@ -15,6 +15,13 @@ class UploadedFile(Base):
     drive_web_view_link = Column(String(500))
     drive_download_link = Column(String(500))
     drive_created_time = Column(DateTime(timezone=True))
+    # Google Drive 비동기 업로드 큐 상태 (pending / uploading / uploaded / failed, 큐를 거치지 않은 파일은 NULL)
+    drive_status = Column(String(20), index=True)
+    drive_folder_id = Column(String(255))
+    drive_attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    drive_next_attempt_at = Column(DateTime(timezone=True))
+    drive_last_error = Column(String(500))
+    mime_type = Column(String(100))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
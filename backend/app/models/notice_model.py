@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -19,10 +19,12 @@ class Notice(Base):
     __tablename__ = "notices"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    author_id = Column(Integer, ForeignKey('users.id'), nullable=False, comment="작성자 ID")
-    category_id = Column(Integer, ForeignKey('notice_categories.id'), comment="카테고리 ID")
+    author_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True, comment="작성자 ID")
+    category_id = Column(Integer, ForeignKey('notice_categories.id'), index=True, comment="카테고리 ID")
     title = Column(String(200), nullable=False, comment="제목")
     content = Column(Text, nullable=False, comment="내용")
+    excerpt = Column(String(200), nullable=True, comment="본문 요약 (태그 제거 평문, 목록/RSS용)")
+    content_length = Column(Integer, nullable=True, comment="본문 평문 글자 수")
     publish_status = Column(String(20), nullable=False, default="published", comment="발행 상태 (published/scheduled/private)")
     published_at = Column(DateTime(timezone=True), nullable=True, comment="발행일시")
     first_published_at = Column(DateTime(timezone=True), nullable=True, comment="최초 발행일시")
@@ -33,3 +35,15 @@ class Notice(Base):
     deleted_at = Column(DateTime(timezone=True), nullable=True, comment="삭제일시")
 
     category = relationship("NoticeCategory", back_populates="notices")
+
+    __table_args__ = (
+        # 관리자 목록 keyset (created_at DESC, id DESC)
+        Index("ix_notices_admin_list", created_at, id, postgresql_where=(is_deleted == False)),
+        # 공개 목록 / 이전·다음글 정렬 (발행일, 없으면 작성일)
+        Index(
+            "ix_notices_public_timeline",
+            func.coalesce(published_at, created_at),
+            id,
+            postgresql_where=(is_deleted == False),
+        ),
+    )
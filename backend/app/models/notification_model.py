@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, Text, Index
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 
@@ -14,5 +14,12 @@ class Notification(Base):
     related_id = Column(Integer, nullable=True, comment="관련 ID (사용자 ID 또는 추첨 기록 ID)")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
 
+    __table_args__ = (
+        # 읽지 않은 알림 수 카운터의 주기적 재계산용 부분 인덱스
+        Index("ix_notifications_unread", id, postgresql_where=(is_read == False)),
+        # 관리자 알림 목록 keyset (created_at DESC, id DESC)
+        Index("ix_notifications_created_at_id", created_at, id),
+    )
+
     def __repr__(self):
         return f"<Notification(id={self.id}, type='{self.type}', title='{self.title}', is_read={self.is_read})>"
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, ForeignKey, Text, Index, BigInteger
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
+from app.models.search_index import prefix_index, trigram_index
 
 class Participant(Base):
     """대상자 모델 - 이름, 이메일, 상세 정보"""
@@ -10,13 +11,29 @@ class Participant(Base):
     name = Column(String(100), nullable=False, comment="이름")
     email = Column(String(100), nullable=False, comment="이메일")
     description = Column(String(500), nullable=True, comment="상세")
-    upload_file_id = Column(Integer, ForeignKey('upload_files.id'), nullable=True, comment="업로드 파일 ID")
+    upload_file_id = Column(Integer, ForeignKey('upload_files.id'), nullable=True, index=True, comment="업로드 파일 ID")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정일시")
 
     # 관계 설정
     upload_file = relationship("UploadedFile", backref="participants")
 
+    __table_args__ = (
+        # 업로드 중복 제거 기준: 대소문자/앞뒤 공백을 무시한 (이름, 이메일)
+        Index(
+            "uq_participants_name_email_normalized",
+            func.lower(func.btrim(name)),
+            func.lower(func.btrim(email)),
+            unique=True,
+        ),
+        # 관리자 대상자 검색 (이름/이메일/상세)
+        trigram_index("ix_participants_name_trgm", name),
+        trigram_index("ix_participants_email_trgm", email),
+        trigram_index("ix_participants_description_trgm", description),
+        prefix_index("ix_participants_name_lower_prefix", name),
+        prefix_index("ix_participants_email_lower_prefix", email),
+    )
+
     def __repr__(self):
         return f"<Participant(id={self.id}, name='{self.name}', email='{self.email}', description='{self.description}')>"
 
@@ -37,6 +54,11 @@ class DrawParticipant(Base):
     # 관계 설정
     draw_record = relationship("DrawRecord", back_populates="participants")
 
+    __table_args__ = (
+        # 추첨 상세 페이지 조회/내보내기의 keyset (draw_record_id, participant_number > ?)
+        Index("ix_draw_participants_record_number", "draw_record_id", "participant_number"),
+    )
+
     def __repr__(self):
         return f"<DrawParticipant(id={self.id}, name='{self.name}', email='{self.email}', is_winner={self.is_winner})>"
 
@@ -50,7 +72,8 @@ class DrawRecord(Base):
     draw_datetime = Column(DateTime(timezone=True), nullable=False, comment="추첨일시")
     total_participants = Column(Integer, nullable=False, comment="대상자 수 (전체)")
     winner_count = Column(Integer, nullable=False, comment="당첨자 수")
-    upload_file_id = Column(Integer, ForeignKey('upload_files.id'), nullable=True, comment="업로드 파일 ID")
+    upload_file_id = Column(Integer, ForeignKey('upload_files.id'), nullable=True, index=True, comment="업로드 파일 ID")
+    random_seed = Column(BigInteger, nullable=True, comment="추첨 재현용 seed")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성일시")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="수정일시")
 
@@ -58,5 +81,10 @@ class DrawRecord(Base):
     upload_file = relationship("UploadedFile", backref="draw_records")
     participants = relationship("DrawParticipant", back_populates="draw_record", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 관리자 추첨 기록 목록 keyset (created_at DESC, id DESC)
+        Index("ix_draw_records_created_at_id", created_at, id),
+    )
+
     def __repr__(self):
         return f"<DrawRecord(id={self.id}, title='{self.title}', draw_datetime='{self.draw_datetime}')>"
@@ -5,9 +5,14 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     Boolean,
+    Date,
     DateTime,
+    DDL,
     Enum,
+    Index,
     UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -51,26 +56,86 @@ class Choice(Base):
     __tablename__ = "choices"
 
     id = Column(Integer, primary_key=True, index=True)
-    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), index=True)
     content = Column(String(255), nullable=False)
     is_correct = Column(Boolean, default=False)
 
     question = relationship("Question", back_populates="choices")
 
 class UserQuizHistory(Base):
+    """
+    문제 풀이 기록 (추가만 되는 테이블) — solved_at 월 단위 range 파티션
+    파티션 생성/보관: app/services/quiz_history_partition_service.py
+    """
     __tablename__ = "user_quiz_history"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # 파티션 테이블의 PK에는 파티션 키가 포함되어야 하므로 (id, solved_at)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
     bundle_id = Column(Integer, ForeignKey("quiz_bundles.id", ondelete="SET NULL"), nullable=True)
     user_answer = Column(Text, nullable=False)
     is_correct = Column(Boolean, default=False)
-    solved_at = Column(DateTime, default=datetime.utcnow)
+    solved_at = Column(
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=text("(now() AT TIME ZONE 'utc')"),
+    )
 
     question = relationship("Question")
     bundle = relationship("QuizBundle")
 
+    __table_args__ = (
+        # 마이페이지 통계: 사용자별 문제/정답 집계를 테이블 접근 없이 (index-only scan), 회원 삭제 시 CASCADE
+        Index("ix_user_quiz_history_user_question", user_id, question_id, postgresql_include=["is_correct"]),
+        # 오답 노트 (user_id = ? AND is_correct IS false ORDER BY solved_at DESC)
+        Index("ix_user_quiz_history_wrong", user_id, solved_at, postgresql_where=is_correct.is_(False)),
+        # 관리자 문제별 통계 + 문제 삭제 시 CASCADE
+        Index("ix_user_quiz_history_question", question_id, postgresql_include=["is_correct"]),
+        # 테마형 풀이 기록 조회/초기화 (bundle_id = ? AND user_id = ?), 관리자 테마형·사용자별 통계,
+        # 테마형 삭제 시 SET NULL
+        Index(
+            "ix_user_quiz_history_bundle_user",
+            bundle_id,
+            user_id,
+            postgresql_include=["is_correct"],
+            postgresql_where=bundle_id.isnot(None),
+        ),
+        {"postgresql_partition_by": "RANGE (solved_at)"},
+    )
+
+
+# create_all로 만든 스키마(검증 스크립트 등)에서도 INSERT가 실패하지 않도록 기본 파티션 생성
+# (운영 DB는 migrations/versions/0005_partition_quiz_history.py에서 생성)
+event.listen(
+    UserQuizHistory.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS user_quiz_history_default PARTITION OF user_quiz_history DEFAULT").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+class UserQuizHistoryRollup(Base):
+    """보관(파티션 분리)된 월의 풀이 기록 집계 — 통계는 user_quiz_history와 합산해서 계산"""
+    __tablename__ = "user_quiz_history_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    month = Column(Date, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
+    bundle_id = Column(Integer, ForeignKey("quiz_bundles.id", ondelete="SET NULL"), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    correct = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_user_quiz_history_rollups_user_question", user_id, question_id),
+        Index("ix_user_quiz_history_rollups_question", question_id),
+        Index("ix_user_quiz_history_rollups_bundle_user", bundle_id, user_id),
+    )
+
 
 class QuizBundle(Base):
     __tablename__ = "quiz_bundles"
@@ -92,19 +157,21 @@ class QuizBundleQuestion(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     bundle_id = Column(Integer, ForeignKey("quiz_bundles.id", ondelete="CASCADE"))
-    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), index=True)
     order = Column(Integer, default=0)
 
     bundle = relationship("QuizBundle", back_populates="questions")
     question = relationship("Question", back_populates="bundles")
 
+    __table_args__ = (Index("ix_quiz_bundle_questions_bundle_order", bundle_id, order),)
+
 
 class UserQuizBundleProgress(Base):
     __tablename__ = "user_quiz_bundle_progress"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    bundle_id = Column(Integer, ForeignKey("quiz_bundles.id", ondelete="CASCADE"), nullable=False)
+    bundle_id = Column(Integer, ForeignKey("quiz_bundles.id", ondelete="CASCADE"), nullable=False, index=True)
     total_questions = Column(Integer, nullable=False, default=0)
     correct_answers = Column(Integer, nullable=False, default=0)
     completed = Column(Boolean, default=False)
@@ -116,7 +183,11 @@ class UserQuizBundleProgress(Base):
 
     bundle = relationship("QuizBundle")
 
-    __table_args__ = (UniqueConstraint("user_id", "bundle_id", name="uq_user_bundle_progress"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "bundle_id", name="uq_user_bundle_progress"),
+        # 마이페이지 테마형 기록 (user_id = ? ORDER BY last_played_at DESC)
+        Index("ix_user_quiz_bundle_progress_user_last_played", user_id, last_played_at),
+    )
 
 
 class Topic(Base):
@@ -135,6 +206,6 @@ class QuestionTopicLink(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
-    topic_id = Column(Integer, ForeignKey("quiz_topics.id", ondelete="CASCADE"), nullable=False)
+    topic_id = Column(Integer, ForeignKey("quiz_topics.id", ondelete="CASCADE"), nullable=False, index=True)
 
     __table_args__ = (UniqueConstraint("question_id", "topic_id", name="uq_question_topic"),)
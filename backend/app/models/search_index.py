@@ -0,0 +1,23 @@
+from sqlalchemy import DDL, Index, event, func
+from app.database.connection import Base
+
+# 관리자 검색용 인덱스 헬퍼 (검색 조건은 app/utils/search.py의 text_match와 짝을 이룸)
+# - trigram_index: 3글자 이상 부분 일치 ILIKE '%x%' / word_similarity 정렬
+# - prefix_index: 짧은 검색어의 lower(x) LIKE 'x%' (text_pattern_ops라 collation과 무관하게 사용됨)
+
+
+def trigram_index(name: str, column) -> Index:
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column.name: "gin_trgm_ops"})
+
+
+def prefix_index(name: str, column) -> Index:
+    label = f"{column.name}_lower"
+    return Index(name, func.lower(column).label(label), postgresql_ops={label: "text_pattern_ops"})
+
+
+# gin_trgm_ops는 pg_trgm 확장이 있어야 하므로 create_all 전에 생성 (마이그레이션은 migrations/versions/0002_catch_up_schema.py에서 생성)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
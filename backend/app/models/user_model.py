@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func, Index
 from app.database.connection import Base
+from app.models.search_index import prefix_index, trigram_index
 
 class User(Base):
     """사용자 모델 - 회원가입/로그인용"""
@@ -27,6 +28,16 @@ class User(Base):
     agree_collection = Column(Boolean, default=False, comment="개인정보수집 및 이용동의")
     agree_marketing = Column(Boolean, default=False, comment="마케팅정보 수집 및 이용 동의")
 
+    __table_args__ = (
+        # 관리자 회원 검색 (이메일/닉네임)
+        trigram_index("ix_users_email_trgm", email),
+        trigram_index("ix_users_nickname_trgm", nickname),
+        prefix_index("ix_users_email_lower_prefix", email),
+        prefix_index("ix_users_nickname_lower_prefix", nickname),
+        # 관리자 회원 목록 keyset (created_at DESC, id DESC)
+        Index("ix_users_created_at_id", created_at, id),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', nickname='{self.nickname}', role='{self.role}')>"
 
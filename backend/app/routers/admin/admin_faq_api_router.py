@@ -2,7 +2,7 @@ from fastapi import APIRouter, Request, Depends
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.schemas.faq_schema import FAQResponse, FAQPageResponse, FAQCategoryResponse
+from app.schemas.faq_schema import FAQResponse, FAQSummaryPageResponse, FAQCategoryResponse
 from app.services.faq_service import (
     admin_list_faq_categories_service,
     admin_create_faq_category_service,
@@ -49,16 +49,17 @@ async def admin_faq_category_delete_api(
 
 # ----- FAQ -----
 
-@router.get("/faq", response_model=FAQPageResponse)
+@router.get("/faq", response_model=FAQSummaryPageResponse)
 async def admin_faq_list_api(
     request: Request,
     page: int = 1,
     limit: int = 10,
     search: str | None = None,
     category_id: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    page_res, _ = admin_list_faqs_service(request, db, page, limit, search, category_id)
+    page_res, _ = admin_list_faqs_service(request, db, page, limit, search, category_id, cursor)
     return page_res
 
 @router.get("/faq/{faq_id}", response_model=FAQResponse)
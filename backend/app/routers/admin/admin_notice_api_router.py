@@ -33,10 +33,11 @@ async def admin_notice_list_api(
     limit: int = 10,
     search: str | None = None,
     category_id: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     page_res, _ = admin_list_notices_service(
-        request=request, db=db, page=page, limit=limit, search=search, category_id=category_id
+        request=request, db=db, page=page, limit=limit, search=search, category_id=category_id, cursor=cursor
     )
     return page_res
 
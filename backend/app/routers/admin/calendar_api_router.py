@@ -2,10 +2,14 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.auth import get_current_user_from_cookie
 from app.services.calendar_service import calendar_service
+from app.services.calendar_ics_service import calendar_ics_snapshot
+from app.utils.http_cache import conditional_response
+from app.config import settings
 from app.schemas.calendar_schema import CalendarEventListResponse, CalendarEventResponse
 
 router = APIRouter(prefix="/api/calendar", tags=["Calendar"])
@@ -14,10 +18,28 @@ router = APIRouter(prefix="/api/calendar", tags=["Calendar"])
 
 @router.get("/events", response_model=CalendarEventListResponse)
 async def list_events(start_date: str | None = None, end_date: str | None = None):
-    events = calendar_service.list_events(start_date, end_date)
+    events = await run_in_threadpool(calendar_service.list_events, start_date, end_date)
     return {"events": events, "total_count": len(events)}
 
 
+@router.get("/events.ics")
+async def calendar_ics_feed(request: Request):
+    """캘린더 앱 구독용 ICS 피드 (프로세스 캐시, ETag/Last-Modified 조건부 응답)"""
+    try:
+        feed = await run_in_threadpool(calendar_ics_snapshot.get)
+    except Exception as e:
+        print(f"[WARNING] ICS 피드 생성 중 오류: {str(e)}")
+        raise HTTPException(503, "일정 피드를 일시적으로 제공할 수 없습니다.")
+
+    return conditional_response(
+        request,
+        feed,
+        media_type="text/calendar; charset=utf-8",
+        max_age=settings.CALENDAR_ICS_CACHE_SECONDS,
+        headers={"Content-Disposition": 'inline; filename="calendar.ics"'},
+    )
+
+
 # ---------------- 관리자 ----------------
 
 @router.get("/admin/events", response_model=CalendarEventListResponse)
@@ -43,7 +65,7 @@ async def admin_list_events(
             past_start = datetime.utcnow() - timedelta(days=365)
             start_date = past_start.isoformat() + "Z"
 
-        events = calendar_service.list_events(start_date=start_date, end_date=end_date)
+        events = await run_in_threadpool(calendar_service.list_events, start_date, end_date)
         print(f"[INFO] 일정 목록 조회 성공: {len(events)}개 일정")
         return {"events": events, "total_count": len(events)}
     except HTTPException as e:
@@ -68,7 +90,7 @@ async def admin_get_event(request: Request, event_id: str, db: Session = Depends
     if user.role != "admin":
         raise HTTPException(403, "관리자 권한이 필요합니다.")
     try:
-        event = calendar_service.get_event(event_id)
+        event = await run_in_threadpool(calendar_service.get_event, event_id)
         return event
     except HTTPException:
         raise
@@ -91,7 +113,7 @@ async def admin_create_event(request: Request, db: Session = Depends(get_db)):
         "location": data.get("location", "")
     }
     try:
-        event = calendar_service.create_event(event_data)
+        event = await run_in_threadpool(calendar_service.create_event, event_data)
         return event
     except HTTPException:
         raise
@@ -114,7 +136,7 @@ async def admin_update_event(request: Request, event_id: str, db: Session = Depe
         "location": data.get("location", "")
     }
     try:
-        event = calendar_service.update_event(event_id, event_data)
+        event = await run_in_threadpool(calendar_service.update_event, event_id, event_data)
         return event
     except HTTPException:
         raise
@@ -128,7 +150,7 @@ async def admin_delete_event(request: Request, event_id: str, db: Session = Depe
     if user.role != "admin":
         raise HTTPException(403, "관리자 권한이 필요합니다.")
     try:
-        result = calendar_service.delete_event(event_id)
+        result = await run_in_threadpool(calendar_service.delete_event, event_id)
         return JSONResponse(result)
     except HTTPException:
         raise
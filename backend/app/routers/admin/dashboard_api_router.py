@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.auth import get_current_user_from_cookie
 from app.services.dashboard_service import dashboard_service
+from app.utils.http_client import shared_http_client
 
 router = APIRouter(prefix="/api/admin/dashboard", tags=["Admin:Dashboard"])
 
@@ -60,3 +61,11 @@ async def get_recent_activity(request: Request, db: Session = Depends(get_db)):
     require_admin(request, db)
     data = dashboard_service.get_recent_activity(db)
     return data
+
+
+# ✅ 3️⃣ 소셜 로그인 외부 호출 지연 시간
+@router.get("/oauth-metrics")
+async def get_oauth_metrics(request: Request, db: Session = Depends(get_db)):
+    """소셜 로그인 외부 호출(provider별) 응답 시간 통계 (현재 워커 기준)"""
+    require_admin(request, db)
+    return {"providers": shared_http_client.metrics()}
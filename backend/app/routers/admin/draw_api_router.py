@@ -1,12 +1,18 @@
 from fastapi import APIRouter, Request, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from urllib.parse import quote
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.auth import get_current_user_from_cookie
 from app.services import draw_service, participant_service
+from app.services.participant_service import SEED_BITS
 
 router = APIRouter(prefix="/api/draw", tags=["Admin:Draw"])
 
+# 추첨 대상자 페이지 최대 크기
+MAX_PARTICIPANT_PAGE_SIZE = 500
+
 
 # ✅ 1️⃣ 추첨 목록 조회
 @router.get("/list")
@@ -15,7 +21,8 @@ async def get_draw_list(
     db: Session = Depends(get_db),
     page: int = Query(1, description="페이지 번호"),
     limit: int = Query(10, description="한 페이지당 표시 개수"),
-    search: str | None = Query(None, description="검색어 (제목/내용)")
+    search: str | None = Query(None, description="검색어 (제목/내용)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (있으면 page 대신 keyset으로 이어서 조회)"),
 ):
     """추첨 기록 목록 조회 (관리자용 API)"""
     user = get_current_user_from_cookie(request, db)
@@ -23,7 +30,8 @@ async def get_draw_list(
         raise HTTPException(403, "관리자 권한이 필요합니다.")
 
     try:
-        records, total = draw_service.list_draw_records(db, search, page, limit)
+        records = draw_service.list_draw_records(db, search, page, limit, cursor)
+        total = records.total
         total_pages = (total + limit - 1) // limit
 
         result = [
@@ -36,7 +44,7 @@ async def get_draw_list(
                 "winner_count": r.winner_count,
                 "created_at": r.created_at.isoformat() if r.created_at else None,
             }
-            for r in records
+            for r in records.items
         ]
 
         return JSONResponse({
@@ -46,7 +54,8 @@ async def get_draw_list(
                 "page": page,
                 "limit": limit,
                 "total": total,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": records.next_cursor,
             }
         })
     except Exception as e:
@@ -55,16 +64,22 @@ async def get_draw_list(
 
 # ✅ 2️⃣ 추첨 상세 조회
 @router.get("/{draw_id}")
-async def get_draw_detail_api(request: Request, draw_id: int, db: Session = Depends(get_db)):
-    """추첨 상세 조회 (관리자용 API)"""
+async def get_draw_detail_api(
+    request: Request,
+    draw_id: int,
+    after: int = Query(0, ge=0, description="이 participant_number 이후부터 조회 (keyset)"),
+    limit: int = Query(20, ge=1, le=MAX_PARTICIPANT_PAGE_SIZE, description="대상자 페이지 크기"),
+    db: Session = Depends(get_db)
+):
+    """추첨 상세 조회 (관리자용 API) - 요약 + 당첨자 + 대상자 첫 페이지"""
     user = get_current_user_from_cookie(request, db)
     if user.role != "admin":
         raise HTTPException(403, "관리자 권한이 필요합니다.")
 
     try:
-        draw, participants = draw_service.get_draw_detail(db, draw_id)
-        winners = [p for p in participants if p.is_winner]
-        
+        draw, winners = draw_service.get_draw_detail(db, draw_id)
+        participants, next_cursor = draw_service.list_draw_participants(db, draw_id, after, limit)
+
         # upload_file 정보 포함
         upload_file_data = None
         if draw.upload_file:
@@ -83,19 +98,11 @@ async def get_draw_detail_api(request: Request, draw_id: int, db: Session = Depe
             "draw_datetime": draw.draw_datetime.isoformat() if draw.draw_datetime else None,
             "total_participants": draw.total_participants,
             "winner_count": draw.winner_count,
+            "random_seed": draw.random_seed,
             "created_at": draw.created_at.isoformat() if draw.created_at else None,
             "upload_file": upload_file_data,
-            "participants": [
-                {
-                    "id": p.id,
-                    "participant_number": p.participant_number,
-                    "name": p.name,
-                    "email": p.email,
-                    "description": p.description,
-                    "is_winner": p.is_winner
-                }
-                for p in participants
-            ],
+            "participants": [_participant_row(p) for p in participants],
+            "participants_next_cursor": next_cursor,
             "winners": [
                 {
                     "id": w.id,
@@ -115,11 +122,86 @@ async def get_draw_detail_api(request: Request, draw_id: int, db: Session = Depe
         raise HTTPException(500, f"상세 조회 중 오류 발생: {str(e)}")
 
 
+@router.get("/{draw_id}/participants")
+async def get_draw_participants_api(
+    request: Request,
+    draw_id: int,
+    after: int = Query(0, ge=0, description="이 participant_number 이후부터 조회 (keyset)"),
+    limit: int = Query(20, ge=1, le=MAX_PARTICIPANT_PAGE_SIZE, description="페이지 크기"),
+    db: Session = Depends(get_db)
+):
+    """추첨 대상자 페이지 조회 (관리자용 API)"""
+    user = get_current_user_from_cookie(request, db)
+    if user.role != "admin":
+        raise HTTPException(403, "관리자 권한이 필요합니다.")
+
+    participants, next_cursor = draw_service.list_draw_participants(db, draw_id, after, limit)
+    return JSONResponse({
+        "message": "추첨 대상자 조회 성공",
+        "data": [_participant_row(p) for p in participants],
+        "next_cursor": next_cursor,
+    })
+
+
+@router.get("/{draw_id}/export")
+async def export_draw_participants_api(
+    request: Request,
+    draw_id: int,
+    format: str = Query("csv", pattern="^(csv|xlsx)$", description="내보내기 형식 (csv | xlsx)"),
+    db: Session = Depends(get_db)
+):
+    """추첨 대상자 전체 내보내기 (CSV는 스트리밍, XLSX는 write-only 모드)"""
+    user = get_current_user_from_cookie(request, db)
+    if user.role != "admin":
+        raise HTTPException(403, "관리자 권한이 필요합니다.")
+
+    draw, _ = draw_service.get_draw_detail(db, draw_id)
+    filename = quote(f"{draw.title}_대상자.{format}")
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{filename}"}
+
+    if format == "xlsx":
+        # 워크북 작성은 동기 작업이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        output = await run_in_threadpool(draw_service.build_draw_participants_xlsx, db, draw_id)
+        return StreamingResponse(
+            _iter_file(output),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers=headers,
+        )
+    return StreamingResponse(
+        draw_service.stream_draw_participants_csv(db, draw_id),
+        media_type="text/csv; charset=utf-8",
+        headers=headers,
+    )
+
+
+def _participant_row(p) -> dict:
+    return {
+        "id": p.id,
+        "participant_number": p.participant_number,
+        "name": p.name,
+        "email": p.email,
+        "description": p.description,
+        "is_winner": p.is_winner
+    }
+
+
+def _iter_file(output, chunk_size: int = 64 * 1024):
+    """임시 파일을 청크 단위로 전송한 뒤 닫기"""
+    try:
+        while chunk := output.read(chunk_size):
+            yield chunk
+    finally:
+        output.close()
+
+
 # ✅ 3️⃣ 랜덤 추첨 (기존)
 @router.post("/random")
 async def select_random_winners_api(
     request: Request,
     count: int = Query(..., description="추첨 인원 수"),
+    seed: int | None = Query(
+        None, ge=0, lt=2 ** SEED_BITS, description="재현용 추첨 seed (미지정 시 새로 생성)"
+    ),
     db: Session = Depends(get_db),
 ):
     """랜덤 추첨 (API 버전)"""
@@ -128,7 +210,7 @@ async def select_random_winners_api(
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
 
     try:
-        winners = participant_service.select_random_winners(db, count)
+        winners, seed = participant_service.select_random_winners(db, count, seed)
         result = [
             {
                 "id": w.id,
@@ -139,7 +221,7 @@ async def select_random_winners_api(
             }
             for w in winners
         ]
-        return JSONResponse({"message": "랜덤 추첨 성공", "winners": result, "count": count})
+        return JSONResponse({"message": "랜덤 추첨 성공", "winners": result, "count": count, "seed": seed})
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -42,7 +42,7 @@ async def draw_result_page(
         return RedirectResponse(url="/admin-required", status_code=303)
 
     try:
-        winners = participant_service.select_random_winners(db, count)
+        winners, seed = participant_service.select_random_winners(db, count)
         winners_data = [
             {
                 "name": w.name,
@@ -52,7 +52,7 @@ async def draw_result_page(
             }
             for w in winners
         ]
-        total = len(participant_service.get_all_participants_for_selection(db))
+        total = participant_service.count_participants(db)
 
         return templates.TemplateResponse(
             "client/subscribers/winners.html",
@@ -61,6 +61,7 @@ async def draw_result_page(
                 "winners": winners_data,
                 "count": count,
                 "total_participants": total,
+                "seed": seed,
                 "title": "당첨자 발표",
             },
         )
@@ -75,7 +76,8 @@ async def draw_list_page(request: Request, page: int = 1, search: str | None = N
         return RedirectResponse(url="/admin-required", status_code=303)
 
     limit = 10
-    records, total = draw_service.list_draw_records(db, search, page, limit)
+    records_page = draw_service.list_draw_records(db, search, page, limit)
+    records, total = records_page.items, records_page.total
     total_pages = (total + limit - 1) // limit
 
     return templates.TemplateResponse(
@@ -94,14 +96,14 @@ async def draw_list_page(request: Request, page: int = 1, search: str | None = N
 
 
 @router.get("/admin/draw/{draw_id}", response_class=HTMLResponse)
-async def draw_detail_page(request: Request, draw_id: int, db: Session = Depends(get_db)):
+async def draw_detail_page(request: Request, draw_id: int, after: int = 0, db: Session = Depends(get_db)):
     """관리자 - 추첨 상세 페이지"""
     current = get_current_user_from_cookie(request, db)
     if current.role != "admin":
         return RedirectResponse(url="/admin-required", status_code=303)
 
-    draw, participants = draw_service.get_draw_detail(db, draw_id)
-    winners = [p for p in participants if p.is_winner]
+    draw, winners = draw_service.get_draw_detail(db, draw_id)
+    participants, next_cursor = draw_service.list_draw_participants(db, draw_id, after, 100)
 
     return templates.TemplateResponse(
         "backoffice/draw/draw_detail.html",
@@ -110,6 +112,7 @@ async def draw_detail_page(request: Request, draw_id: int, db: Session = Depends
             "user": current,
             "draw": draw,
             "participants": participants,
+            "next_cursor": next_cursor,
             "winners": winners,
             "title": f"추첨 상세 - {draw.title}",
         },
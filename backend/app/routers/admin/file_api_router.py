@@ -51,6 +51,21 @@ async def get_file_view_link(file_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="파일 경로를 찾을 수 없습니다.")
 
 
+# ✅ 이미지 콘텐츠 (Drive 업로드 완료 시 Drive로, 대기 중이면 로컬 파일 제공)
+@router.get("/{file_id}/content")
+async def get_file_content(file_id: int, db: Session = Depends(get_db)):
+    """공지 이미지 등 공개 이미지 제공 (이미지 외 파일은 제공하지 않음)"""
+    file = file_service.get_file(db, file_id)
+    if not file.mime_type or not file.mime_type.startswith("image/"):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    if file.drive_file_id:
+        return RedirectResponse(url=f"https://lh3.googleusercontent.com/d/{file.drive_file_id}")
+    if file.file_path:
+        return FileResponse(path=file.file_path, media_type=file.mime_type)
+    raise HTTPException(status_code=404, detail="파일 경로를 찾을 수 없습니다.")
+
+
 # ✅ 파일 다운로드 (Drive or Local)
 @router.get("/{file_id}/download")
 async def download_file(file_id: int, db: Session = Depends(get_db)):
@@ -90,4 +105,5 @@ async def upload_file(request: Request, file: UploadFile = File(...), db: Sessio
         "filename": uploaded_file.original_filename,
         "drive_link": uploaded_file.drive_web_view_link,
         "upload_type": uploaded_file.upload_type,
+        "drive_status": uploaded_file.drive_status,
     }
@@ -9,6 +9,7 @@ from app.services.social_auth_service import (
     handle_google_callback,
     DEFAULT_SCOPES,
 )
+from app.services.google_credentials_service import google_credentials
 from app.config import settings
 
 router = APIRouter(prefix="/api/admin/google", tags=["Admin:GoogleOAuth"])
@@ -93,6 +94,8 @@ def google_token_callback(
         token_file=settings.GOOGLE_TOKEN_FILE,
         scopes=DEFAULT_SCOPES,
     )
+    # 새 토큰으로 Drive/Calendar 클라이언트를 다시 만들도록 공유 자격 증명 초기화
+    google_credentials.reload()
 
     return HTMLResponse(
         content=f"""
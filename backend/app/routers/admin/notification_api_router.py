@@ -1,14 +1,21 @@
+import asyncio
+import json
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.auth import get_current_user_from_cookie
 from app.services.notification_service import notification_service
+from app.services.notification_stream_service import notification_broadcaster, notification_to_event
 from app.schemas.notification_schema import (
     NotificationListResponse, NotificationResponse, RecentActivityItem
 )
 
 router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
 
+# SSE 연결 유지용 주석 전송 주기 (프록시 idle timeout 방지)
+SSE_HEARTBEAT_SECONDS = 15
+
 # 공통 관리자 인증 함수
 def require_admin(request: Request, db: Session):
     user = get_current_user_from_cookie(request, db)
@@ -17,10 +24,17 @@ def require_admin(request: Request, db: Session):
     return user
 
 @router.get("", response_model=NotificationListResponse)
-async def list_notifications(request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def list_notifications(
+    request: Request, skip: int = 0, limit: int = 100, cursor: str | None = None, db: Session = Depends(get_db)
+):
+    require_admin(request, db)
+    result = notification_service.list_notifications(db, skip, limit, cursor)
+    return {"notifications": result.items, "total_count": result.total, "next_cursor": result.next_cursor}
+
+@router.get("/unread-count")
+async def unread_count(request: Request, db: Session = Depends(get_db)):
     require_admin(request, db)
-    notifications, total = notification_service.list_notifications(db, skip, limit)
-    return {"notifications": notifications, "total_count": total}
+    return {"unread_count": notification_service.get_unread_count(db)}
 
 @router.put("/{notification_id}/read")
 async def mark_as_read(request: Request, notification_id: int, db: Session = Depends(get_db)):
@@ -47,3 +61,45 @@ async def delete_notification(request: Request, notification_id: int, db: Sessio
 async def recent_activity(request: Request, skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
     require_admin(request, db)
     return notification_service.get_recent_activity(db, skip, limit)
+
+# 새 알림 실시간 스트림 (Server-Sent Events)
+@router.get("/stream")
+async def stream_notifications(request: Request, db: Session = Depends(get_db)):
+    require_admin(request, db)
+
+    # 재접속 시 브라우저가 보내는 Last-Event-ID 이후 알림부터 먼저 전송
+    missed = []
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        missed = [notification_to_event(n) for n in notification_service.list_notifications_after(db, int(last_event_id))]
+    db.close()  # 스트림이 열려 있는 동안 DB 연결을 점유하지 않음
+
+    queue = notification_broadcaster.subscribe()
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            for payload in missed:
+                yield _format_sse(payload)
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _format_sse(payload)
+        finally:
+            notification_broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _format_sse(payload: dict) -> str:
+    data = json.dumps(payload, ensure_ascii=False)
+    return f"id: {payload['id']}\nevent: notification\ndata: {data}\n\n"
@@ -17,20 +17,22 @@ async def list_participants(
     name: str | None = None,
     description: str | None = None,
     email: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db)
 ):
-    """참가자 목록 조회 (검색 지원)"""
+    """참가자 목록 조회 (검색 지원, cursor가 있으면 keyset으로 이어서 조회)"""
     current = get_current_user_from_cookie(request, db)
     if current.role != "admin":
         raise HTTPException(403, "관리자 권한이 필요합니다.")
     
     # 검색 조건이 있으면 검색, 없으면 전체 조회
     if name or description or email:
-        participants, total = participant_service.search_participants(
-            db, name=name, description=description, email=email, limit=limit, offset=(page - 1) * limit
+        result = participant_service.search_participants(
+            db, name=name, description=description, email=email, limit=limit, offset=(page - 1) * limit,
+            cursor=cursor,
         )
     else:
-        participants, total = participant_service.get_all_participants(db, limit, (page - 1) * limit)
+        result = participant_service.get_all_participants(db, limit, (page - 1) * limit, cursor)
     
     # __dict__를 사용하면 SQLAlchemy의 내부 속성도 포함되므로 필요한 필드만 추출
     participants_data = [
@@ -42,13 +44,15 @@ async def list_participants(
             "created_at": p.created_at.isoformat() if p.created_at else None,
             "updated_at": p.updated_at.isoformat() if p.updated_at else None,
         }
-        for p in participants
+        for p in result.items
     ]
     
     return JSONResponse({
         "page": page,
         "limit": limit,
-        "total": total,
+        "total": result.total,
+        "total_exact": result.total_exact,
+        "next_cursor": result.next_cursor,
         "participants": participants_data
     })
 
@@ -69,13 +73,14 @@ async def upload_excel(
     request: Request,
     file: UploadFile,
     replace_all: bool = Form(False),
+    duplicate_mode: str = Form("skip"),
     db: Session = Depends(get_db)
 ):
-    """엑셀 업로드 (Drive 연동)"""
+    """엑셀/CSV/TSV 업로드 (Drive 연동, duplicate_mode: skip | merge)"""
     current = get_current_user_from_cookie(request, db)
     if current.role != "admin":
         raise HTTPException(403, "관리자 권한이 필요합니다.")
-    message = participant_service.upload_excel_file(db, file, replace_all)
+    message = participant_service.upload_excel_file(db, file, replace_all, duplicate_mode=duplicate_mode)
     return JSONResponse({"message": message})
 
 
@@ -16,7 +16,8 @@ async def candidates_page(request: Request, page: int = 1, db: Session = Depends
     current = get_current_user_from_cookie(request, db)
     if current.role != "admin":
         return RedirectResponse(url="/admin-required", status_code=303)
-    participants, total = participant_service.get_all_participants(db, 10, (page - 1) * 10)
+    result = participant_service.get_all_participants(db, 10, (page - 1) * 10)
+    participants, total = result.items, result.total
     return templates.TemplateResponse(
         "client/subscribers/candidates.html",
         {"request": request, "participants": participants, "total_count": total, "title": "대상자 관리"},
@@ -26,10 +26,11 @@ async def list_users(
     role: str | None = None,
     is_active: str | None = None,
     status: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db)
 ):
     require_admin(request, db)
-    page_obj = user_service.list_users_admin(db, page, limit, q, role, is_active, status)
+    page_obj = user_service.list_users_admin(db, page, limit, q, role, is_active, status, cursor)
     return page_obj
 
 @router.get("/count")
@@ -42,8 +43,8 @@ async def count_users(
     db: Session = Depends(get_db)
 ):
     require_admin(request, db)
-    total = user_service.count_users_admin(db, q, role, is_active, status)
-    return {"total_count": total}
+    result = user_service.count_users_admin(db, q, role, is_active, status)
+    return {"total_count": result.total, "total_exact": result.exact}
 
 # ===== 생성/상세/수정/삭제 =====
 
@@ -41,7 +41,7 @@ async def auth_google_callback(
         return RedirectResponse(url=redirect_url, status_code=302)
 
     try:
-        userinfo = exchange_google_code_for_userinfo(code)
+        userinfo = await exchange_google_code_for_userinfo(code)
     except Exception:
         redirect_url = f"{settings.FRONTEND_URL.rstrip('/')}/login?error=google_auth_failed"
         return RedirectResponse(url=redirect_url, status_code=302)
@@ -99,7 +99,7 @@ async def auth_naver_callback(
         return RedirectResponse(url=redirect_url, status_code=302)
 
     try:
-        userinfo = exchange_naver_code_for_userinfo(code)
+        userinfo = await exchange_naver_code_for_userinfo(code)
     except Exception:
         redirect_url = f"{settings.FRONTEND_URL.rstrip('/')}/login?error=naver_auth_failed"
         return RedirectResponse(url=redirect_url, status_code=302)
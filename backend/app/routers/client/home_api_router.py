@@ -1,23 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.services import participant_service
+from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
+from app.services.participant_service import participant_stats_snapshot
 
 router = APIRouter(prefix="/api/home", tags=["Client:Home:API"])
 
 @router.get("/stats")
-async def get_home_stats(db: Session = Depends(get_db)):
-    """홈페이지 기본 통계 조회 (JSON 응답)"""
+async def get_home_stats():
+    """홈페이지 기본 통계 조회 (JSON 응답, 집계 스냅샷 캐시 사용)"""
     try:
-        all_participants = participant_service.get_all_participants_for_selection(db)
-        total_participants = len(all_participants)
-        participants_with_email = len([p for p in all_participants if p.email])
-        participants_with_description = len([p for p in all_participants if p.description])
-
-        return {
-            "total_participants": total_participants,
-            "participants_with_email": participants_with_email,
-            "participants_with_description": participants_with_description,
-        }
+        # 캐시가 비었으면 집계 쿼리를 동기로 실행하므로 이벤트 루프를 막지 않도록 스레드풀에서 조회
+        return await run_in_threadpool(participant_stats_snapshot.get)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"홈 통계 조회 중 오류가 발생했습니다: {str(e)}")
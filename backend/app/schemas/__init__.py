@@ -2,8 +2,23 @@
 from .user_schema import UserCreate, UserLogin, UserResponse, UserUpdate, PasswordChange
 from .participant_schema import ParticipantCreate, ParticipantResponse, ParticipantUpdate
 from .terms_schema import TermsCreate, TermsUpdate, TermsResponse, TermsListResponse
-from .faq_schema import FAQCreate, FAQUpdate, FAQResponse, FAQPageResponse, FAQCategoryResponse
-from .notice_schema import NoticeCreate, NoticeUpdate, NoticeResponse, NoticePageResponse, NoticeCategoryResponse
+from .faq_schema import (
+    FAQCreate,
+    FAQUpdate,
+    FAQResponse,
+    FAQSummaryResponse,
+    FAQPageResponse,
+    FAQSummaryPageResponse,
+    FAQCategoryResponse,
+)
+from .notice_schema import (
+    NoticeCreate,
+    NoticeUpdate,
+    NoticeResponse,
+    NoticeListItemResponse,
+    NoticePageResponse,
+    NoticeCategoryResponse,
+)
 from .common import PageResponse
 from .draw_schema import DrawRecordCreate, DrawRecordUpdate, DrawParticipantResponse
 from .notification_schema import (
@@ -36,10 +51,13 @@ __all__ = [
     "FAQUpdate",
     "FAQResponse",
     "FAQPageResponse",
+    "FAQSummaryResponse",
+    "FAQSummaryPageResponse",
     "FAQCategoryResponse",
     "NoticeCreate",
     "NoticeUpdate",
     "NoticeResponse",
+    "NoticeListItemResponse",
     "NoticePageResponse",
     "NoticeCategoryResponse",
     "PageResponse",
@@ -7,6 +7,8 @@ T = TypeVar("T")
 class PageResponse(BaseModel, Generic[T]):
     items: List[T]
     total: int
+    # False면 total이 플래너 추정치 (대형 테이블의 필터 없는 목록)
+    total_exact: bool = True
     page: int
     limit: int
     total_pages: int
@@ -14,12 +16,22 @@ class PageResponse(BaseModel, Generic[T]):
     has_previous: bool
     next_page: Optional[int] = None
     previous_page: Optional[int] = None
+    # keyset 페이지네이션용 불투명 커서 (다음 요청에 ?cursor= 로 전달, app/utils/pagination.py)
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
 
     @classmethod
-    def create(cls, items: List[T], total: int, page: int, limit: int):
+    def create(
+        cls,
+        items: List[T],
+        total: int,
+        page: int,
+        limit: int,
+        next_cursor: Optional[str] = None,
+        total_exact: bool = True,
+    ):
         total_pages = (total + limit - 1) // limit  # 페이지 수 올림 계산
         has_next = page < total_pages
         has_previous = page > 1
@@ -35,5 +47,7 @@ class PageResponse(BaseModel, Generic[T]):
             has_next=has_next,
             has_previous=has_previous,
             next_page=next_page,
-            previous_page=previous_page
+            previous_page=previous_page,
+            next_cursor=next_cursor,
+            total_exact=total_exact,
         )
@@ -16,6 +16,7 @@ class DrawRecordBase(BaseModel):
     total_participants: Optional[int] = Field(None, description="전체 대상자 수")
     winner_count: Optional[int] = Field(None, description="당첨자 수")
     upload_file_id: Optional[int] = Field(None, description="업로드 파일 ID")
+    random_seed: Optional[int] = Field(None, description="추첨 재현용 seed")
 
 
 # -------------------------------
@@ -63,5 +63,23 @@ class FAQResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class FAQSummaryResponse(BaseModel):
+    """목록용 FAQ (답변 본문 제외)"""
+    id: int
+    question: str
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    order: int
+    is_active: bool
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class FAQPageResponse(PageResponse[FAQResponse]):
     pass
+
+class FAQSummaryPageResponse(PageResponse[FAQSummaryResponse]):
+    pass
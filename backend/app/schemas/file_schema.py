@@ -34,6 +34,7 @@ class UploadedFileResponse(UploadedFileBase):
     drive_file_id: Optional[str] = Field(None, description="Google Drive 파일 ID")
     drive_web_view_link: Optional[str] = Field(None, description="Google Drive 보기 링크")
     drive_download_link: Optional[str] = Field(None, description="Google Drive 다운로드 링크")
+    drive_status: Optional[str] = Field(None, description="Google Drive 업로드 상태 (pending/uploading/uploaded/failed)")
 
     class Config:
         from_attributes = True
@@ -63,6 +64,7 @@ class FileUploadResponse(BaseModel):
     filename: Optional[str] = Field(None, description="파일명")
     drive_link: Optional[str] = Field(None, description="Google Drive 보기 링크")
     upload_type: Optional[str] = Field(None, description="업로드 타입 (drive/local)")
+    drive_status: Optional[str] = Field(None, description="Google Drive 업로드 상태 (pending/uploading/uploaded/failed)")
 
     class Config:
         from_attributes = True
@@ -62,6 +62,27 @@ class NoticeResponse(NoticeBase):
     class Config:
         from_attributes = True
 
-class NoticePageResponse(PageResponse[NoticeResponse]):
+class NoticeListItemResponse(BaseModel):
+    """목록용 공지 (본문 HTML 대신 평문 요약만 포함)"""
+    id: int
+    title: str
+    excerpt: str = ""
+    content_length: int = 0
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    publish_status: str
+    published_at: Optional[datetime] = None
+    author_id: int
+    author_nickname: Optional[str] = None
+    views: int = 0
+    is_deleted: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class NoticePageResponse(PageResponse[NoticeListItemResponse]):
     pass
 
@@ -32,6 +32,7 @@ class NotificationResponse(NotificationBase):
 class NotificationListResponse(BaseModel):
     notifications: List[NotificationResponse]
     total_count: int
+    next_cursor: Optional[str] = None
 
 class NotificationPageResponse(PageResponse[NotificationResponse]):
     """알림 페이징 응답"""
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.calendar_sync_service import calendar_event_store
+from app.services.google_calendar_service import google_calendar_service, parse_event_time
+from app.utils.cache import CachedSnapshot
+from app.utils.http_cache import RenderedDocument
+
+ICS_PRODID = "-//kmshistory//Academy Calendar//KO"
+ICS_CALENDAR_NAME = "강민성 한국사 일정"
+# RFC 5545: 한 줄은 75옥텟을 넘지 않도록 접음
+ICS_LINE_LIMIT = 75
+
+
+def _escape(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """UTF-8 기준 75옥텟 단위로 줄 접기 (멀티바이트 문자는 쪼개지 않음)"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= ICS_LINE_LIMIT:
+        return line
+    parts, current, size = [], [], 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        # 이어지는 줄은 앞에 공백 한 칸이 붙으므로 한 옥텟 적게 채움
+        limit = ICS_LINE_LIMIT if not parts else ICS_LINE_LIMIT - 1
+        if size + char_size > limit:
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(char)
+        size += char_size
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+def _format_utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _time_property(name: str, value: str) -> str:
+    # 종일 일정은 날짜만 (DTEND는 Google과 동일하게 다음 날, 비포함)
+    if "T" not in value:
+        return f"{name};VALUE=DATE:{value.replace('-', '')}"
+    return f"{name}:{_format_utc(parse_event_time(value))}"
+
+
+def render_ics(events: List[Dict[str, Any]], generated_at: datetime) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(ICS_CALENDAR_NAME)}",
+        "X-WR-TIMEZONE:Asia/Seoul",
+    ]
+    for event in events:
+        if not event.get("start") or not event.get("end"):
+            continue
+        stamp = parse_event_time(event.get("updated")) or generated_at
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{event['id']}@google.com",
+            f"DTSTAMP:{_format_utc(stamp)}",
+            _time_property("DTSTART", event["start"]),
+            _time_property("DTEND", event["end"]),
+            f"SUMMARY:{_escape(event.get('summary'))}",
+        ]
+        if event.get("description"):
+            lines.append(f"DESCRIPTION:{_escape(event['description'])}")
+        if event.get("location"):
+            lines.append(f"LOCATION:{_escape(event['location'])}")
+        if event.get("htmlLink"):
+            lines.append(f"URL:{event['htmlLink']}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
+
+
+class CalendarIcsFeedBuilder:
+    """로컬 일정 저장소에서 ICS 피드를 만들고, 내용이 그대로면 Last-Modified를 유지"""
+
+    def __init__(self):
+        self._previous: Optional[RenderedDocument] = None
+
+    def build(self) -> RenderedDocument:
+        now = datetime.now(timezone.utc)
+        time_min = now - timedelta(days=settings.CALENDAR_ICS_PAST_DAYS)
+        events = calendar_event_store.list_events(time_min=time_min, max_results=settings.CALENDAR_ICS_MAX_EVENTS)
+        if events is None:
+            # 첫 동기화 전
+            events = google_calendar_service.list_events(time_min=time_min, max_results=settings.CALENDAR_ICS_MAX_EVENTS)
+
+        self._previous = RenderedDocument.build(render_ics(events, now).encode("utf-8"), self._previous)
+        return self._previous
+
+
+calendar_ics_feed_builder = CalendarIcsFeedBuilder()
+
+# 주기적으로(stale-while-revalidate) 다시 만들고, 일정이 바뀌면 즉시 무효화
+calendar_ics_snapshot = CachedSnapshot(
+    calendar_ics_feed_builder.build,
+    ttl_seconds=settings.CALENDAR_ICS_CACHE_SECONDS,
+    name="Calendar ICS",
+)
+calendar_event_store.add_listener(calendar_ics_snapshot.invalidate)
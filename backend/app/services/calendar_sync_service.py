@@ -0,0 +1,161 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.google_calendar_service import (
+    CalendarSyncTokenExpired,
+    as_utc,
+    google_calendar_service,
+    parse_event_time,
+)
+
+# (시작, 종료, 일정) — 조회 시 매번 문자열을 파싱하지 않도록 함께 보관
+_Entry = Tuple[datetime, datetime, Dict[str, Any]]
+
+
+class CalendarEventStore:
+    """
+    Google Calendar 일정의 프로세스 내 사본 (최근 CALENDAR_SYNC_PAST_DAYS일 이후)
+
+    - 백그라운드 스레드가 syncToken으로 변경분만 주기적으로 받아 반영
+    - CALENDAR_FULL_RESYNC_HOURS마다 (또는 syncToken 만료 시) 전체 재동기화로 보관 범위를 앞으로 당김
+    - 일정 생성/수정/삭제는 Google에 먼저 반영한 뒤 upsert/remove로 사본도 즉시 갱신
+    - 첫 동기화 전이거나 보관 범위 밖의 조회는 None을 반환해 호출자가 Google에 직접 조회
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._lock = threading.Lock()
+        self._events: Dict[str, _Entry] = {}
+        self._sync_token: Optional[str] = None
+        self._window_start: Optional[datetime] = None
+        self._last_full_sync = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._window_start is not None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="calendar-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # -------------------------------
+    # 조회
+    # -------------------------------
+    def list_events(
+        self,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 100,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Google events().list와 같은 기준(종료 > time_min, 시작 < time_max)으로 조회, 범위 밖이면 None"""
+        floor = as_utc(time_min or datetime.utcnow())
+        ceiling = as_utc(time_max) if time_max else None
+        with self._lock:
+            if self._window_start is None or floor < self._window_start:
+                return None
+            entries = [
+                entry for entry in self._events.values()
+                if entry[1] > floor and (ceiling is None or entry[0] < ceiling)
+            ]
+        entries.sort(key=lambda entry: entry[0])
+        return [entry[2] for entry in entries[:max_results]]
+
+    def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._events.get(event_id)
+        return entry[2] if entry else None
+
+    # -------------------------------
+    # 쓰기 반영
+    # -------------------------------
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """사본이 바뀔 때마다 호출할 콜백 등록 (파생 캐시 무효화용)"""
+        self._listeners.append(callback)
+
+    def upsert(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._apply(event)
+        self._notify()
+
+    def remove(self, event_id: str) -> None:
+        with self._lock:
+            self._events.pop(event_id, None)
+        self._notify()
+
+    def _notify(self) -> None:
+        for callback in self._listeners:
+            callback()
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        start = parse_event_time(event.get("start"))
+        end = parse_event_time(event.get("end"))
+        if event.get("status") == "cancelled" or not start or not end:
+            self._events.pop(event.get("id"), None)
+        else:
+            self._events[event["id"]] = (start, end, event)
+
+    # -------------------------------
+    # 동기화
+    # -------------------------------
+    def sync(self) -> None:
+        """전체 재동기화 주기가 지났거나 syncToken이 없으면 전체, 아니면 변경분만 동기화"""
+        full_resync_due = time.monotonic() - self._last_full_sync >= settings.CALENDAR_FULL_RESYNC_HOURS * 3600
+        if self._sync_token is None or full_resync_due:
+            self._full_sync()
+            return
+        try:
+            self._incremental_sync()
+        except CalendarSyncTokenExpired:
+            print("[Calendar Sync] syncToken 만료, 전체 재동기화")
+            self._full_sync()
+
+    def _full_sync(self) -> None:
+        window_start = datetime.now(timezone.utc) - timedelta(days=settings.CALENDAR_SYNC_PAST_DAYS)
+        events, sync_token = self._backend.fetch_changes(time_min=window_start)
+        with self._lock:
+            self._events = {}
+            for event in events:
+                self._apply(event)
+            self._sync_token = sync_token
+            self._window_start = window_start
+        self._last_full_sync = time.monotonic()
+        self._notify()
+        print(f"[Calendar Sync] 전체 동기화 완료: {len(self._events)}개 일정")
+
+    def _incremental_sync(self) -> None:
+        events, sync_token = self._backend.fetch_changes(sync_token=self._sync_token)
+        with self._lock:
+            for event in events:
+                self._apply(event)
+            self._sync_token = sync_token or self._sync_token
+        if events:
+            self._notify()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"[Calendar Sync] 동기화 실패 (다음 주기에 재시도): {e}")
+            self._wake.wait(settings.CALENDAR_SYNC_INTERVAL_SECONDS)
+            self._wake.clear()
+
+
+calendar_event_store = CalendarEventStore(google_calendar_service)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 
@@ -7,44 +7,45 @@ from app.models import User, Participant, DrawRecord, Notification
 from app.models.quiz import Question, QuizBundle
 from app.services.calendar_service import calendar_service   # ✅ 추가
 from app.services.notification_service import notification_service  # ✅ 추가
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.utils.cache import CachedSnapshot, invalidate_on_commit
 
 
 class DashboardService:
     """관리자 대시보드 서비스"""
 
     def get_summary_stats(self, db: Session):
-        """관리자 통계 요약 데이터"""
+        """관리자 통계 요약 데이터 (캐시된 스냅샷, 관련 테이블 변경 커밋 시 무효화)"""
         try:
-            # 전체 회원 수 (삭제되지 않은 사용자)
-            total_users = db.query(User).filter(User.deleted_at.is_(None)).count()
-
-            # 전체 대상자 수
-            total_participants = db.query(Participant).count()
-            participants_with_email = db.query(Participant).filter(Participant.email.isnot(None)).count()
-            participants_with_description = db.query(Participant).filter(Participant.description.isnot(None)).count()
-
-            # 전체 추첨 수
-            total_draws = db.query(DrawRecord).count()
-
-            # 읽지 않은 알림 수
-            unread_notifications = db.query(Notification).filter(Notification.is_read == False).count()
-
-            total_questions = db.query(Question).count()
-            total_bundles = db.query(QuizBundle).count()
-
-            return {
-                "total_users": total_users,
-                "total_participants": total_participants,
-                "participants_with_email": participants_with_email,
-                "participants_with_description": participants_with_description,
-                "total_draws": total_draws,
-                "unread_notifications": unread_notifications,
-                "total_questions": total_questions,
-                "total_bundles": total_bundles,
-            }
+            stats = dict(dashboard_summary_snapshot.get())
+            # 읽지 않은 알림 수는 알림 서비스의 카운터 사용 (알림 생성/읽음마다 스냅샷을 버리지 않도록)
+            stats["unread_notifications"] = notification_service.get_unread_count(db)
+            return stats
         except Exception as e:
             raise HTTPException(500, f"요약 통계 조회 중 오류: {str(e)}")
 
+    def query_summary_stats(self, db: Session) -> dict:
+        """관리자 통계 요약을 스칼라 서브쿼리 하나의 SELECT로 조회 (읽지 않은 알림 수 제외)"""
+        def count_of(column, *conditions):
+            return select(func.count(column)).where(*conditions).scalar_subquery()
+
+        row = db.execute(
+            select(
+                # 전체 회원 수 (삭제되지 않은 사용자)
+                count_of(User.id, User.deleted_at.is_(None)).label("total_users"),
+                # 전체 대상자 수
+                count_of(Participant.id).label("total_participants"),
+                count_of(Participant.id, Participant.email.isnot(None)).label("participants_with_email"),
+                count_of(Participant.id, Participant.description.isnot(None)).label("participants_with_description"),
+                # 전체 추첨 수
+                count_of(DrawRecord.id).label("total_draws"),
+                count_of(Question.id).label("total_questions"),
+                count_of(QuizBundle.id).label("total_bundles"),
+            )
+        ).one()
+        return dict(row._mapping)
+
     def get_recent_activity(self, db: Session, limit: int = 10):
         """최근 활동 내역"""
         try:
@@ -90,7 +91,7 @@ class DashboardService:
     def get_recent_notifications(self, db: Session, limit: int = 5):
         """최근 알림 목록"""
         try:
-            notifications, _ = notification_service.list_notifications(db, limit=limit)
+            notifications = notification_service.list_notifications(db, limit=limit).items
             return [
                 {
                     "title": n.title,
@@ -107,3 +108,25 @@ class DashboardService:
 
 
 dashboard_service = DashboardService()
+
+
+def _load_summary_stats() -> dict:
+    db = SessionLocal()
+    try:
+        return dashboard_service.query_summary_stats(db)
+    finally:
+        db.close()
+
+
+# 관리자 대시보드 요약 스냅샷 (집계 대상 테이블이 바뀐 트랜잭션이 커밋되면 무효화)
+dashboard_summary_snapshot = CachedSnapshot(
+    _load_summary_stats, settings.DASHBOARD_SUMMARY_CACHE_SECONDS, name="Dashboard Summary"
+)
+invalidate_on_commit(
+    dashboard_summary_snapshot,
+    User.__tablename__,
+    Participant.__tablename__,
+    DrawRecord.__tablename__,
+    Question.__tablename__,
+    QuizBundle.__tablename__,
+)
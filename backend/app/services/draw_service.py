@@ -1,12 +1,34 @@
 # app/services/draw_service.py
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from sqlalchemy import or_
+from sqlalchemy import or_, and_, select, insert, func, literal, values, column, String, false
 from datetime import datetime
+import io
+import csv
+import codecs
+import tempfile
+import openpyxl
 from app.models import DrawRecord, DrawParticipant, Participant, Notification
+from app.utils.pagination import SortKey, paginate
+from app.services.participant_service import SEED_BITS
 
-def list_draw_records(db: Session, search: str | None, page: int, limit: int):
-    """관리자 - 추첨 기록 목록 조회"""
+# 추첨 상세/내보내기에서 조회하는 대상자 컬럼 (ORM 엔티티 대신 튜플로 조회)
+DRAW_PARTICIPANT_COLUMNS = (
+    DrawParticipant.id,
+    DrawParticipant.participant_number,
+    DrawParticipant.name,
+    DrawParticipant.email,
+    DrawParticipant.description,
+    DrawParticipant.is_winner,
+)
+# 내보내기 시 한 번에 조회/전송하는 행 수
+EXPORT_BATCH_SIZE = 2000
+EXPORT_HEADER = ["번호", "이름", "이메일", "상세", "당첨여부"]
+# 추첨 목록 정렬 (최신순, keyset 커서 기준)
+DRAW_RECORD_SORT = (SortKey(DrawRecord.created_at), SortKey(DrawRecord.id))
+
+def list_draw_records(db: Session, search: str | None, page: int, limit: int, cursor: str | None = None):
+    """관리자 - 추첨 기록 목록 조회 (Page: items, total, next_cursor)"""
     query = db.query(DrawRecord)
     if search:
         query = query.filter(
@@ -15,20 +37,80 @@ def list_draw_records(db: Session, search: str | None, page: int, limit: int):
                 DrawRecord.content.contains(search)
             )
         )
-    total = query.count()
-    records = query.order_by(DrawRecord.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
-    return records, total
+    return paginate(query, DRAW_RECORD_SORT, limit, (page - 1) * limit, cursor)
 
 
 def get_draw_detail(db: Session, draw_id: int):
-    """관리자 - 추첨 상세"""
+    """관리자 - 추첨 상세 (요약 + 당첨자, 전체 대상자는 list_draw_participants로 페이지 조회)"""
     draw = db.query(DrawRecord).filter(DrawRecord.id == draw_id).first()
     if not draw:
         raise HTTPException(404, "추첨 기록을 찾을 수 없습니다.")
-    participants = db.query(DrawParticipant).filter(
-        DrawParticipant.draw_record_id == draw_id
+    winners = db.query(*DRAW_PARTICIPANT_COLUMNS).filter(
+        DrawParticipant.draw_record_id == draw_id,
+        DrawParticipant.is_winner.is_(True)
     ).order_by(DrawParticipant.participant_number).all()
-    return draw, participants
+    return draw, winners
+
+
+def list_draw_participants(db: Session, draw_id: int, after: int = 0, limit: int = 100):
+    """관리자 - 추첨 대상자 페이지 조회 (participant_number 기준 keyset)"""
+    rows = db.query(*DRAW_PARTICIPANT_COLUMNS).filter(
+        DrawParticipant.draw_record_id == draw_id,
+        DrawParticipant.participant_number > after
+    ).order_by(DrawParticipant.participant_number).limit(limit + 1).all()
+    next_cursor = rows[limit - 1].participant_number if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def iter_draw_participants(db: Session, draw_id: int, batch_size: int = EXPORT_BATCH_SIZE):
+    """추첨 대상자 전체를 keyset 배치로 순회 (내보내기용)"""
+    after = 0
+    while True:
+        rows, next_cursor = list_draw_participants(db, draw_id, after, batch_size)
+        yield from rows
+        if next_cursor is None:
+            return
+        after = next_cursor
+
+
+def stream_draw_participants_csv(db: Session, draw_id: int):
+    """추첨 대상자 CSV를 배치 단위 bytes로 생성 (엑셀 호환을 위해 UTF-8 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_HEADER)
+    yield codecs.BOM_UTF8 + _drain(buffer)
+
+    for i, row in enumerate(iter_draw_participants(db, draw_id), start=1):
+        writer.writerow(_export_row(row))
+        if i % EXPORT_BATCH_SIZE == 0:
+            yield _drain(buffer)
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+def build_draw_participants_xlsx(db: Session, draw_id: int):
+    """추첨 대상자 XLSX를 write-only 모드로 임시 파일에 작성하고 파일 객체 반환"""
+    wb = openpyxl.Workbook(write_only=True)
+    sheet = wb.create_sheet("대상자")
+    sheet.append(EXPORT_HEADER)
+    for row in iter_draw_participants(db, draw_id):
+        sheet.append(_export_row(row))
+
+    output = tempfile.TemporaryFile()
+    wb.save(output)
+    output.seek(0)
+    return output
+
+
+def _export_row(row) -> list:
+    return [row.participant_number, row.name, row.email, row.description or "", "당첨" if row.is_winner else ""]
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
 
 
 def delete_draw(db: Session, draw_id: int):
@@ -50,11 +132,15 @@ def save_draw_result(db: Session, data: dict, current_user):
     winner_count = data.get("winner_count")
     winners = data.get("winners", [])
     upload_file_id = data.get("upload_file_id")
+    seed = data.get("seed")
 
     if not title:
         raise HTTPException(400, "추첨 제목은 필수입니다.")
     if not draw_datetime_str:
         raise HTTPException(400, "추첨일시는 필수입니다.")
+    # bool은 int의 하위 타입이므로 따로 거름, 범위는 random_seed(BigInteger)에 맞춤
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or not 0 <= seed < 2 ** SEED_BITS):
+        raise HTTPException(400, f"추첨 seed는 0 이상 2^{SEED_BITS} 미만의 정수여야 합니다.")
 
     try:
         draw_datetime = datetime.fromisoformat(draw_datetime_str.replace("Z", "+00:00"))
@@ -68,27 +154,16 @@ def save_draw_result(db: Session, data: dict, current_user):
         draw_datetime=draw_datetime,
         total_participants=total_participants or len(winners),
         winner_count=winner_count or len(winners),
-        upload_file_id=upload_file_id
+        upload_file_id=upload_file_id,
+        random_seed=seed
     )
     db.add(record)
     db.flush()
 
-    # 전체 대상자 조회
-    participants = db.query(Participant).all()
-    for i, p in enumerate(participants):
-        is_winner = any(
-            w["name"] == p.name and w["email"] == p.email
-            for w in winners
-        )
-        dp = DrawParticipant(
-            draw_record_id=record.id,
-            participant_number=i + 1,
-            name=p.name,
-            email=p.email,
-            description=p.description,
-            is_winner=is_winner
-        )
-        db.add(dp)
+    # 전체 대상자 스냅샷을 DB에서 한 번에 복사 (참가자 번호 = id 순 row_number, 당첨 여부 = 당첨자 집합 조인)
+    inserted = _snapshot_participants(db, record.id, winners)
+    if not total_participants:
+        record.total_participants = inserted or len(winners)
 
     # 알림 생성
     notification = Notification(
@@ -102,3 +177,37 @@ def save_draw_result(db: Session, data: dict, current_user):
     db.refresh(record)
 
     return {"message": "추첨 결과 저장 완료", "draw_id": record.id}
+
+
+def _snapshot_participants(db: Session, draw_record_id: int, winners: list) -> int:
+    """INSERT ... SELECT로 현재 대상자 전체를 draw_participants에 복사하고 복사된 행 수를 반환"""
+    participants = Participant.__table__
+    winner_pairs = {(w.get("name"), w.get("email")) for w in winners if w.get("name") and w.get("email")}
+
+    if winner_pairs:
+        winner_set = values(column("name", String), column("email", String), name="w").data(list(winner_pairs))
+        source = participants.outerjoin(
+            winner_set,
+            and_(winner_set.c.name == participants.c.name, winner_set.c.email == participants.c.email),
+        )
+        is_winner = winner_set.c.name.isnot(None)
+    else:
+        source = participants
+        is_winner = false()
+
+    snapshot = select(
+        literal(draw_record_id),
+        func.row_number().over(order_by=participants.c.id),
+        participants.c.name,
+        participants.c.email,
+        participants.c.description,
+        is_winner,
+    ).select_from(source)
+
+    result = db.execute(
+        insert(DrawParticipant.__table__).from_select(
+            ["draw_record_id", "participant_number", "name", "email", "description", "is_winner"],
+            snapshot,
+        )
+    )
+    return result.rowcount or 0
@@ -0,0 +1,257 @@
+import os
+import shutil
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.models import UploadedFile
+
+# 로컬 저장 시 복사 버퍼 크기
+COPY_BUFFER_SIZE = 1024 * 1024
+# 재시도 간격 상한
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+# 업로드 결과 기록(커밋) 재시도 횟수 — 업로드는 끝났으므로 기록 실패로 다시 올리지 않도록
+RECORD_RESULT_ATTEMPTS = 3
+
+DRIVE_STATUS_PENDING = "pending"
+DRIVE_STATUS_UPLOADING = "uploading"
+DRIVE_STATUS_UPLOADED = "uploaded"
+DRIVE_STATUS_FAILED = "failed"
+
+
+class UploadJob(NamedTuple):
+    """점유한 업로드 작업 (트랜잭션 밖에서 업로드할 때 필요한 값만 복사)"""
+    id: int
+    file_path: Optional[str]
+    filename: str
+    mime_type: Optional[str]
+    folder_id: Optional[str]
+    attempts: int
+    # 점유 만료 시각 (결과 기록 시 아직 이 작업의 점유인지 확인하는 토큰)
+    lease_until: datetime
+
+
+def store_locally(fileobj: BinaryIO, filename: str, base_dir: str) -> Tuple[str, int]:
+    """업로드 파일을 <base_dir>/YYYY/MM/DD 아래에 스트리밍 복사하고 (경로, 크기) 반환"""
+    now = datetime.now()
+    upload_dir = os.path.join(base_dir, now.strftime("%Y"), now.strftime("%m"), now.strftime("%d"))
+    os.makedirs(upload_dir, exist_ok=True)
+    local_path = os.path.join(upload_dir, filename)
+
+    fileobj.seek(0)
+    with open(local_path, "wb") as f:
+        shutil.copyfileobj(fileobj, f, COPY_BUFFER_SIZE)
+    fileobj.seek(0)
+    return local_path, os.path.getsize(local_path)
+
+
+class DriveUploadQueue:
+    """
+    로컬에 먼저 저장된 UploadedFile을 백그라운드에서 Google Drive로 올리는 큐
+
+    - 요청 처리 중에는 로컬 저장 + drive_status='pending' 기록만 하고 바로 응답
+    - 워커 스레드가 pending 행을 FOR UPDATE SKIP LOCKED로 골라 uploading + 점유 만료 시각으로 바꾸고 바로 커밋
+      (업로드 동안 트랜잭션/행 잠금을 잡고 있지 않음, 다중 워커 안전)
+    - 업로드는 트랜잭션 밖에서 하고 결과는 짧은 트랜잭션으로 기록
+    - 워커가 업로드 중 죽으면 DRIVE_UPLOAD_LEASE_SECONDS 뒤 다른 워커가 다시 잡음
+    - 실패 시 지수 백오프로 재시도, DRIVE_UPLOAD_MAX_ATTEMPTS 초과 시 failed
+    """
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="drive-upload-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def enqueue(self, upload_file: UploadedFile, folder_id: Optional[str], mime_type: str) -> None:
+        """UploadedFile을 업로드 대기 상태로 표시 (커밋은 호출자, 커밋 후 notify 호출)"""
+        upload_file.drive_status = DRIVE_STATUS_PENDING
+        upload_file.drive_folder_id = folder_id
+        upload_file.mime_type = mime_type
+        upload_file.drive_attempts = 0
+        upload_file.drive_next_attempt_at = None
+
+    def notify(self) -> None:
+        """새 작업이 커밋되었음을 워커에 알림"""
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.process_pending()
+            except Exception as e:
+                print(f"[Drive Upload Queue] 처리 중 오류: {e}")
+                processed = 0
+            if not processed:
+                self._wake.wait(settings.DRIVE_UPLOAD_POLL_SECONDS)
+                self._wake.clear()
+
+    def process_pending(self, limit: int = 10) -> int:
+        """대기 중인 업로드를 최대 limit건 처리하고 처리 건수 반환"""
+        processed = 0
+        while processed < limit and not self._stop.is_set():
+            if not self._process_one():
+                break
+            processed += 1
+        return processed
+
+    def _process_one(self) -> bool:
+        job = self._claim()
+        if job is None:
+            return False
+        try:
+            drive_result = self._upload(job)
+        except Exception as e:
+            self._record_failure(job, e)
+        else:
+            self._record_success(job, drive_result)
+        return True
+
+    def _claim(self) -> Optional[UploadJob]:
+        """대기 중(또는 점유가 만료된) 업로드 한 건을 uploading으로 바꾸고 커밋"""
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            record = (
+                db.query(UploadedFile)
+                .filter(
+                    or_(
+                        and_(
+                            UploadedFile.drive_status == DRIVE_STATUS_PENDING,
+                            or_(UploadedFile.drive_next_attempt_at.is_(None), UploadedFile.drive_next_attempt_at <= now),
+                        ),
+                        and_(
+                            UploadedFile.drive_status == DRIVE_STATUS_UPLOADING,
+                            UploadedFile.drive_next_attempt_at <= now,
+                        ),
+                    )
+                )
+                .order_by(UploadedFile.id)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not record:
+                db.rollback()
+                return None
+
+            # 점유 시점에 시도 횟수를 올려 업로드 중 워커가 죽어도 무한 재시도되지 않도록 함
+            record.drive_status = DRIVE_STATUS_UPLOADING
+            record.drive_attempts = (record.drive_attempts or 0) + 1
+            record.drive_next_attempt_at = now + timedelta(seconds=settings.DRIVE_UPLOAD_LEASE_SECONDS)
+            job = UploadJob(
+                id=record.id,
+                file_path=record.file_path,
+                filename=record.saved_filename,
+                mime_type=record.mime_type,
+                folder_id=record.drive_folder_id,
+                attempts=record.drive_attempts,
+                lease_until=record.drive_next_attempt_at,
+            )
+            db.commit()
+            return job
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _record_success(self, job: UploadJob, drive_result: dict) -> None:
+        values = {
+            "drive_file_id": drive_result["file_id"],
+            "drive_web_view_link": drive_result["web_view_link"],
+            "drive_download_link": drive_result["download_link"],
+            "drive_created_time": datetime.now(timezone.utc),
+            "drive_status": DRIVE_STATUS_UPLOADED,
+            "drive_next_attempt_at": None,
+            "drive_last_error": None,
+        }
+        for attempt in range(1, RECORD_RESULT_ATTEMPTS + 1):
+            try:
+                updated = self._update_job(job, values)
+                break
+            except Exception as e:
+                if attempt == RECORD_RESULT_ATTEMPTS:
+                    # 파일은 Drive에 올라갔으므로 수동 정리를 위해 drive_file_id를 남김
+                    print(
+                        f"[Drive Upload Queue] 업로드 결과 기록 실패 (file_id={job.id}, "
+                        f"drive_file_id={drive_result['file_id']}): {e}"
+                    )
+                    return
+                self._stop.wait(attempt)
+        if not updated:
+            print(
+                f"[Drive Upload Queue] 점유가 만료되었거나 삭제된 파일 (file_id={job.id}, "
+                f"drive_file_id={drive_result['file_id']})"
+            )
+            return
+        print(f"[Drive Upload Queue] 업로드 완료 (file_id={job.id}, drive_file_id={drive_result['file_id']})")
+
+    def _record_failure(self, job: UploadJob, error: Exception) -> None:
+        values = {"drive_last_error": str(error)[:500]}
+        if job.attempts >= settings.DRIVE_UPLOAD_MAX_ATTEMPTS:
+            values.update(drive_status=DRIVE_STATUS_FAILED, drive_next_attempt_at=None)
+            print(f"[Drive Upload Queue] 업로드 최종 실패 (file_id={job.id}): {error}")
+        else:
+            delay = timedelta(seconds=settings.DRIVE_UPLOAD_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+            values.update(
+                drive_status=DRIVE_STATUS_PENDING,
+                drive_next_attempt_at=datetime.now(timezone.utc) + min(delay, MAX_RETRY_DELAY),
+            )
+        # 기록에 실패해도 점유가 만료되면 다시 잡히므로 여기서는 재시도하지 않음
+        self._update_job(job, values)
+
+    def _update_job(self, job: UploadJob, values: dict) -> bool:
+        """아직 이 작업이 점유 중인 행만 갱신 (점유 만료 후 다른 워커가 잡은 행은 건드리지 않음)"""
+        db = SessionLocal()
+        try:
+            updated = (
+                db.query(UploadedFile)
+                .filter(
+                    UploadedFile.id == job.id,
+                    UploadedFile.drive_status == DRIVE_STATUS_UPLOADING,
+                    UploadedFile.drive_next_attempt_at == job.lease_until,
+                )
+                .update(values, synchronize_session=False)
+            )
+            db.commit()
+            return bool(updated)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _upload(self, job: UploadJob) -> dict:
+        from app.services.google_drive_service import google_drive_service
+
+        if not job.file_path or not os.path.exists(job.file_path):
+            raise FileNotFoundError(f"로컬 파일이 없습니다: {job.file_path}")
+
+        with open(job.file_path, "rb") as f:
+            return google_drive_service.upload_file(
+                file_content=f,
+                filename=job.filename,
+                mime_type=job.mime_type or "application/octet-stream",
+                folder_id=job.folder_id,
+            )
+
+
+drive_upload_queue = DriveUploadQueue()
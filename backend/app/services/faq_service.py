@@ -5,11 +5,13 @@ from datetime import datetime
 from app.models import FAQ, FAQCategory, User
 from app.schemas.faq_schema import (
     FAQResponse,
+    FAQSummaryResponse,
     FAQPageResponse,
     FAQCategoryResponse,
 )
 from app.schemas.common import PageResponse
 from app.utils.auth import get_current_user_from_cookie
+from app.utils.pagination import SortKey, paginate
 
 # -------------------------
 # 내부 공통 유틸
@@ -36,6 +38,34 @@ def _to_faq_response(faq: FAQ) -> FAQResponse:
         deleted_at=faq.deleted_at,
     )
 
+# 목록 조회는 ORM 엔티티 대신 필요한 컬럼만 읽음 (카테고리명도 조인으로 함께 → 행마다 lazy load 없음)
+_FAQ_SUMMARY_COLUMNS = (
+    FAQ.id,
+    FAQ.question,
+    FAQ.category_id,
+    FAQCategory.name.label("category_name"),
+    FAQ.order,
+    FAQ.is_active,
+    FAQ.is_deleted,
+    FAQ.created_at,
+    FAQ.updated_at,
+)
+
+# 관리자 목록 정렬 (노출 순서 → 최신순, keyset 커서 기준)
+ADMIN_FAQ_SORT = (
+    SortKey(FAQ.order, descending=False),
+    SortKey(FAQ.created_at),
+    SortKey(FAQ.id),
+)
+
+def _to_faq_summary(row) -> FAQSummaryResponse:
+    """컬럼 projection 행 → 목록용 DTO (답변 제외)"""
+    return FAQSummaryResponse(**row._mapping)
+
+def _to_faq_response_from_row(row) -> FAQResponse:
+    """답변까지 포함한 projection 행 → FAQResponse (공개 목록은 아코디언으로 답변을 바로 보여줌)"""
+    return FAQResponse(**row._mapping)
+
 # -------------------------
 # 관리자: 카테고리
 # -------------------------
@@ -168,10 +198,11 @@ def admin_list_faqs_service(
     limit: int = 10,
     search: str | None = None,
     category_id: str | None = None,
+    cursor: str | None = None,
 ):
     _ensure_admin(request, db)
 
-    q = db.query(FAQ).outerjoin(FAQCategory, FAQ.category_id == FAQCategory.id)
+    q = db.query(*_FAQ_SUMMARY_COLUMNS).outerjoin(FAQCategory, FAQ.category_id == FAQCategory.id)
     q = q.filter(FAQ.is_deleted == False)
 
     if search:
@@ -184,18 +215,17 @@ def admin_list_faqs_service(
         except ValueError:
             pass
 
-    q = q.order_by(FAQ.order.asc(), FAQ.created_at.desc())
-    total = q.count()
-
     # 페이지 보정
     if page < 1:
         page = 1
-    total_pages = (total + limit - 1) // limit
-    if total_pages and page > total_pages:
-        page = total_pages
 
-    items = q.offset((page - 1) * limit).limit(limit).all()
-    dto_items = [_to_faq_response(f) for f in items]
+    result = paginate(q, ADMIN_FAQ_SORT, limit, (page - 1) * limit, cursor)
+    total_pages = (result.total + limit - 1) // limit
+    if not cursor and total_pages and page > total_pages:
+        # 범위를 넘은 페이지는 마지막 페이지로 보정 (이전 동작 유지)
+        page = total_pages
+        result = paginate(q, ADMIN_FAQ_SORT, limit, (page - 1) * limit)
+    dto_items = [_to_faq_summary(row) for row in result.items]
 
     categories = (
         db.query(FAQCategory)
@@ -204,7 +234,7 @@ def admin_list_faqs_service(
         .all()
     )
 
-    return PageResponse.create(dto_items, total, page, limit), categories
+    return PageResponse.create(dto_items, result.total, page, limit, next_cursor=result.next_cursor), categories
 
 def admin_get_faq_service(request: Request, db: Session, faq_id: int) -> FAQ:
     _ensure_admin(request, db)
@@ -324,7 +354,7 @@ def client_list_faqs_service(
     search: str | None = None,
     category_id: str | None = None,
 ):
-    q = db.query(FAQ).outerjoin(FAQCategory, FAQ.category_id == FAQCategory.id)
+    q = db.query(*_FAQ_SUMMARY_COLUMNS, FAQ.answer, FAQ.deleted_at).outerjoin(FAQCategory, FAQ.category_id == FAQCategory.id)
     q = q.filter(FAQ.is_deleted == False, FAQ.is_active == True)
 
     if search:
@@ -348,7 +378,7 @@ def client_list_faqs_service(
         page = total_pages
 
     items = q.offset((page - 1) * limit).limit(limit).all()
-    dto_items = [_to_faq_response(f) for f in items]
+    dto_items = [_to_faq_response_from_row(row) for row in items]
 
     categories = (
         db.query(FAQCategory)
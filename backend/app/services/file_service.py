@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, UploadFile
 from app.models import UploadedFile
-from app.services.google_drive_service import google_drive_service
+from app.services.drive_upload_queue_service import drive_upload_queue, store_locally
 from app.config import settings
 
 class FileService:
@@ -24,61 +24,29 @@ class FileService:
                 "file_size": f.file_size,
                 "upload_type": f.upload_type,
                 "created_at": f.created_at,
-                "has_drive_link": bool(f.drive_web_view_link)
+                "has_drive_link": bool(f.drive_web_view_link),
+                "drive_status": f.drive_status
             } for f in files
         ]
 
     def upload_file(self, db: Session, file: UploadFile):
-        """Google Drive 업로드 후 DB 기록 / 실패 시 로컬 백업"""
-        content = file.file.read()
-        mime_type = self._get_mime_type(file.filename)
-
-        try:
-            drive_result = google_drive_service.upload_file(
-                file_content=content,
-                filename=file.filename,
-                mime_type=mime_type,
-                folder_id=settings.GOOGLE_DRIVE_FOLDER_ID_EXCEL
-            )
-
-            upload = UploadedFile(
-                original_filename=file.filename,
-                saved_filename=drive_result["filename"],
-                file_size=drive_result["file_size"],
-                upload_type="drive",
-                drive_file_id=drive_result["file_id"],
-                drive_web_view_link=drive_result["web_view_link"],
-                drive_download_link=drive_result["download_link"]
-            )
-            db.add(upload)
-            db.commit()
-            db.refresh(upload)
-            return upload
-
-        except Exception as e:
-            print(f"⚠️ Google Drive 업로드 실패: {e}")
-            return self._save_local_backup(db, file, content)
-
-    def _save_local_backup(self, db: Session, file: UploadFile, content: bytes):
-        """Google Drive 업로드 실패 시 로컬 저장"""
-        year, month, day = datetime.now().strftime("%Y %m %d").split()
-        upload_dir = os.path.join("uploads", year, month, day)
-        os.makedirs(upload_dir, exist_ok=True)
-
-        file_path = os.path.join(upload_dir, file.filename)
-        with open(file_path, "wb") as f:
-            f.write(content)
+        """로컬 저장 후 DB 기록, Google Drive 업로드는 백그라운드 큐에서 처리"""
+        name, ext = os.path.splitext(file.filename)
+        unique_name = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+        local_path, file_size = store_locally(file.file, unique_name, settings.PRIVATE_MEDIA_ROOT)
 
         upload = UploadedFile(
             original_filename=file.filename,
-            saved_filename=file.filename,
-            file_path=file_path,
-            file_size=len(content),
-            upload_type="local"
+            saved_filename=unique_name,
+            file_path=local_path,
+            file_size=file_size,
+            upload_type="drive"
         )
+        drive_upload_queue.enqueue(upload, settings.GOOGLE_DRIVE_FOLDER_ID_EXCEL, self._get_mime_type(file.filename))
         db.add(upload)
         db.commit()
         db.refresh(upload)
+        drive_upload_queue.notify()
         return upload
 
     def _get_mime_type(self, filename: str) -> str:
@@ -1,76 +1,65 @@
-import os
+import itertools
 import logging
+import secrets
+import threading
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from zoneinfo import ZoneInfo
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from app.config import settings
+from app.services.google_credentials_service import google_credentials
 
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 증분 동기화 시 한 페이지에 받을 최대 일정 수
+SYNC_PAGE_SIZE = 2500
+# 일정 생성/수정 시 사용하는 캘린더 기준 시간대
+CALENDAR_TZ = ZoneInfo("Asia/Seoul")
 
-class GoogleCalendarService:
-    """Google Calendar API 서비스 클래스"""
 
-    SCOPES = ["https://www.googleapis.com/auth/calendar"]
+class CalendarSyncTokenExpired(Exception):
+    """syncToken이 만료되어(410 Gone) 전체 동기화가 필요함"""
 
-    def __init__(self):
-        self.service = None
-        self.credentials = None
-        self.token_path = settings.GOOGLE_TOKEN_FILE or os.path.join(os.getcwd(), "token.json")
-        if not os.path.isabs(self.token_path):
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            self.token_path = os.path.join(base_dir, self.token_path)
-        self._authenticate()
 
-    # ---------------------------
-    # 🔐 인증
-    # ---------------------------
-    def _authenticate(self):
-        """Google Calendar API 인증"""
-        creds = None
+def to_rfc3339(dt: Optional[datetime]) -> Optional[str]:
+    if not dt:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    else:
+        dt = dt.astimezone(timezone.utc)
+    return dt.isoformat().replace("+00:00", "Z")
 
-        # token.json 확인
-        if os.path.exists(self.token_path):
-            try:
-                creds = Credentials.from_authorized_user_file(self.token_path, self.SCOPES)
-                logger.info("✅ 기존 Google Calendar 토큰 로드 성공")
-            except Exception as e:
-                logger.warning(f"❌ 토큰 파일 읽기 실패: {e}")
 
-        # 토큰 갱신 시도
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                logger.info("🔄 토큰 갱신 성공")
-
-                # 갱신된 토큰 저장
-                with open(self.token_path, "w") as token:
-                    token.write(creds.to_json())
-            except Exception as e:
-                logger.error(f"⚠️ 토큰 갱신 실패: {e}")
-                creds = None
-
-        if not creds or not creds.valid:
-            logger.error("❌ Google Calendar 인증 실패 (유효한 토큰 없음)")
-            self.service = None
-            self.credentials = None
-            return
-
-        # 서비스 빌드
-        try:
-            self.credentials = creds
-            self.service = build("calendar", "v3", credentials=creds)
-            logger.info("✅ Google Calendar 서비스 초기화 완료")
-        except Exception as e:
-            logger.error(f"Google Calendar 서비스 초기화 실패: {e}")
-            self.service = None
+def as_utc(dt: datetime) -> datetime:
+    """naive datetime은 UTC로 간주"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def parse_event_time(value: Optional[str]) -> Optional[datetime]:
+    """일정의 start/end 문자열(dateTime 또는 종일 date)을 UTC datetime으로 변환"""
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        # 종일 일정이나 시간대 없는 값은 캘린더 기준 시간대로 해석
+        dt = dt.replace(tzinfo=CALENDAR_TZ)
+    return dt.astimezone(timezone.utc)
+
+
+class GoogleCalendarService:
+    """Google Calendar API 서비스 클래스"""
+
+    @property
+    def service(self):
+        """최초 사용 시 공유 자격 증명으로 생성되는 Calendar 클라이언트 (인증 정보가 없으면 None)"""
+        return google_credentials.build_service("calendar", "v3")
 
     # ---------------------------
     # 📅 일정 조회
@@ -89,15 +78,6 @@ class GoogleCalendarService:
         try:
             calendar_id = calendar_id or settings.GOOGLE_CALENDAR_ID
 
-            def to_rfc3339(dt: Optional[datetime]) -> Optional[str]:
-                if not dt:
-                    return None
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                else:
-                    dt = dt.astimezone(timezone.utc)
-                return dt.isoformat().replace("+00:00", "Z")
-
             time_min_iso = to_rfc3339(time_min or datetime.utcnow())
             time_max_iso = to_rfc3339(time_max) if time_max else None
 
@@ -124,6 +104,49 @@ class GoogleCalendarService:
             logger.error(f"📅 일정 목록 조회 실패: {e}")
             raise Exception(f"일정 목록 조회 실패: {e}")
 
+    # ---------------------------
+    # 🔄 변경분 조회 (증분 동기화)
+    # ---------------------------
+    def fetch_changes(
+        self,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        calendar_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        sync_token이 없으면 time_min 이후 전체, 있으면 그 이후 변경분을 (일정 목록, 다음 syncToken)으로 반환
+
+        삭제된 일정은 status='cancelled'로 포함된다. syncToken 만료 시 CalendarSyncTokenExpired.
+        """
+        if not self.service:
+            raise Exception("Google Calendar 서비스가 초기화되지 않았습니다.")
+
+        params = {
+            "calendarId": calendar_id or settings.GOOGLE_CALENDAR_ID,
+            "singleEvents": True,
+            "showDeleted": True,
+            "maxResults": SYNC_PAGE_SIZE,
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        elif time_min:
+            params["timeMin"] = to_rfc3339(time_min)
+
+        events: List[Dict[str, Any]] = []
+        while True:
+            try:
+                result = self.service.events().list(**params).execute()
+            except HttpError as e:
+                if e.resp.status == 410:
+                    raise CalendarSyncTokenExpired() from e
+                logger.error(f"🔄 일정 동기화 실패: {e}")
+                raise Exception(f"일정 동기화 실패: {e}")
+            events.extend(self._format_event(e) for e in result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return events, result.get("nextSyncToken")
+            params["pageToken"] = page_token
+
     # ---------------------------
     # 📌 단일 일정 조회
     # ---------------------------
@@ -259,5 +282,115 @@ class GoogleCalendarService:
         }
 
 
+class LocalFakeCalendarService(GoogleCalendarService):
+    """
+    GOOGLE_CALENDAR_FAKE=True일 때 사용하는 메모리 기반 가짜 캘린더 (오프라인 개발/테스트용)
+
+    변경마다 버전을 올려 syncToken 기반 증분 동기화까지 동일하게 흉내낸다.
+    """
+
+    service = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._counter = itertools.count(1)
+        self._version = 0
+
+    def _save(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        now = to_rfc3339(datetime.now(timezone.utc))
+        event.setdefault("created", now)
+        event["updated"] = now
+        self._version = next(self._counter)
+        self._events[event["id"]] = event
+        self._versions[event["id"]] = self._version
+        return self._format_event(event)
+
+    def fetch_changes(self, sync_token=None, time_min=None, calendar_id=None):
+        with self._lock:
+            if sync_token:
+                since = int(sync_token)
+                changed = [self._events[i] for i, v in self._versions.items() if v > since]
+            else:
+                floor = as_utc(time_min) if time_min else None
+                changed = [
+                    e for e in self._events.values()
+                    if e["status"] != "cancelled" and (not floor or self._end(e) > floor)
+                ]
+            return [self._format_event(e) for e in changed], str(self._version)
+
+    @staticmethod
+    def _start(event: Dict[str, Any]) -> datetime:
+        return parse_event_time(event["start"]["dateTime"])
+
+    @staticmethod
+    def _end(event: Dict[str, Any]) -> datetime:
+        return parse_event_time(event["end"]["dateTime"])
+
+    def list_events(self, calendar_id=None, time_min=None, time_max=None, max_results=100):
+        floor = as_utc(time_min or datetime.utcnow())
+        ceiling = as_utc(time_max) if time_max else None
+        with self._lock:
+            events = [
+                e for e in self._events.values()
+                if e["status"] != "cancelled"
+                and self._end(e) > floor
+                and (not ceiling or self._start(e) < ceiling)
+            ]
+        events.sort(key=self._start)
+        return [self._format_event(e) for e in events[:max_results]]
+
+    def get_event(self, event_id, calendar_id=None):
+        with self._lock:
+            event = self._events.get(event_id)
+            if not event or event["status"] == "cancelled":
+                raise Exception(f"일정 조회 실패: {event_id}")
+            return self._format_event(event)
+
+    def create_event(self, summary, start_time, end_time, description="", location="", calendar_id=None):
+        with self._lock:
+            return self._save({
+                "id": secrets.token_hex(13),
+                "summary": summary or "(제목 없음)",
+                "description": description,
+                "location": location,
+                "start": {"dateTime": start_time, "timeZone": "Asia/Seoul"},
+                "end": {"dateTime": end_time, "timeZone": "Asia/Seoul"},
+                "visibility": "public",
+                "status": "confirmed",
+            })
+
+    def update_event(self, event_id, summary=None, start_time=None, end_time=None,
+                     description=None, location=None, calendar_id=None):
+        with self._lock:
+            event = self._events.get(event_id)
+            if not event or event["status"] == "cancelled":
+                raise Exception(f"일정 수정 실패: {event_id}")
+            event = dict(event)
+            if summary is not None:
+                event["summary"] = summary
+            if description is not None:
+                event["description"] = description
+            if location is not None:
+                event["location"] = location
+            if start_time is not None:
+                event["start"] = {"dateTime": start_time, "timeZone": "Asia/Seoul"}
+            if end_time is not None:
+                event["end"] = {"dateTime": end_time, "timeZone": "Asia/Seoul"}
+            return self._save(event)
+
+    def delete_event(self, event_id, calendar_id=None):
+        with self._lock:
+            event = self._events.get(event_id)
+            if not event or event["status"] == "cancelled":
+                raise Exception(f"일정 삭제 실패: {event_id}")
+            self._save(dict(event, status="cancelled"))
+            return True
+
+
 # ✅ 싱글톤 인스턴스
-google_calendar_service = GoogleCalendarService()
+if settings.GOOGLE_CALENDAR_FAKE:
+    google_calendar_service = LocalFakeCalendarService()
+else:
+    google_calendar_service = GoogleCalendarService()
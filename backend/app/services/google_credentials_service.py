@@ -0,0 +1,193 @@
+import hashlib
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.discovery_cache.base import Cache
+
+from app.config import settings
+
+# 갱신 실패 시 다시 시도하기까지 대기 시간
+REFRESH_RETRY_SECONDS = 60
+# 만료 시각을 알 수 없는 토큰의 점검 주기
+REFRESH_IDLE_SECONDS = 3600
+
+
+class DiscoveryFileCache(Cache):
+    """googleapiclient discovery 문서를 디스크에 보관하는 캐시 (재시작 후에도 네트워크 조회 생략)"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+    def get(self, url):
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def set(self, url, content):
+        path = self._path(url)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+class GoogleCredentialManager:
+    """
+    Drive/Calendar가 함께 쓰는 Google OAuth 자격 증명 관리자
+
+    - 최초 사용 시점에 token.json을 읽음 (import/기동 시 Google I/O 없음)
+    - 자격 증명과 API 클라이언트는 프로세스 내에서 공유
+    - 백그라운드 스레드가 만료 GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS 전에 미리 갱신하고 token.json에 저장
+    """
+
+    def __init__(self, token_path: Optional[str] = None):
+        token_path = token_path or os.path.join(os.getcwd(), "token.json")
+        if not os.path.isabs(token_path):
+            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            token_path = os.path.join(base_dir, token_path)
+        self.token_path = token_path
+        self._lock = threading.RLock()
+        self._credentials: Optional[Credentials] = None
+        self._loaded = False
+        self._services: Dict[Tuple[str, str], Any] = {}
+        self._discovery_cache: Optional[DiscoveryFileCache] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    # -------------------------------
+    # 자격 증명 / 클라이언트
+    # -------------------------------
+    def get_credentials(self) -> Optional[Credentials]:
+        """유효한 자격 증명 반환 (없거나 갱신 실패 시 None)"""
+        with self._lock:
+            if not self._loaded:
+                self._credentials = self._load()
+                self._loaded = True
+                self._start_refresher()
+                self._wake.set()  # 새 토큰 기준으로 다음 갱신 시각 재계산
+            creds = self._credentials
+            if creds and not creds.valid:
+                if not self._refresh(creds):
+                    return None
+            return creds
+
+    def build_service(self, api: str, version: str):
+        """공유 자격 증명으로 만든 API 클라이언트 (api, version별로 한 번만 생성)"""
+        with self._lock:
+            key = (api, version)
+            service = self._services.get(key)
+            if service is not None:
+                return service
+            creds = self.get_credentials()
+            if not creds:
+                return None
+            try:
+                service = build(
+                    api,
+                    version,
+                    credentials=creds,
+                    cache_discovery=True,
+                    cache=self._get_discovery_cache(),
+                )
+            except Exception as e:
+                print(f"❌ Google {api} 서비스 초기화 실패: {e}")
+                return None
+            self._services[key] = service
+            print(f"✅ Google {api} 서비스 초기화 완료")
+            return service
+
+    def reload(self) -> None:
+        """token.json이 새로 발급된 뒤 호출: 다음 사용 시 다시 읽고 클라이언트를 새로 만듦"""
+        with self._lock:
+            self._credentials = None
+            self._loaded = False
+            self._services.clear()
+        self._wake.set()
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._refresher:
+            self._refresher.join(timeout)
+            self._refresher = None
+
+    def _get_discovery_cache(self) -> DiscoveryFileCache:
+        if self._discovery_cache is None:
+            self._discovery_cache = DiscoveryFileCache(settings.GOOGLE_DISCOVERY_CACHE_DIR)
+        return self._discovery_cache
+
+    def _load(self) -> Optional[Credentials]:
+        if not os.path.exists(self.token_path):
+            print("⚠️ 유효한 Google 인증 정보가 없습니다.")
+            return None
+        try:
+            return Credentials.from_authorized_user_file(self.token_path)
+        except Exception as e:
+            print(f"⚠️ 토큰 파일 읽기 실패: {e}")
+            return None
+
+    def _refresh(self, creds: Credentials) -> bool:
+        if not creds.refresh_token:
+            return False
+        try:
+            creds.refresh(Request())
+        except Exception as e:
+            print(f"❌ Google 토큰 갱신 실패: {e}")
+            return False
+        self._save(creds)
+        print("✅ Google 토큰 갱신 성공")
+        return True
+
+    def _save(self, creds: Credentials) -> None:
+        tmp_path = f"{self.token_path}.tmp"
+        with open(tmp_path, "w") as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, self.token_path)
+
+    # -------------------------------
+    # 백그라운드 선제 갱신
+    # -------------------------------
+    def _start_refresher(self) -> None:
+        if self._refresher and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="google-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        delay = self._seconds_until_refresh()
+        while not self._stop.is_set():
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            with self._lock:
+                creds = self._credentials
+                if creds and self._seconds_until_refresh() <= 0 and not self._refresh(creds):
+                    delay = REFRESH_RETRY_SECONDS
+                    continue
+                delay = self._seconds_until_refresh()
+
+    def _seconds_until_refresh(self) -> float:
+        creds = self._credentials
+        if not creds or not creds.refresh_token or not creds.expiry:
+            return REFRESH_IDLE_SECONDS
+        # google-auth는 expiry를 naive UTC로 보관
+        expiry = creds.expiry.replace(tzinfo=timezone.utc)
+        remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+        return max(remaining - settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS, 0)
+
+
+google_credentials = GoogleCredentialManager(settings.GOOGLE_TOKEN_FILE)
@@ -1,71 +1,65 @@
 import os
 import io
 import json
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import secrets
+import shutil
+import tempfile
+from typing import Optional, Dict, Any, List, Union, BinaryIO, AsyncIterator
+from datetime import datetime, timezone
+
+from starlette.concurrency import run_in_threadpool
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseUpload
 
 from app.config import settings
+from app.services.google_credentials_service import google_credentials
+
+# resumable 업로드 청크 크기 (Drive API 요구사항: 256KB의 배수)
+CHUNK_ALIGNMENT = 256 * 1024
+# 청크 전송 실패 시 googleapiclient 내부 재시도 횟수
+UPLOAD_NUM_RETRIES = 3
+UPLOAD_FIELDS = "id,name,webViewLink,webContentLink,size,createdTime"
+
+UploadSource = Union[bytes, BinaryIO]
+
+
+def _chunk_size() -> int:
+    size = max(settings.DRIVE_UPLOAD_CHUNK_SIZE_MB, 1) * 1024 * 1024
+    return size - size % CHUNK_ALIGNMENT
+
+
+def _as_fileobj(source: UploadSource) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+async def _spool(chunks: AsyncIterator[bytes]) -> BinaryIO:
+    """비동기 청크를 임시 파일에 모음 (청크 크기를 넘으면 디스크로 넘어가 메모리는 청크 크기 이내)"""
+    spool = tempfile.SpooledTemporaryFile(max_size=_chunk_size())
+    async for chunk in chunks:
+        await run_in_threadpool(spool.write, chunk)
+    spool.seek(0)
+    return spool
+
 
 class GoogleDriveService:
     """Google Drive API 서비스"""
 
-    SCOPES = [
-        "https://www.googleapis.com/auth/drive.file",
-        "https://www.googleapis.com/auth/calendar",
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/youtube.readonly",
-        "https://www.googleapis.com/auth/yt-analytics.readonly",
-        "https://www.googleapis.com/auth/yt-analytics-monetary.readonly"
-    ]
-
-    def __init__(self):
-        self.credentials = None
-        self.service = None
-        self.token_path = settings.GOOGLE_TOKEN_FILE or os.path.join(os.getcwd(), "token.json")
-        if not os.path.isabs(self.token_path):
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            self.token_path = os.path.join(base_dir, self.token_path)
-        self._authenticate()
-
-    def _authenticate(self):
-        """Google Drive API 인증 (OAuth 토큰 기반)"""
-        creds = None
-
-        if os.path.exists(self.token_path):
-            try:
-                creds = Credentials.from_authorized_user_file(self.token_path, self.SCOPES)
-            except Exception as e:
-                print(f"⚠️ 토큰 파일 읽기 실패: {e}")
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                    print("✅ Google Drive 토큰 갱신 성공")
-                except Exception as e:
-                    print(f"❌ 토큰 갱신 실패: {e}")
-                    creds = None
-            else:
-                print("⚠️ 유효한 Google 인증 정보가 없습니다.")
-                self.credentials = None
-                self.service = None
-                return
-
-            with open(self.token_path, "w") as token:
-                token.write(creds.to_json())
-
-        self.credentials = creds
-        self.service = build("drive", "v3", credentials=creds)
-        print("✅ Google Drive 서비스 초기화 완료")
-
-    def upload_file(self, file_content: bytes, filename: str, mime_type: str, folder_id: Optional[str] = None):
-        """Google Drive에 파일 업로드"""
+    @property
+    def service(self):
+        """최초 사용 시 공유 자격 증명으로 생성되는 Drive 클라이언트 (인증 정보가 없으면 None)"""
+        return google_credentials.build_service("drive", "v3")
+
+    def upload_file(self, file_content: UploadSource, filename: str, mime_type: str, folder_id: Optional[str] = None):
+        """
+        Google Drive에 파일 업로드
+
+        file_content는 bytes 또는 파일 객체(seek 가능)이며,
+        resumable 업로드로 DRIVE_UPLOAD_CHUNK_SIZE_MB씩 읽어 전송하므로 파일 전체를 메모리에 올리지 않는다.
+        """
         if not self.service:
             raise Exception("Google Drive 서비스가 초기화되지 않았습니다.")
 
@@ -74,13 +68,14 @@ class GoogleDriveService:
             if folder_id:
                 metadata["parents"] = [folder_id]
 
-            media = MediaIoBaseUpload(io.BytesIO(file_content), mimetype=mime_type, resumable=True)
+            media = MediaIoBaseUpload(
+                _as_fileobj(file_content), mimetype=mime_type, chunksize=_chunk_size(), resumable=True
+            )
+            request = self.service.files().create(body=metadata, media_body=media, fields=UPLOAD_FIELDS)
 
-            file = self.service.files().create(
-                body=metadata,
-                media_body=media,
-                fields="id,name,webViewLink,webContentLink,size,createdTime"
-            ).execute()
+            file = None
+            while file is None:
+                _, file = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
 
             file_id = file.get("id")
 
@@ -101,6 +96,22 @@ class GoogleDriveService:
         except HttpError as e:
             raise Exception(f"Google Drive 업로드 실패: {e}")
 
+    async def upload_file_async(
+        self,
+        source: Union[BinaryIO, AsyncIterator[bytes]],
+        filename: str,
+        mime_type: str,
+        folder_id: Optional[str] = None,
+    ):
+        """파일 객체 또는 비동기 청크 iterator를 스레드풀에서 업로드 (이벤트 루프 비차단)"""
+        if hasattr(source, "__aiter__"):
+            spool = await _spool(source)
+            try:
+                return await run_in_threadpool(self.upload_file, spool, filename, mime_type, folder_id)
+            finally:
+                spool.close()
+        return await run_in_threadpool(self.upload_file, source, filename, mime_type, folder_id)
+
     def list_files_in_folder(self, folder_id: str, limit: int = 20) -> List[Dict[str, Any]]:
         """지정한 Google Drive 폴더 내 파일 목록 조회"""
         if not self.service:
@@ -118,4 +129,69 @@ class GoogleDriveService:
         except HttpError as e:
             raise Exception(f"Google Drive 파일 목록 조회 실패: {e}")
 
-google_drive_service = GoogleDriveService()
+
+class LocalFakeDriveService(GoogleDriveService):
+    """
+    GOOGLE_DRIVE_FAKE_ROOT가 설정되면 사용하는 로컬 디렉터리 기반 가짜 Drive (개발/테스트용)
+
+    <root>/<folder_id>/<file_id> 에 파일을, <file_id>.json 에 메타데이터를 저장한다.
+    실제 Drive와 동일하게 청크 단위로 복사하므로 업로드당 메모리 사용량도 같은 기준으로 확인할 수 있다.
+    """
+
+    service = None
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        print(f"✅ 로컬 가짜 Google Drive 사용: {root}")
+
+    def _folder_dir(self, folder_id: Optional[str]) -> str:
+        return os.path.join(self.root, folder_id or "root")
+
+    def upload_file(self, file_content: UploadSource, filename: str, mime_type: str, folder_id: Optional[str] = None):
+        file_id = secrets.token_hex(16)
+        folder_dir = self._folder_dir(folder_id)
+        os.makedirs(folder_dir, exist_ok=True)
+        path = os.path.join(folder_dir, file_id)
+
+        with open(path, "wb") as f:
+            shutil.copyfileobj(_as_fileobj(file_content), f, _chunk_size())
+
+        meta = {
+            "id": file_id,
+            "name": filename,
+            "mimeType": mime_type,
+            "webViewLink": f"file://{path}",
+            "webContentLink": f"file://{path}",
+            "size": str(os.path.getsize(path)),
+            "createdTime": datetime.now(timezone.utc).isoformat(),
+        }
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        return {
+            "file_id": file_id,
+            "filename": filename,
+            "web_view_link": meta["webViewLink"],
+            "download_link": meta["webContentLink"],
+            "file_size": int(meta["size"]),
+            "created_time": meta["createdTime"],
+        }
+
+    def list_files_in_folder(self, folder_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        folder_dir = self._folder_dir(folder_id)
+        if not os.path.isdir(folder_dir):
+            return []
+        files = []
+        for name in os.listdir(folder_dir):
+            if name.endswith(".json"):
+                with open(os.path.join(folder_dir, name), encoding="utf-8") as f:
+                    files.append(json.load(f))
+        files.sort(key=lambda meta: meta["createdTime"], reverse=True)
+        return files[:limit]
+
+
+if settings.GOOGLE_DRIVE_FAKE_ROOT:
+    google_drive_service = LocalFakeDriveService(settings.GOOGLE_DRIVE_FAKE_ROOT)
+else:
+    google_drive_service = GoogleDriveService()
@@ -1,6 +1,6 @@
 # app/services/mypage_service.py
 from fastapi import HTTPException, Response
-from sqlalchemy import func, case
+from sqlalchemy import func
 from sqlalchemy.orm import Session, selectinload
 from app.utils.auth import verify_password, get_password_hash, clear_auth_cookie
 from datetime import datetime
@@ -15,6 +15,7 @@ from app.models.quiz import (
     QuestionTopicLink,
 )
 from app.schemas.quiz_schema import TopicSchema
+from app.services.quiz_history_partition_service import history_stats_source
 from app.schemas.mypage_schema import (
     BundleHistoryItem,
     BundleHistoryResponse,
@@ -228,12 +229,11 @@ def get_wrong_answers(
 
 
 def get_user_quiz_stats(db: Session, user_id: int) -> UserQuizStatsResponse:
+    # 보관된 월(파티션 분리)은 집계 테이블에서 함께 합산
+    stats = history_stats_source()
     total_attempts, total_correct = (
-        db.query(
-            func.count(UserQuizHistory.id),
-            func.sum(case((UserQuizHistory.is_correct.is_(True), 1), else_=0)),
-        )
-        .filter(UserQuizHistory.user_id == user_id)
+        db.query(func.sum(stats.c.attempts), func.sum(stats.c.correct))
+        .filter(stats.c.user_id == user_id)
         .one()
     )
 
@@ -242,13 +242,10 @@ def get_user_quiz_stats(db: Session, user_id: int) -> UserQuizStatsResponse:
     accuracy = total_correct / total_attempts if total_attempts else 0.0
 
     category_rows = (
-        db.query(
-            Question.category,
-            func.count(UserQuizHistory.id),
-            func.sum(case((UserQuizHistory.is_correct.is_(True), 1), else_=0)),
-        )
-        .join(Question, Question.id == UserQuizHistory.question_id)
-        .filter(UserQuizHistory.user_id == user_id)
+        db.query(Question.category, func.sum(stats.c.attempts), func.sum(stats.c.correct))
+        .select_from(stats)
+        .join(Question, Question.id == stats.c.question_id)
+        .filter(stats.c.user_id == user_id)
         .group_by(Question.category)
         .all()
     )
@@ -267,13 +264,10 @@ def get_user_quiz_stats(db: Session, user_id: int) -> UserQuizStatsResponse:
         )
 
     difficulty_rows = (
-        db.query(
-            Question.difficulty,
-            func.count(UserQuizHistory.id),
-            func.sum(case((UserQuizHistory.is_correct.is_(True), 1), else_=0)),
-        )
-        .join(Question, Question.id == UserQuizHistory.question_id)
-        .filter(UserQuizHistory.user_id == user_id)
+        db.query(Question.difficulty, func.sum(stats.c.attempts), func.sum(stats.c.correct))
+        .select_from(stats)
+        .join(Question, Question.id == stats.c.question_id)
+        .filter(stats.c.user_id == user_id)
         .group_by(Question.difficulty)
         .all()
     )
@@ -293,14 +287,15 @@ def get_user_quiz_stats(db: Session, user_id: int) -> UserQuizStatsResponse:
 
     question_rows = (
         db.query(
-            UserQuizHistory.question_id,
+            stats.c.question_id,
             Question.question_text,
-            func.count(UserQuizHistory.id),
-            func.sum(case((UserQuizHistory.is_correct.is_(True), 1), else_=0)),
+            func.sum(stats.c.attempts),
+            func.sum(stats.c.correct),
         )
-        .join(Question, Question.id == UserQuizHistory.question_id)
-        .filter(UserQuizHistory.user_id == user_id)
-        .group_by(UserQuizHistory.question_id, Question.question_text)
+        .select_from(stats)
+        .join(Question, Question.id == stats.c.question_id)
+        .filter(stats.c.user_id == user_id)
+        .group_by(stats.c.question_id, Question.question_text)
         .all()
     )
 
@@ -2,10 +2,10 @@
 import secrets
 from urllib.parse import urlencode
 
-import httpx
 from fastapi import HTTPException
 
 from app.config import settings
+from app.utils.http_client import shared_http_client
 
 NAVER_AUTH_URL = "https://nid.naver.com/oauth2.0/authorize"
 NAVER_TOKEN_URL = "https://nid.naver.com/oauth2.0/token"
@@ -36,9 +36,9 @@ def get_naver_login_url() -> str:
     return f"{NAVER_AUTH_URL}?{urlencode(params)}"
 
 
-def exchange_naver_code_for_userinfo(code: str) -> dict:
+async def exchange_naver_code_for_userinfo(code: str) -> dict:
     """
-    인증 코드로 토큰 교환 후 네이버 프로필 조회.
+    인증 코드로 토큰 교환 후 네이버 프로필 조회 (공유 AsyncClient 사용, 이벤트 루프 비차단).
     Returns: {"email": str, "name": str, "picture": str | None}
     """
     if not settings.NAVER_CLIENT_ID or not settings.NAVER_CLIENT_SECRET:
@@ -46,32 +46,33 @@ def exchange_naver_code_for_userinfo(code: str) -> dict:
 
     redirect_uri = get_naver_client_redirect_uri()
 
-    with httpx.Client() as client:
-        token_resp = client.post(
-            NAVER_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "client_id": settings.NAVER_CLIENT_ID,
-                "client_secret": settings.NAVER_CLIENT_SECRET,
-                "code": code,
-                "state": "",  # state는 선택
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=10.0,
-        )
-        token_resp.raise_for_status()
-        token_data = token_resp.json()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise HTTPException(status_code=400, detail="Naver 토큰 발급 실패")
-
-        user_resp = client.get(
-            NAVER_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-            timeout=10.0,
-        )
-        user_resp.raise_for_status()
-        data = user_resp.json()
+    token_resp = await shared_http_client.request(
+        "naver",
+        "POST",
+        NAVER_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "client_id": settings.NAVER_CLIENT_ID,
+            "client_secret": settings.NAVER_CLIENT_SECRET,
+            "code": code,
+            "state": "",  # state는 선택
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    token_resp.raise_for_status()
+    token_data = token_resp.json()
+    access_token = token_data.get("access_token")
+    if not access_token:
+        raise HTTPException(status_code=400, detail="Naver 토큰 발급 실패")
+
+    user_resp = await shared_http_client.request(
+        "naver",
+        "GET",
+        NAVER_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    user_resp.raise_for_status()
+    data = user_resp.json()
 
     if data.get("resultcode") != "00":
         raise HTTPException(status_code=400, detail=data.get("message", "프로필 조회 실패"))
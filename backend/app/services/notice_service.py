@@ -7,19 +7,22 @@ from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, timezone, timedelta
 
 from fastapi import HTTPException, UploadFile, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import or_, and_, func
 from sqlalchemy.orm import Session
 
-from app.models import Notice, User, NoticeCategory
+from app.models import Notice, User, NoticeCategory, UploadedFile
 from app.schemas.common import PageResponse
 from app.schemas import (
     NoticeResponse,
+    NoticeListItemResponse,
     NoticePageResponse,
     NoticeCreate,
     NoticeUpdate,
     NoticeCategoryResponse,
 )
-from app.utils import get_current_user_from_cookie
+from app.utils import get_current_user_from_cookie, build_excerpt
+from app.utils.pagination import SortKey, paginate
 
 
 # ===== 공통 유틸 =====
@@ -57,6 +60,64 @@ def _to_notice_response(n: Notice, author_nickname: Optional[str] = None, catego
         deleted_at=n.deleted_at,
     )
 
+# 목록 조회는 ORM 엔티티 대신 필요한 컬럼만 읽음 (본문 content는 읽지 않고, 세션에 객체도 올리지 않음)
+_NOTICE_SUMMARY_COLUMNS = (
+    Notice.id,
+    Notice.title,
+    Notice.excerpt,
+    Notice.content_length,
+    Notice.category_id,
+    Notice.publish_status,
+    Notice.published_at,
+    Notice.author_id,
+    User.nickname.label("author_nickname"),
+    NoticeCategory.name.label("category_name"),
+    Notice.views,
+    Notice.is_deleted,
+    Notice.created_at,
+    Notice.updated_at,
+)
+
+# 관리자 목록 정렬 (최신 작성순, keyset 커서 기준)
+ADMIN_NOTICE_SORT = (SortKey(Notice.created_at), SortKey(Notice.id))
+
+def _as_kst(value: Optional[datetime]) -> Optional[datetime]:
+    """표시용 KST 변환 (naive datetime이면 KST로 가정)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=KST)
+    return value.astimezone(KST)
+
+def _to_notice_summary(row) -> NoticeListItemResponse:
+    """
+    컬럼 projection 행 → 목록용 DTO. 본문 대신 저장된 평문 요약(excerpt)만 담고,
+    published_at은 ORM 객체를 건드리지 않고 값만 KST로 변환.
+    """
+    return NoticeListItemResponse(
+        id=row.id,
+        title=row.title,
+        excerpt=row.excerpt or "",
+        content_length=row.content_length or 0,
+        category_id=row.category_id,
+        publish_status=row.publish_status,
+        published_at=_as_kst(row.published_at),
+        author_id=row.author_id,
+        author_nickname=row.author_nickname,
+        category_name=row.category_name,
+        views=row.views or 0,
+        is_deleted=row.is_deleted,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+def _set_notice_content(notice: Notice, content: str) -> None:
+    """
+    본문 저장 시 평문 요약/글자 수도 함께 갱신 (목록·RSS는 이 컬럼만 읽음).
+    """
+    notice.content = content
+    notice.excerpt, notice.content_length = build_excerpt(content)
+
 def _validate_publish_status(publish_status: str):
     if publish_status not in ["published", "scheduled", "private"]:
         raise HTTPException(status_code=400, detail="올바른 발행 상태를 선택해주세요.")
@@ -95,10 +156,11 @@ def admin_list_notices_service(
     limit: int = 10,
     search: Optional[str] = None,
     category_id: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Tuple[NoticePageResponse, List[NoticeCategory]]:
     """
-    관리자 공지 목록 (삭제 포함), 템플릿/Api 공용.
-    반환: (PageResponse[NoticeResponse], 카테고리목록)
+    관리자 공지 목록 (삭제 포함), 템플릿/Api 공용. cursor가 있으면 keyset으로 이어서 조회.
+    반환: (PageResponse[NoticeListItemResponse], 카테고리목록)
     """
     _ensure_admin(request, db)
 
@@ -108,7 +170,8 @@ def admin_list_notices_service(
         limit = 10
 
     query = (
-        db.query(Notice, User.nickname.label("author_nickname"), NoticeCategory.name.label("category_name"))
+        db.query(*_NOTICE_SUMMARY_COLUMNS)
+        .select_from(Notice)
         .join(User, Notice.author_id == User.id)
         .outerjoin(NoticeCategory, Notice.category_id == NoticeCategory.id)
         .filter(Notice.is_deleted == False)  # 관리 페이지도 삭제된 건 안보는 요구였음(이전코드 유지)
@@ -130,24 +193,14 @@ def admin_list_notices_service(
             # 잘못된 category_id는 무시
             pass
 
-    total = query.count()
-    offset = (page - 1) * limit
-
-    results = (
-        query.order_by(Notice.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    results = paginate(query, ADMIN_NOTICE_SORT, limit, (page - 1) * limit, cursor)
 
-    items: List[NoticeResponse] = []
-    for n, author_nickname, category_name in results:
-        # 시간대 표시는 템플릿에서 처리 가능하지만, DTO에 들어가는 값은 KST로 맞춰줌(이전 동작 유지)
-        if n.published_at:
-            n.published_at = n.published_at.astimezone(KST)
-        items.append(_to_notice_response(n, author_nickname, category_name))
+    # 시간대 표시는 템플릿에서 처리 가능하지만, DTO에 들어가는 값은 KST로 맞춰줌(이전 동작 유지)
+    items: List[NoticeListItemResponse] = [_to_notice_summary(row) for row in results.items]
 
-    page_obj = PageResponse.create(items=items, total=total, page=page, limit=limit)
+    page_obj = PageResponse.create(
+        items=items, total=results.total, page=page, limit=limit, next_cursor=results.next_cursor
+    )
 
     # 카테고리 목록(사이드필터)
     categories = (
@@ -215,12 +268,12 @@ async def admin_create_notice_service(request: Request, db: Session) -> Dict[str
     notice = Notice(
         author_id=current_user.id,
         title=title,
-        content=content,
         category_id=category_id,
         publish_status=publish_status,
         published_at=published_at_dt,
         first_published_at=datetime.utcnow() if publish_status == "published" else None,
     )
+    _set_notice_content(notice, content)
 
     try:
         db.add(notice)
@@ -253,7 +306,7 @@ async def admin_update_notice_service(request: Request, db: Session, notice_id:
     if "content" in data:
         if not data["content"]:
             raise HTTPException(status_code=400, detail="내용은 필수입니다.")
-        notice.content = data["content"]
+        _set_notice_content(notice, data["content"])
 
     if "category_id" in data:
         if not data["category_id"]:
@@ -467,7 +520,8 @@ def client_list_notices_service(
     now_kst = datetime.now(KST)
 
     query = (
-        db.query(Notice, User.nickname.label("author_nickname"), NoticeCategory.name.label("category_name"))
+        db.query(*_NOTICE_SUMMARY_COLUMNS)
+        .select_from(Notice)
         .join(User, Notice.author_id == User.id)
         .outerjoin(NoticeCategory, Notice.category_id == NoticeCategory.id)
         .filter(Notice.is_deleted == False)
@@ -501,20 +555,7 @@ def client_list_notices_service(
         .all()
     )
 
-    items: List[NoticeResponse] = []
-    for n, author_nickname, category_name in results:
-        # published_at 시간대 변환 시 타임존 인식 체크
-        if n.published_at:
-            try:
-                if n.published_at.tzinfo is None:
-                    # naive datetime이면 KST로 가정
-                    n.published_at = n.published_at.replace(tzinfo=KST)
-                else:
-                    n.published_at = n.published_at.astimezone(KST)
-            except Exception as e:
-                # 시간대 변환 실패 시 그대로 사용
-                print(f"[WARNING] published_at 시간대 변환 실패: {e}")
-        items.append(_to_notice_response(n, author_nickname, category_name))
+    items: List[NoticeListItemResponse] = [_to_notice_summary(row) for row in results]
 
     page_obj = PageResponse.create(items=items, total=total, page=page, limit=limit)
 
@@ -640,15 +681,13 @@ async def admin_upload_notice_image_service(
     file: UploadFile
 ) -> Dict[str, Any]:
     """
-    Toast UI 에디터 이미지 업로드 (Google Drive)
+    Toast UI 에디터 이미지 업로드 (로컬 저장 후 Google Drive 비동기 업로드)
     """
     _ensure_admin(request, db)
 
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
 
-    file_content = await file.read()
-
     now = datetime.now()
     file_extension = os.path.splitext(file.filename)[1]
     original_name = os.path.splitext(file.filename)[0]
@@ -658,27 +697,37 @@ async def admin_upload_notice_image_service(
     mime_type = file.content_type
 
     try:
-        # 지연 import (서비스가 선택적일 수 있으므로)
-        from app.services.google_drive_service import google_drive_service
+        # 로컬에 먼저 저장하고 바로 응답, Google Drive 업로드는 백그라운드 큐에서 처리
+        from app.services.drive_upload_queue_service import drive_upload_queue, store_locally
         from app.config import settings
 
-        if not google_drive_service or not google_drive_service.service:
-            raise HTTPException(status_code=503, detail="Google Drive 서비스가 인증되지 않았습니다.")
+        local_path, file_size = await run_in_threadpool(
+            store_locally,
+            file.file,
+            unique_filename,
+            os.path.join(settings.MEDIA_ROOT, settings.NOTICE_IMAGE_UPLOAD_SUBDIR),
+        )
 
-        drive_result = google_drive_service.upload_file(
-            file_content=file_content,
-            filename=unique_filename,
-            mime_type=mime_type,
-            folder_id=settings.GOOGLE_DRIVE_FOLDER_ID_NOTICE_IMAGE
+        upload = UploadedFile(
+            original_filename=file.filename,
+            saved_filename=unique_filename,
+            file_path=local_path,
+            file_size=file_size,
+            upload_type="notice_image",
         )
+        drive_upload_queue.enqueue(upload, settings.GOOGLE_DRIVE_FOLDER_ID_NOTICE_IMAGE, mime_type)
+        db.add(upload)
+        db.commit()
+        db.refresh(upload)
+        drive_upload_queue.notify()
 
-        file_id = drive_result.get("file_id")
-        file_url = f"https://lh3.googleusercontent.com/d/{file_id}"
+        # 업로드 완료 전에는 로컬 파일, 완료 후에는 Drive 이미지로 연결되는 고정 URL
+        file_url = f"/api/files/{upload.id}/content"
 
         return {
             "url": file_url,
             "filename": unique_filename,
-            "size": drive_result.get("file_size"),
+            "size": file_size,
         }
     except HTTPException:
         raise
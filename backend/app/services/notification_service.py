@@ -1,32 +1,96 @@
+import threading
+import time
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from fastapi import HTTPException
 from datetime import datetime
+from typing import Optional
+from app.config import settings
 from app.models import Notification, User, DrawRecord
+from app.utils.pagination import SortKey, paginate
+
+# 알림 목록 정렬 (최신순, keyset 커서 기준)
+NOTIFICATION_SORT = (SortKey(Notification.created_at), SortKey(Notification.id))
+
+
+class UnreadNotificationCounter:
+    """
+    워커별 읽지 않은 알림 수 카운터
+
+    읽음/삭제/생성 시 증감하고, NOTIFICATION_UNREAD_RECONCILE_SECONDS마다
+    부분 인덱스(ix_notifications_unread)를 타는 count 쿼리로 실제 값과 맞춘다.
+    """
+
+    def __init__(self, reconcile_seconds: float):
+        self._reconcile_seconds = reconcile_seconds
+        self._lock = threading.Lock()
+        self._value: Optional[int] = None
+        self._reconciled_at = 0.0
+
+    def get(self, db: Session) -> int:
+        with self._lock:
+            value = self._value
+            fresh = time.monotonic() - self._reconciled_at < self._reconcile_seconds
+        if value is None or not fresh:
+            return self.reconcile(db)
+        return value
+
+    def reconcile(self, db: Session) -> int:
+        count = db.query(func.count(Notification.id)).filter(Notification.is_read == False).scalar() or 0
+        with self._lock:
+            self._value = count
+            self._reconciled_at = time.monotonic()
+        return count
+
+    def adjust(self, delta: int) -> None:
+        """커밋된 변경만큼 증감 (아직 한 번도 맞추지 않았다면 다음 조회에서 계산)"""
+        with self._lock:
+            if self._value is not None:
+                self._value = max(0, self._value + delta)
+
+    def reset(self) -> None:
+        """전체 읽음/전체 삭제 후 0으로 설정"""
+        with self._lock:
+            self._value = 0
 
 class NotificationService:
     """알림 비즈니스 로직"""
 
-    def list_notifications(self, db: Session, skip: int = 0, limit: int = 100):
-        """알림 목록 조회"""
-        query = db.query(Notification).order_by(desc(Notification.created_at))
-        total = query.count()
-        notifications = query.offset(skip).limit(limit).all()
-        return notifications, total
+    def list_notifications(self, db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        """알림 목록 조회 (Page: items, total, next_cursor)"""
+        return paginate(db.query(Notification), NOTIFICATION_SORT, limit, skip, cursor)
+
+    def get_unread_count(self, db: Session) -> int:
+        """읽지 않은 알림 수 (워커 내 카운터, 주기적으로 DB와 맞춤)"""
+        return unread_notification_counter.get(db)
+
+    def list_notifications_after(self, db: Session, last_id: int, limit: int = 100):
+        """SSE 재접속 시 누락된 알림 조회 (id 오름차순)"""
+        return (
+            db.query(Notification)
+            .filter(Notification.id > last_id)
+            .order_by(Notification.id)
+            .limit(limit)
+            .all()
+        )
 
     def mark_as_read(self, db: Session, notification_id: int):
         """단일 알림 읽음 표시"""
         n = db.query(Notification).filter(Notification.id == notification_id).first()
         if not n:
             raise HTTPException(404, "알림을 찾을 수 없습니다.")
+        was_unread = not n.is_read
         n.is_read = True
         db.commit()
+        if was_unread:
+            unread_notification_counter.adjust(-1)
         return {"message": "읽음 처리 완료"}
 
     def mark_all_as_read(self, db: Session):
         """전체 읽음 처리"""
         db.query(Notification).filter(Notification.is_read == False).update({"is_read": True})
         db.commit()
+        unread_notification_counter.reset()
         return {"message": "전체 알림 읽음 처리 완료"}
 
     def delete_notification(self, db: Session, notification_id: int):
@@ -34,14 +98,18 @@ class NotificationService:
         n = db.query(Notification).filter(Notification.id == notification_id).first()
         if not n:
             raise HTTPException(404, "알림을 찾을 수 없습니다.")
+        was_unread = not n.is_read
         db.delete(n)
         db.commit()
+        if was_unread:
+            unread_notification_counter.adjust(-1)
         return {"message": "삭제 완료"}
 
     def clear_all(self, db: Session):
         """모든 알림 삭제"""
         db.query(Notification).delete()
         db.commit()
+        unread_notification_counter.reset()
         return {"message": "모든 알림 삭제 완료"}
 
     def get_recent_activity(self, db: Session, skip: int = 0, limit: int = 50):
@@ -72,4 +140,5 @@ class NotificationService:
         activities.sort(key=lambda x: x["timestamp"] or datetime.min, reverse=True)
         return activities[skip: skip + limit]
 
+unread_notification_counter = UnreadNotificationCounter(settings.NOTIFICATION_UNREAD_RECONCILE_SECONDS)
 notification_service = NotificationService()
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database.connection import engine
+from app.models import Notification
+from app.services.notification_service import unread_notification_counter
+
+# 워커 간 알림 전달용 Postgres NOTIFY 채널
+NOTIFY_CHANNEL = "notifications"
+# 구독자별 대기 이벤트 최대 수 (가득 차면 새 이벤트는 버리고 재접속 시 Last-Event-ID로 보충)
+SUBSCRIBER_QUEUE_SIZE = 100
+# pg_notify payload 한도(8000바이트)를 넘지 않도록 본문을 자르는 길이
+NOTIFY_CONTENT_LIMIT = 1000
+_PENDING_KEY = "pending_notification_events"
+
+
+def notification_to_event(n: Notification) -> dict:
+    """Notification 행을 SSE 이벤트 payload로 변환 (flush 직후에도 추가 쿼리 없이 동작)"""
+    created_at = n.__dict__.get("created_at") or datetime.now(timezone.utc)
+    return {
+        "id": n.id,
+        "type": n.type,
+        "title": n.title,
+        "content": n.content,
+        "is_read": bool(n.__dict__.get("is_read") or False),
+        "related_id": n.related_id,
+        "created_at": created_at.isoformat(),
+    }
+
+
+class NotificationBroadcaster:
+    """
+    새 알림을 SSE 구독자에게 전달하는 프로세스 내 브로드캐스터
+
+    - 알림 INSERT가 커밋되면 구독자 큐로 전달 (세션 이벤트로 자동 수집)
+    - PostgreSQL에서는 INSERT와 같은 트랜잭션에서 pg_notify를 보내고,
+      각 워커의 LISTEN 연결이 받은 이벤트만 전달하여 다중 워커에서도 모든 관리자에게 도달
+    """
+
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listen_conn = None
+        self.listening = False
+
+    # -------------------------------
+    # 구독
+    # -------------------------------
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(queue)
+
+    # -------------------------------
+    # 발행 (어느 스레드에서든 호출 가능)
+    # -------------------------------
+    def publish(self, payload: dict) -> None:
+        with self._lock:
+            loop, subscribers = self._loop, list(self._subscribers)
+        if not loop or not subscribers:
+            return
+        for queue in subscribers:
+            loop.call_soon_threadsafe(self._offer, queue, payload)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, payload: dict) -> None:
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # 느린 구독자: 재접속 시 Last-Event-ID로 누락분을 다시 받음
+            pass
+
+    # -------------------------------
+    # Postgres LISTEN (워커 간 fan-out)
+    # -------------------------------
+    def start_listening(self) -> bool:
+        """현재 이벤트 루프에 LISTEN 연결을 등록 (PostgreSQL이 아니면 False)"""
+        if engine.dialect.name != "postgresql" or self.listening:
+            return self.listening
+        loop = asyncio.get_running_loop()
+        raw = engine.raw_connection()
+        raw.detach()  # 풀에서 분리해 전용 연결로 사용
+        conn = raw.driver_connection
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        loop.add_reader(conn.fileno(), self._on_notify_readable)
+        with self._lock:
+            self._loop = loop
+        self._listen_conn = conn
+        self.listening = True
+        return True
+
+    def stop_listening(self) -> None:
+        if not self._listen_conn:
+            return
+        try:
+            self._loop.remove_reader(self._listen_conn.fileno())
+            self._listen_conn.close()
+        finally:
+            self._listen_conn = None
+            self.listening = False
+
+    def _on_notify_readable(self) -> None:
+        conn = self._listen_conn
+        try:
+            conn.poll()
+        except Exception as e:
+            print(f"[Notification Stream] LISTEN 연결 오류, 프로세스 내 전달로 전환: {e}")
+            self.stop_listening()
+            return
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            try:
+                payload = json.loads(notify.payload)
+            except ValueError:
+                continue
+            # 모든 워커가 같은 NOTIFY를 받으므로 각자 카운터를 증가
+            if not payload.get("is_read"):
+                unread_notification_counter.adjust(1)
+            self.publish(payload)
+
+
+notification_broadcaster = NotificationBroadcaster()
+
+
+# -------------------------------
+# 세션 이벤트: 알림 INSERT 수집 → 커밋 후 전달
+# -------------------------------
+@event.listens_for(Session, "after_flush")
+def _collect_new_notifications(session: Session, flush_context) -> None:
+    payloads = [notification_to_event(obj) for obj in session.new if isinstance(obj, Notification)]
+    if not payloads:
+        return
+    if notification_broadcaster.listening:
+        # NOTIFY는 트랜잭션이 커밋될 때만 전달되므로 롤백된 알림은 나가지 않음
+        connection = session.connection()
+        for payload in payloads:
+            if payload["content"]:
+                payload["content"] = payload["content"][:NOTIFY_CONTENT_LIMIT]
+            connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": NOTIFY_CHANNEL, "payload": json.dumps(payload, ensure_ascii=False)},
+            )
+    else:
+        session.info.setdefault(_PENDING_KEY, []).extend(payloads)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_notifications(session: Session) -> None:
+    payloads = session.info.pop(_PENDING_KEY, [])
+    if not payloads:
+        return
+    unread_notification_counter.adjust(sum(1 for p in payloads if not p["is_read"]))
+    for payload in payloads:
+        notification_broadcaster.publish(payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_notifications(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
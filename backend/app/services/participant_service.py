@@ -1,13 +1,55 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert, select, update, func, bindparam
+from sqlalchemy.exc import IntegrityError
 from app.models import Participant, UploadedFile
 from app.schemas import ParticipantCreate
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.utils.cache import CachedSnapshot, invalidate_on_commit, mark_tables_changed
+from app.utils.counting import TableCounter
+from app.utils.pagination import Page, SortKey, paginate
+from app.utils.search import (
+    SEARCH_SCORE_LABEL,
+    is_substring_search,
+    normalize_search_term,
+    relevance,
+    relevance_sort,
+    text_match,
+)
 from fastapi import UploadFile, HTTPException
 import openpyxl
 import random
 import os
+import io
+import csv
+import codecs
+import hashlib
+from array import array
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Iterable, Iterator, Sequence, Callable
+
+# 대상자 일괄 등록 시 한 번에 INSERT/COPY 하는 행 수
+IMPORT_CHUNK_SIZE = 5000
+# 업로드 가능한 대상자 파일 확장자
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+DELIMITED_EXTENSIONS = {'.csv': ',', '.tsv': '\t'}
+# CSV/TSV 인코딩 감지 후보 (순서대로 시도)
+CSV_ENCODINGS = ('utf-8-sig', 'cp949')
+CSV_ENCODING_SAMPLE_SIZE = 64 * 1024
+# 헤더 이름 → 컬럼 매핑 (소문자/공백 제거 후 비교)
+PARTICIPANT_HEADER_ALIASES = {
+    "name": ("이름", "성명", "name", "fullname"),
+    "email": ("이메일", "메일", "email", "e-mail", "mail"),
+    "description": ("상세", "설명", "비고", "description", "memo", "note"),
+}
+# 업로드 중복 처리 방식: skip(건너뜀) / merge(기존 대상자 상세 갱신)
+DUPLICATE_MODES = ("skip", "merge")
+# (이름, 이메일) 유니크 인덱스 위반 시 409 응답 메시지
+DUPLICATE_PARTICIPANT_MESSAGE = "같은 이름과 이메일의 대상자가 이미 등록되어 있습니다."
+# 추첨 seed 비트 수 (DrawRecord.random_seed BigInteger 범위)
+SEED_BITS = 63
+# 관리자 대상자 목록 정렬 (id순, keyset 커서 기준)
+PARTICIPANT_SORT = (SortKey(Participant.id, descending=False),)
 
 
 class ParticipantService:
@@ -16,31 +58,75 @@ class ParticipantService:
     # -------------------------------
     # 기본 조회
     # -------------------------------
-    def get_all_participants(self, db: Session, limit: int = 10, offset: int = 0) -> Tuple[List[Participant], int]:
-        participants = db.query(Participant).offset(offset).limit(limit).all()
-        total_count = db.query(Participant).count()
-        return participants, total_count
+    def get_all_participants(
+        self, db: Session, limit: int = 10, offset: int = 0, cursor: Optional[str] = None
+    ) -> Page:
+        """전체 대상자 (id순, 대형 테이블이면 total은 추정치)"""
+        query = db.query(Participant)
+        return paginate(
+            query, PARTICIPANT_SORT, limit, offset, cursor,
+            count=lambda: participant_counter.count(db, query),
+        )
+
+    def count_participants(self, db: Session) -> int:
+        """전체 대상자 수"""
+        return db.query(func.count(Participant.id)).scalar() or 0
+
+    def get_participant_stats(self, db: Session) -> dict:
+        """대상자 통계를 단일 집계 쿼리로 계산"""
+        total, with_email, with_description = db.execute(
+            select(
+                func.count(Participant.id),
+                func.count(Participant.id).filter(func.coalesce(Participant.email, "") != ""),
+                func.count(Participant.id).filter(func.coalesce(Participant.description, "") != ""),
+            )
+        ).one()
+        return {
+            "total_participants": total,
+            "participants_with_email": with_email,
+            "participants_with_description": with_description,
+        }
 
     def get_all_participants_for_selection(self, db: Session) -> List[Participant]:
         """랜덤 선정을 위한 전체 대상자 조회"""
         return db.query(Participant).all()
 
     def search_participants(self, db: Session, name: str = None, description: str = None,
-                            email: str = None, limit: int = 10, offset: int = 0) -> Tuple[List[Participant], int]:
-        """검색"""
+                            email: str = None, limit: int = 10, offset: int = 0,
+                            cursor: Optional[str] = None) -> Page:
+        """
+        검색 (필드별 AND)
+        - 3글자 이상: 부분 일치 (pg_trgm GIN 인덱스), 결과는 유사도 순
+        - 더 짧은 검색어: prefix 일치 (lower(...) text_pattern_ops 인덱스), 결과는 id순
+        """
+        terms = [
+            (column, normalize_search_term(value))
+            for column, value in (
+                (Participant.name, name),
+                (Participant.description, description),
+                (Participant.email, email),
+            )
+        ]
+        # 캐시 키는 필드 위치까지 구분 (이름 "kim"과 이메일 "kim"은 다른 목록)
+        count_key = tuple(term for _, term in terms)
+        terms = [(column, term) for column, term in terms if term]
+
         query = db.query(Participant)
-        conditions = []
-        if name:
-            conditions.append(Participant.name.like(f"%{name}%"))
-        if description:
-            conditions.append(Participant.description.like(f"%{description}%"))
-        if email:
-            conditions.append(Participant.email.like(f"%{email}%"))
-        if conditions:
-            query = query.filter(and_(*conditions))
-        total_count = query.count()
-        participants = query.offset(offset).limit(limit).all()
-        return participants, total_count
+        if terms:
+            query = query.filter(and_(*[text_match(column, term) for column, term in terms]))
+        count = lambda: participant_counter.count(db, query, count_key)
+
+        substring_terms = [(column, term) for column, term in terms if is_substring_search(term)]
+        if not substring_terms:
+            return paginate(query, PARTICIPANT_SORT, limit, offset, cursor, count=count)
+
+        scores = [relevance((column,), term) for column, term in substring_terms]
+        score = scores[0] if len(scores) == 1 else sum(scores[1:], scores[0])
+        page = paginate(
+            query.add_columns(score.label(SEARCH_SCORE_LABEL)), relevance_sort(Participant, score),
+            limit, offset, cursor, count=count,
+        )
+        return page._replace(items=[row.Participant for row in page.items])
 
     def get_participant_by_id(self, db: Session, participant_id: int) -> Optional[Participant]:
         participant = db.query(Participant).filter(Participant.id == participant_id).first()
@@ -58,7 +144,7 @@ class ParticipantService:
             description=participant_data.description
         )
         db.add(participant)
-        db.commit()
+        self._commit_or_conflict(db)
         db.refresh(participant)
         return participant
 
@@ -67,10 +153,18 @@ class ParticipantService:
         participant.name = participant_data.name
         participant.email = participant_data.email
         participant.description = participant_data.description
-        db.commit()
+        self._commit_or_conflict(db)
         db.refresh(participant)
         return participant
 
+    def _commit_or_conflict(self, db: Session) -> None:
+        """(이름, 이메일) 유니크 인덱스 위반 시 409로 변환"""
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(409, DUPLICATE_PARTICIPANT_MESSAGE)
+
     def delete_participant(self, db: Session, participant_id: int) -> bool:
         participant = self.get_participant_by_id(db, participant_id)
         db.delete(participant)
@@ -78,127 +172,295 @@ class ParticipantService:
         return True
 
     # -------------------------------
-    # 엑셀 업로드
+    # 엑셀 / CSV / TSV 업로드
     # -------------------------------
-    def upload_excel_file(self, db: Session, file: UploadFile, replace_all: bool = False) -> str:
-        """엑셀 업로드 및 Google Drive 연동"""
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(400, "엑셀 파일만 업로드 가능합니다.")
+    def upload_excel_file(self, db: Session, file: UploadFile, replace_all: bool = False,
+                          progress_callback: Optional[Callable[[int], None]] = None,
+                          duplicate_mode: str = "skip") -> str:
+        """엑셀/CSV/TSV 업로드 및 Google Drive 연동 (스트리밍 파싱 + 중복 제거 + 청크 단위 일괄 INSERT)"""
+        ext = os.path.splitext(file.filename)[1].lower()
+        if ext not in EXCEL_EXTENSIONS and ext not in DELIMITED_EXTENSIONS:
+            raise HTTPException(400, "엑셀(.xlsx, .xls) 또는 CSV/TSV 파일만 업로드 가능합니다.")
+        if duplicate_mode not in DUPLICATE_MODES:
+            raise HTTPException(400, f"지원하지 않는 중복 처리 방식입니다: {duplicate_mode}")
 
         saved_file = self._save_uploaded_file(db, file, replace_all)
-        participants_data = self._parse_excel_file(file)
-        if not participants_data:
-            raise HTTPException(400, "유효한 데이터가 없습니다.")
 
         if replace_all:
-            db.query(Participant).delete()
-            db.commit()
+            db.query(Participant).delete(synchronize_session=False)
 
-        for data in participants_data:
-            participant = Participant(
-                name=data['name'],
-                email=data['email'],
-                description=data['description'],
-                upload_file_id=saved_file.id
-            )
-            db.add(participant)
-        db.commit()
+        if ext in DELIMITED_EXTENSIONS:
+            raw_rows = self._iter_delimited_rows(file, DELIMITED_EXTENSIONS[ext])
+        else:
+            raw_rows = self._iter_excel_rows(file)
+        existing_keys = set() if replace_all else self._load_existing_keys(db)
+        stats = {"skipped": 0, "merged": 0}
+        rows = self._dedupe_rows(
+            db, self._validate_rows(self._map_columns(raw_rows)), existing_keys, duplicate_mode, stats
+        )
+        try:
+            total = self._bulk_insert_participants(db, rows, saved_file.id, progress_callback)
+        except HTTPException:
+            # 파싱 중 거부된 파일(인코딩 오류 등)은 이미 넣은 청크까지 되돌림
+            db.rollback()
+            raise
+        except IntegrityError:
+            # 동시에 진행된 다른 업로드/등록이 같은 (이름, 이메일)을 먼저 넣은 경우
+            db.rollback()
+            raise HTTPException(409, DUPLICATE_PARTICIPANT_MESSAGE)
+        if not total and not stats["merged"]:
+            db.rollback()
+            if stats["skipped"]:
+                raise HTTPException(400, f"새로 추가할 대상자가 없습니다. (중복 {stats['skipped']}명)")
+            raise HTTPException(400, "유효한 데이터가 없습니다.")
+        self._commit_or_conflict(db)
 
-        msg = f"'{file.filename}' 업로드 완료 ({len(participants_data)}명)"
+        msg = f"'{file.filename}' 업로드 완료 ({total}명)"
         msg += " — 기존 데이터 교체됨" if replace_all else " — 기존 데이터에 추가됨"
+        if stats["skipped"]:
+            msg += f", 중복 {stats['skipped']}명 건너뜀"
+        if stats["merged"]:
+            msg += f", 기존 대상자 {stats['merged']}명 상세 갱신"
         return msg
 
     def _save_uploaded_file(self, db: Session, file: UploadFile, replace_all: bool) -> UploadedFile:
-        """Google Drive 업로드 시도 후 로컬 백업"""
-        from app.services.google_drive_service import google_drive_service
-        from app.config import settings
+        """로컬에 먼저 저장하고 Google Drive 업로드는 백그라운드 큐에 등록"""
+        from app.services.drive_upload_queue_service import drive_upload_queue, store_locally
 
         now = datetime.now()
         name, ext = os.path.splitext(file.filename)
         timestamp = now.strftime("%Y%m%d_%H%M%S")
         unique_name = f"{name}_{timestamp}{ext}"
-        mime_type = self._get_mime_type(ext)
 
-        file_content = file.file.read()
-        file.file.seek(0)
-        file_size = len(file_content)
+        local_path, file_size = store_locally(file.file, unique_name, settings.PRIVATE_MEDIA_ROOT)
 
-        try:
-            drive_result = google_drive_service.upload_file(
-                file_content=file_content,
-                filename=unique_name,
-                mime_type=mime_type,
-                folder_id=settings.GOOGLE_DRIVE_FOLDER_ID_EXCEL
-            )
-
-            upload_file = UploadedFile(
-                original_filename=file.filename,
-                saved_filename=unique_name,
-                file_size=file_size,
-                upload_type="replace" if replace_all else "add",
-                drive_file_id=drive_result["file_id"],
-                drive_web_view_link=drive_result["web_view_link"],
-                drive_download_link=drive_result["download_link"],
-                drive_created_time=datetime.now()
-            )
-            db.add(upload_file)
-            db.commit()
-            db.refresh(upload_file)
-            return upload_file
-        except Exception as e:
-            # 로컬 백업 경로 생성
-            year, month, day = now.strftime("%Y"), now.strftime("%m"), now.strftime("%d")
-            backup_dir = os.path.join("uploads", year, month, day)
-            os.makedirs(backup_dir, exist_ok=True)
-            local_path = os.path.join(backup_dir, unique_name)
-
-            with open(local_path, "wb") as f:
-                f.write(file_content)
-
-            upload_file = UploadedFile(
-                original_filename=file.filename,
-                saved_filename=unique_name,
-                file_path=local_path,
-                file_size=file_size,
-                upload_type="replace" if replace_all else "add"
-            )
-            db.add(upload_file)
-            db.commit()
-            db.refresh(upload_file)
-            return upload_file
+        upload_file = UploadedFile(
+            original_filename=file.filename,
+            saved_filename=unique_name,
+            file_path=local_path,
+            file_size=file_size,
+            upload_type="replace" if replace_all else "add"
+        )
+        drive_upload_queue.enqueue(upload_file, settings.GOOGLE_DRIVE_FOLDER_ID_EXCEL, self._get_mime_type(ext))
+        db.add(upload_file)
+        db.commit()
+        db.refresh(upload_file)
+        drive_upload_queue.notify()
+        return upload_file
 
     def _get_mime_type(self, ext: str) -> str:
         return {
             ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             ".xls": "application/vnd.ms-excel",
             ".csv": "text/csv",
+            ".tsv": "text/tab-separated-values",
             ".pdf": "application/pdf",
         }.get(ext.lower(), "application/octet-stream")
 
-    def _parse_excel_file(self, file: UploadFile) -> List[dict]:
-        """엑셀 파싱"""
-        from io import BytesIO
-        wb = openpyxl.load_workbook(BytesIO(file.file.read()))
+    def _iter_excel_rows(self, file: UploadFile) -> Iterator[tuple]:
+        """엑셀 파싱 (read-only 모드로 헤더 포함 한 행씩 스트리밍)"""
         file.file.seek(0)
-        sheet = wb.active
-        participants = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
+        wb = openpyxl.load_workbook(file.file, read_only=True, data_only=True)
+        try:
+            sheet = wb.active
+            for row in sheet.iter_rows(values_only=True):
+                yield row
+        finally:
+            wb.close()
+            file.file.seek(0)
+
+    def _iter_delimited_rows(self, file: UploadFile, delimiter: str) -> Iterator[list]:
+        """CSV/TSV 파싱 (인코딩 감지 후 헤더 포함 한 행씩 스트리밍)"""
+        encoding = self._detect_encoding(file)
+        file.file.seek(0)
+        # 감지는 앞부분만 보므로 뒤쪽에서 디코딩이 깨지면 대체 문자로 저장하지 않고 업로드를 거부
+        text = io.TextIOWrapper(file.file, encoding=encoding, errors="strict", newline="")
+        try:
+            for row in csv.reader(text, delimiter=delimiter):
+                yield row
+        except UnicodeDecodeError:
+            raise HTTPException(400, "파일 인코딩을 인식할 수 없습니다. UTF-8 또는 CP949로 저장해주세요.")
+        finally:
+            # TextIOWrapper가 닫히면서 업로드 파일까지 닫지 않도록 분리
+            text.detach()
+            file.file.seek(0)
+
+    def _detect_encoding(self, file: UploadFile) -> str:
+        """파일 앞부분으로 UTF-8 / CP949 중 디코딩 가능한 인코딩 선택"""
+        file.file.seek(0)
+        sample = file.file.read(CSV_ENCODING_SAMPLE_SIZE)
+        file.file.seek(0)
+        for encoding in CSV_ENCODINGS:
+            try:
+                # 샘플 경계에서 잘린 멀티바이트 문자는 오류로 보지 않음
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        raise HTTPException(400, "파일 인코딩을 인식할 수 없습니다. UTF-8 또는 CP949로 저장해주세요.")
+
+    def _map_columns(self, rows: Iterable[Sequence]) -> Iterator[tuple]:
+        """첫 행을 헤더로 보고 (이름, 이메일, 상세) 순서로 재배열 (헤더 인식 실패 시 열 순서 사용)"""
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        positions = {"name": 0, "email": 1, "description": 2}
+        normalized = [str(h).strip().lower().replace(" ", "") if h is not None else "" for h in header]
+        for field, aliases in PARTICIPANT_HEADER_ALIASES.items():
+            for idx, value in enumerate(normalized):
+                if value in aliases:
+                    positions[field] = idx
+                    break
+
+        order = (positions["name"], positions["email"], positions["description"])
+        for row in rows:
+            if not row:
+                continue
+            yield tuple(row[i] if i < len(row) else None for i in order)
+
+    def _validate_rows(self, rows: Iterable[Sequence]) -> Iterator[dict]:
+        """(이름, 이메일, 상세) 행을 검증해 INSERT 가능한 dict로 변환"""
+        for row in rows:
             if not row or not row[0]:
                 continue
             name = str(row[0]).strip()
-            email = str(row[1]).strip()
-            description = str(row[2]).strip() if len(row) > 2 else None
+            email = str(row[1]).strip() if len(row) > 1 and row[1] is not None else ""
+            description = None
+            if len(row) > 2 and row[2] is not None:
+                description = str(row[2]).strip() or None
             if not name or not email:
                 continue
-            participants.append({"name": name, "email": email, "description": description})
-        return participants
+            yield {
+                "name": name[:100],
+                "email": email[:100],
+                "description": description[:500] if description else None,
+            }
 
-    def select_random_winners(self, db: Session, count: int) -> List[Participant]:
-        """랜덤 당첨자 선정"""
-        all_p = self.get_all_participants_for_selection(db)
-        if len(all_p) < count:
-            raise HTTPException(400, f"대상자 수({len(all_p)})가 선정 수({count})보다 적습니다.")
-        return random.sample(all_p, count)
+    @staticmethod
+    def _participant_key(name: str, email: str) -> bytes:
+        """
+        정규화된 (이름, 이메일) 키의 8바이트 해시 (유니크 인덱스와 같은 lower(btrim()) 기준)
+        btrim은 공백(' ')만 제거하므로 탭/NBSP까지 지우는 str.strip() 대신 strip(" ")
+        """
+        raw = f"{name.strip(' ').lower()}\x00{email.strip(' ').lower()}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=8).digest()
+
+    def _load_existing_keys(self, db: Session) -> set:
+        """기존 대상자의 정규화 키를 ORM 객체 없이 해시 집합으로 적재"""
+        stmt = select(
+            func.lower(func.btrim(Participant.name)),
+            func.lower(func.btrim(Participant.email)),
+        ).execution_options(yield_per=IMPORT_CHUNK_SIZE)
+        return {self._participant_key(name, email) for name, email in db.execute(stmt)}
+
+    def _dedupe_rows(self, db: Session, rows: Iterable[dict], existing_keys: set,
+                     duplicate_mode: str, stats: dict) -> Iterator[dict]:
+        """파일 내/기존 데이터와 중복된 행을 한 번의 순회로 건너뛰거나 병합"""
+        incoming_keys = set()
+        pending_merges: List[dict] = []
+        for data in rows:
+            key = self._participant_key(data["name"], data["email"])
+            if key in existing_keys:
+                if duplicate_mode == "merge" and data["description"]:
+                    pending_merges.append(data)
+                    stats["merged"] += 1
+                    if len(pending_merges) >= IMPORT_CHUNK_SIZE:
+                        self._merge_chunk(db, pending_merges)
+                        pending_merges = []
+                else:
+                    stats["skipped"] += 1
+                continue
+            if key in incoming_keys:
+                stats["skipped"] += 1
+                continue
+            incoming_keys.add(key)
+            yield data
+        if pending_merges:
+            self._merge_chunk(db, pending_merges)
+
+    def _merge_chunk(self, db: Session, chunk: List[dict]) -> None:
+        """중복된 기존 대상자의 상세를 업로드 값으로 갱신"""
+        table = Participant.__table__
+        stmt = (
+            update(table)
+            .where(func.lower(func.btrim(table.c.name)) == bindparam("name_key"))
+            .where(func.lower(func.btrim(table.c.email)) == bindparam("email_key"))
+            .values(description=bindparam("new_description"), updated_at=func.now())
+        )
+        db.execute(stmt, [
+            {
+                "name_key": data["name"].strip(" ").lower(),
+                "email_key": data["email"].strip(" ").lower(),
+                "new_description": data["description"],
+            }
+            for data in chunk
+        ])
+
+    def _bulk_insert_participants(self, db: Session, rows: Iterable[dict], upload_file_id: Optional[int],
+                                  progress_callback: Optional[Callable[[int], None]] = None) -> int:
+        """검증된 행을 IMPORT_CHUNK_SIZE 단위로 나눠 일괄 INSERT (커밋은 호출자가 담당)"""
+        total = 0
+        for chunk in self._chunked(rows, IMPORT_CHUNK_SIZE):
+            for data in chunk:
+                data["upload_file_id"] = upload_file_id
+            self._insert_chunk(db, chunk)
+            total += len(chunk)
+            if progress_callback:
+                progress_callback(total)
+            else:
+                print(f"[Participant Import] {total}명 처리됨")
+        return total
+
+    def _insert_chunk(self, db: Session, chunk: List[dict]) -> None:
+        """PostgreSQL이면 COPY, 그 외에는 executemany로 INSERT"""
+        if db.get_bind().dialect.name != "postgresql":
+            db.execute(insert(Participant), chunk)
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for data in chunk:
+            writer.writerow([data["name"], data["email"], data["description"], data["upload_file_id"]])
+        buffer.seek(0)
+
+        # 세션과 같은 트랜잭션의 DBAPI 커넥션에서 COPY 실행 (ORM 이벤트가 없으므로 변경 테이블 직접 기록)
+        mark_tables_changed(db, Participant.__tablename__)
+        copy_sql = "COPY participants (name, email, description, upload_file_id) FROM STDIN WITH (FORMAT csv)"
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(copy_sql, buffer)
+        except db.get_bind().dialect.dbapi.IntegrityError as e:
+            # DBAPI 커서를 직접 쓰므로 SQLAlchemy 예외로 감싸 호출자가 execute 경로와 같이 처리하도록 함
+            raise IntegrityError(copy_sql, None, e) from e
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _chunked(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+        chunk: List[dict] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def select_random_winners(self, db: Session, count: int, seed: Optional[int] = None) -> Tuple[List[Participant], int]:
+        """랜덤 당첨자 선정 (id 배열만으로 추첨 후 당첨자 행만 조회, 같은 seed면 같은 결과)"""
+        # id 순서로 정렬해 같은 대상자 집합 + 같은 seed에서 결과가 재현되도록 함
+        ids = array("q", db.execute(select(Participant.id).order_by(Participant.id)).scalars())
+        if len(ids) < count:
+            raise HTTPException(400, f"대상자 수({len(ids)})가 선정 수({count})보다 적습니다.")
+
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(SEED_BITS)
+        picked = [ids[i] for i in random.Random(seed).sample(range(len(ids)), count)]
+
+        by_id = {p.id: p for p in db.query(Participant).filter(Participant.id.in_(picked)).all()}
+        return [by_id[pid] for pid in picked], seed
 
     def bulk_delete_participants(self, db: Session, ids: List[int]) -> int:
         """일괄 삭제"""
@@ -214,3 +476,22 @@ class ParticipantService:
 
 # ✅ 인스턴스화 (DI 용)
 participant_service = ParticipantService()
+
+
+def _load_participant_stats() -> dict:
+    db = SessionLocal()
+    try:
+        return participant_service.get_participant_stats(db)
+    finally:
+        db.close()
+
+
+# 공개 홈 통계용 스냅샷 (대상자 수에 관계없이 TTL 동안 쿼리 없이 응답)
+participant_stats_snapshot = CachedSnapshot(
+    _load_participant_stats, settings.HOME_STATS_CACHE_SECONDS, name="Participant Stats"
+)
+invalidate_on_commit(participant_stats_snapshot, Participant.__tablename__)
+
+# 관리자 대상자 목록 total (필터 조합별 캐시, 업로드/수정 커밋 시 무효화)
+participant_counter = TableCounter(Participant.__tablename__)
+invalidate_on_commit(participant_counter, Participant.__tablename__)
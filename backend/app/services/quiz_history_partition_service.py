@@ -0,0 +1,284 @@
+import gzip
+import os
+import re
+import threading
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import case, literal_column, select, text, union_all
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.models.quiz import UserQuizHistory, UserQuizHistoryRollup
+
+PARENT_TABLE = UserQuizHistory.__tablename__
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+ROLLUP_TABLE = UserQuizHistoryRollup.__tablename__
+# 보관 파일(CSV) 컬럼 순서 — 복원 시 같은 순서로 읽음
+ARCHIVE_COLUMNS = ("id", "user_id", "question_id", "bundle_id", "user_answer", "is_correct", "solved_at")
+ARCHIVE_SUFFIX = ".csv.gz"
+# 여러 워커가 동시에 파티션을 만들지 않도록 잡는 advisory lock 키
+PARTITION_LOCK_KEY = 48_050_001
+
+_PARTITION_NAME_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$")
+
+ROLLUP_INSERT_SQL = """
+INSERT INTO {rollup} (month, user_id, question_id, bundle_id, attempts, correct)
+SELECT :month, user_id, question_id, bundle_id, count(*), count(*) FILTER (WHERE is_correct)
+FROM {partition}
+GROUP BY user_id, question_id, bundle_id
+"""
+
+PARTITIONS_SQL = text(
+    """
+    SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound, c.reltuples::bigint AS rows
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass(:parent)
+    ORDER BY c.relname
+    """
+)
+
+
+class PartitionInfo(NamedTuple):
+    name: str
+    # 월 파티션의 시작일 (기본 파티션은 None)
+    month: Optional[date]
+    bound: str
+    # 플래너 통계 기준 행 수 (ANALYZE 전이면 -1 또는 0)
+    rows: int
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+def parse_partition_month(name: str) -> Optional[date]:
+    """user_quiz_history_p202610(.csv.gz) → 2026-10-01"""
+    if name.endswith(ARCHIVE_SUFFIX):
+        name = name[: -len(ARCHIVE_SUFFIX)]
+    match = _PARTITION_NAME_RE.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+def _current_month() -> date:
+    # solved_at은 UTC naive (datetime.utcnow)
+    return month_start(datetime.utcnow().date())
+
+
+def _bounds(month: date) -> str:
+    return f"FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+
+
+def _exists(db: Session, name: str) -> bool:
+    return db.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+
+
+# -------------------------------
+# 통계용 조회 소스
+# -------------------------------
+def history_stats_source():
+    """
+    통계 집계용 풀이 기록 (user_id, question_id, bundle_id, attempts, correct)
+
+    파티션에 남아 있는 기록(1행 = 1회) + 보관된 월의 집계(user_quiz_history_rollups)를 UNION ALL.
+    sum(attempts) / sum(correct)로 집계하면 보관 여부와 관계없이 같은 결과가 나옴.
+    """
+    live = select(
+        UserQuizHistory.user_id,
+        UserQuizHistory.question_id,
+        UserQuizHistory.bundle_id,
+        literal_column("1").label("attempts"),
+        case((UserQuizHistory.is_correct.is_(True), 1), else_=0).label("correct"),
+    )
+    archived = select(
+        UserQuizHistoryRollup.user_id,
+        UserQuizHistoryRollup.question_id,
+        UserQuizHistoryRollup.bundle_id,
+        UserQuizHistoryRollup.attempts,
+        UserQuizHistoryRollup.correct,
+    )
+    return union_all(live, archived).subquery("quiz_history_stats")
+
+
+class QuizHistoryPartitions:
+    """
+    user_quiz_history 월 단위 range 파티션 관리 (solved_at 기준)
+
+    - 이번 달부터 QUIZ_HISTORY_PARTITION_MONTHS_AHEAD개월 뒤까지 파티션을 미리 생성
+      (백그라운드 스레드가 QUIZ_HISTORY_PARTITION_CHECK_SECONDS마다 확인, 기본 파티션이 빈틈을 받아줌)
+    - 오래된 파티션은 집계를 user_quiz_history_rollups에 남기고 분리(DETACH) → CSV.gz 보관 → 삭제
+    - 보관 파일은 restore_partition으로 다시 붙일 수 있음 (해당 월 집계는 원본으로 대체)
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quiz-history-partitions", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        # 배포 시 마이그레이션이 앞으로의 파티션을 만들어 두므로 시작 직후에는 DDL을 실행하지 않음
+        while not self._stop.wait(max(settings.QUIZ_HISTORY_PARTITION_CHECK_SECONDS, 60)):
+            db = SessionLocal()
+            try:
+                created = self.ensure_partitions(db)
+                if created:
+                    print(f"[Quiz History] 월 파티션 생성: {', '.join(created)}")
+            except Exception as e:
+                db.rollback()
+                print(f"[Quiz History] 파티션 생성 실패: {e}")
+            finally:
+                db.close()
+
+    # -------------------------------
+    # 조회
+    # -------------------------------
+    def list_partitions(self, db: Session) -> List[PartitionInfo]:
+        rows = db.execute(PARTITIONS_SQL, {"parent": PARENT_TABLE}).all()
+        return [PartitionInfo(row.name, parse_partition_month(row.name), row.bound, int(row.rows)) for row in rows]
+
+    def missing_months(self, db: Session, months_ahead: Optional[int] = None, months_back: int = 0) -> List[date]:
+        """아직 파티션이 없는 (이번 달 - months_back) ~ (이번 달 + months_ahead) 월"""
+        if months_ahead is None:
+            months_ahead = settings.QUIZ_HISTORY_PARTITION_MONTHS_AHEAD
+        current = _current_month()
+        months = [add_months(current, offset) for offset in range(-months_back, months_ahead + 1)]
+        return [month for month in months if not _exists(db, partition_name(month))]
+
+    # -------------------------------
+    # 파티션 생성
+    # -------------------------------
+    def ensure_partitions(self, db: Session, months_ahead: Optional[int] = None, months_back: int = 0) -> List[str]:
+        """없는 월 파티션을 만들고 생성한 이름 목록 반환 (다른 워커가 작업 중이면 건너뜀)"""
+        if not db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY}).scalar():
+            db.rollback()
+            return []
+
+        created = []
+        for month in self.missing_months(db, months_ahead, months_back):
+            self._create_partition(db, month)
+            created.append(partition_name(month))
+        db.commit()
+        return created
+
+    def _create_partition(self, db: Session, month: date) -> None:
+        name = partition_name(month)
+        params = {"lower": month, "upper": add_months(month, 1)}
+        stray = _exists(db, DEFAULT_PARTITION) and db.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE solved_at >= :lower AND solved_at < :upper)"),
+            params,
+        ).scalar()
+
+        if not stray:
+            db.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} FOR VALUES {_bounds(month)}"))
+            return
+
+        # 기본 파티션에 해당 월 행이 있으면 새 파티션을 바로 만들 수 없으므로 옮긴 뒤 붙임
+        db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE solved_at >= :lower AND solved_at < :upper "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            ),
+            params,
+        )
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES {_bounds(month)}"))
+
+    # -------------------------------
+    # 보관 / 복원
+    # -------------------------------
+    def archive_partition(self, db: Session, month: date, directory: Optional[str] = None) -> str:
+        """
+        월 파티션을 보관 파일(<directory>/<파티션명>.csv.gz)로 내리고 테이블을 삭제. 파일 경로 반환.
+        분리까지 끝났지만 파일 저장 전에 실패한 파티션은 다시 호출하면 저장부터 이어서 진행.
+        """
+        month = month_start(month)
+        name = partition_name(month)
+        if month >= _current_month():
+            raise ValueError("이번 달 이후 파티션은 보관할 수 없습니다.")
+        if not _exists(db, name):
+            raise ValueError(f"{name} 파티션이 없습니다.")
+
+        directory = directory or settings.QUIZ_HISTORY_ARCHIVE_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}{ARCHIVE_SUFFIX}")
+
+        if name in {partition.name for partition in self.list_partitions(db)}:
+            # 집계 보존 + 분리를 한 트랜잭션으로 (통계에서 이중 집계/누락이 생기지 않도록)
+            db.execute(text(ROLLUP_INSERT_SQL.format(rollup=ROLLUP_TABLE, partition=name)), {"month": month})
+            db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            db.commit()
+
+        expected = db.execute(text(f"SELECT count(*) FROM {name}")).scalar()
+        copied = self._dump(db, name, path)
+        if copied != expected:
+            db.rollback()
+            raise RuntimeError(f"{name} 보관 행 수 불일치 (테이블 {expected}건, 파일 {copied}건) — 테이블은 삭제하지 않았습니다.")
+
+        db.execute(text(f"DROP TABLE {name}"))
+        db.commit()
+        return path
+
+    def restore_partition(self, db: Session, path: str) -> str:
+        """보관 파일을 다시 월 파티션으로 붙이고 해당 월 집계 행을 삭제. 파티션명 반환."""
+        month = parse_partition_month(os.path.basename(path))
+        if month is None:
+            raise ValueError(f"보관 파일 이름이 올바르지 않습니다: {path}")
+        name = partition_name(month)
+        if _exists(db, name):
+            raise ValueError(f"{name} 테이블이 이미 있습니다.")
+
+        columns = ", ".join(ARCHIVE_COLUMNS)
+        db.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        cursor = db.connection().connection.cursor()
+        with gzip.open(path, "rb") as f:
+            cursor.copy_expert(f"COPY {name} ({columns}) FROM STDIN WITH (FORMAT csv, HEADER true)", f)
+
+        # 보관 이후 삭제된 회원/문제/테마형은 FK(CASCADE / SET NULL)와 같은 결과가 되도록 정리
+        db.execute(text(f"DELETE FROM {name} h WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.id = h.user_id)"))
+        db.execute(text(f"DELETE FROM {name} h WHERE NOT EXISTS (SELECT 1 FROM questions q WHERE q.id = h.question_id)"))
+        db.execute(
+            text(
+                f"UPDATE {name} h SET bundle_id = NULL WHERE bundle_id IS NOT NULL "
+                f"AND NOT EXISTS (SELECT 1 FROM quiz_bundles b WHERE b.id = h.bundle_id)"
+            )
+        )
+        db.execute(text(f"DELETE FROM {ROLLUP_TABLE} WHERE month = :month"), {"month": month})
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES {_bounds(month)}"))
+        db.commit()
+        return name
+
+    def _dump(self, db: Session, name: str, path: str) -> int:
+        """COPY TO로 gzip CSV 저장 (임시 파일에 쓴 뒤 이름 변경), 저장한 행 수 반환"""
+        columns = ", ".join(ARCHIVE_COLUMNS)
+        tmp_path = f"{path}.tmp"
+        cursor = db.connection().connection.cursor()
+        with gzip.open(tmp_path, "wb") as f:
+            cursor.copy_expert(f"COPY {name} ({columns}) TO STDOUT WITH (FORMAT csv, HEADER true)", f)
+        os.replace(tmp_path, path)
+        return cursor.rowcount
+
+
+quiz_history_partitions = QuizHistoryPartitions()
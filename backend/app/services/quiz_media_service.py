@@ -1,9 +1,10 @@
 import os
 import secrets
-import asyncio
+import shutil
 from datetime import datetime
 
 from fastapi import HTTPException, UploadFile, status
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 from app.services.google_drive_service import google_drive_service
@@ -22,12 +23,15 @@ async def save_question_image(file: UploadFile) -> str:
             detail="허용되지 않은 이미지 형식입니다. (jpg, jpeg, png, gif, webp)",
         )
 
-    contents = await file.read()
-    if not contents:
+    # 내용을 메모리로 읽지 않고 업로드 임시 파일의 크기만 확인
+    file.file.seek(0, os.SEEK_END)
+    file_size = file.file.tell()
+    file.file.seek(0)
+    if not file_size:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
 
     max_bytes = settings.MAX_QUIZ_IMAGE_SIZE_MB * 1024 * 1024
-    if len(contents) > max_bytes:
+    if file_size > max_bytes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"이미지 크기가 너무 큽니다. 최대 {settings.MAX_QUIZ_IMAGE_SIZE_MB}MB까지 가능합니다.",
@@ -47,17 +51,12 @@ async def save_question_image(file: UploadFile) -> str:
     drive_folder_id = settings.GOOGLE_DRIVE_FOLDER_ID_QUIZ_IMAGE
     if drive_folder_id:
         try:
-            loop = asyncio.get_running_loop()
-
-            def _upload():
-                return google_drive_service.upload_file(
-                    file_content=contents,
-                    filename=unique_name,
-                    mime_type=mime_type,
-                    folder_id=drive_folder_id,
-                )
-
-            drive_result = await loop.run_in_executor(None, _upload)
+            drive_result = await google_drive_service.upload_file_async(
+                file.file,
+                filename=unique_name,
+                mime_type=mime_type,
+                folder_id=drive_folder_id,
+            )
             file_id = drive_result.get("file_id")
             if file_id:
                 return f"https://lh3.googleusercontent.com/d/{file_id}"
@@ -78,8 +77,12 @@ async def save_question_image(file: UploadFile) -> str:
 
     absolute_path = os.path.join(absolute_dir, unique_name)
 
-    with open(absolute_path, "wb") as buffer:
-        buffer.write(contents)
+    def _save():
+        file.file.seek(0)
+        with open(absolute_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+
+    await run_in_threadpool(_save)
 
     return "/".join(
         [
@@ -19,6 +19,7 @@ from app.models.quiz import (
     Topic,
     UserQuizBundleProgress,
     UserQuizHistory,
+    UserQuizHistoryRollup,
 )
 from app.models.user_model import User
 from app.schemas.quiz_schema import (
@@ -49,6 +50,7 @@ from app.schemas.quiz_schema import (
     BundleUserPerformanceStat,
     QuizAdminStatsResponse,
 )
+from app.services.quiz_history_partition_service import history_stats_source
 
 
 def _resolve_question_type(value: QuizType | str) -> QuestionType:
@@ -536,6 +538,12 @@ def reset_user_bundle_progress(
         UserQuizHistory.bundle_id == bundle_id,
     ).delete(synchronize_session=False)
 
+    # 보관된 월의 기록도 통계에서 빠지도록 집계 행 삭제
+    db.query(UserQuizHistoryRollup).filter(
+        UserQuizHistoryRollup.user_id == user_id,
+        UserQuizHistoryRollup.bundle_id == bundle_id,
+    ).delete(synchronize_session=False)
+
     db.query(UserQuizBundleProgress).filter(
         UserQuizBundleProgress.user_id == user_id,
         UserQuizBundleProgress.bundle_id == bundle_id,
@@ -707,19 +715,17 @@ def get_admin_quiz_statistics(
     bundle_page: int = 1,
     bundle_user_page: int = 1,
 ) -> QuizAdminStatsResponse:
+    # 풀이 기록 (보관된 월은 집계 테이블에서 함께 합산)
+    stats = history_stats_source()
+
     # 문제별 오답률 높은 순 정렬
     question_query = (
         db.query(
             Question,
-            func.count(UserQuizHistory.id).label("total_attempts"),
-            func.sum(
-                case(
-                    (UserQuizHistory.is_correct.is_(True), 1),
-                    else_=0,
-                )
-            ).label("correct_count"),
+            func.sum(stats.c.attempts).label("total_attempts"),
+            func.sum(stats.c.correct).label("correct_count"),
         )
-        .join(UserQuizHistory, UserQuizHistory.question_id == Question.id)
+        .join(stats, stats.c.question_id == Question.id)
         .options(selectinload(Question.topics))
     )
 
@@ -734,7 +740,7 @@ def get_admin_quiz_statistics(
 
     question_rows = (
         question_query.group_by(Question.id)
-        .having(func.count(UserQuizHistory.id) > 0)
+        .having(func.sum(stats.c.attempts) > 0)
         .all()
     )
 
@@ -829,16 +835,11 @@ def get_admin_quiz_statistics(
     # 사용자 성과 통계
     history_rows = (
         db.query(
-            UserQuizHistory.user_id.label("user_id"),
-            func.count(UserQuizHistory.id).label("attempts"),
-            func.sum(
-                case(
-                    (UserQuizHistory.is_correct.is_(True), 1),
-                    else_=0,
-                )
-            ).label("correct"),
+            stats.c.user_id.label("user_id"),
+            func.sum(stats.c.attempts).label("attempts"),
+            func.sum(stats.c.correct).label("correct"),
         )
-        .group_by(UserQuizHistory.user_id)
+        .group_by(stats.c.user_id)
         .all()
     )
 
@@ -868,18 +869,13 @@ def get_admin_quiz_statistics(
 
     bundle_user_rows = (
         db.query(
-            UserQuizHistory.bundle_id.label("bundle_id"),
-            UserQuizHistory.user_id.label("user_id"),
-            func.count(UserQuizHistory.id).label("attempts"),
-            func.sum(
-                case(
-                    (UserQuizHistory.is_correct.is_(True), 1),
-                    else_=0,
-                )
-            ).label("correct"),
+            stats.c.bundle_id.label("bundle_id"),
+            stats.c.user_id.label("user_id"),
+            func.sum(stats.c.attempts).label("attempts"),
+            func.sum(stats.c.correct).label("correct"),
         )
-        .filter(UserQuizHistory.bundle_id.isnot(None))
-        .group_by(UserQuizHistory.bundle_id, UserQuizHistory.user_id)
+        .filter(stats.c.bundle_id.isnot(None))
+        .group_by(stats.c.bundle_id, stats.c.user_id)
         .all()
     )
 
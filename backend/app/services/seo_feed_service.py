@@ -0,0 +1,229 @@
+# app/services/seo_feed_service.py
+import itertools
+import math
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+from xml.sax.saxutils import escape
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.models import FAQ, Notice
+from app.utils.cache import CachedSnapshot, invalidate_on_commit
+from app.utils.html_text import build_excerpt
+from app.utils.http_cache import RenderedDocument
+
+# sitemaps.org 프로토콜: 파일당 최대 50,000개 URL (50MB 제한은 URL 길이상 먼저 도달하지 않음)
+SITEMAP_MAX_URLS = 50000
+RSS_ITEM_COUNT = 20
+# 사이트맵 생성 시 한 번에 가져올 행 수
+FEED_BATCH_SIZE = 1000
+
+SITEMAP_KEY = "sitemap"
+RSS_KEY = "rss"
+
+
+class SitemapUrl(NamedTuple):
+    loc: str
+    lastmod: Optional[datetime]
+    changefreq: str
+    priority: str
+
+
+def _cdata(value: str) -> str:
+    return "<![CDATA[" + (value or "").replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+def _published_notice_filter():
+    return (Notice.is_deleted == False, Notice.publish_status == "published")
+
+
+def _active_faq_filter():
+    return (FAQ.is_active == True,)
+
+
+class SeoFeedService:
+    """
+    sitemap.xml / rss.xml 생성 및 캐시
+
+    - 필요한 컬럼만 배치 단위로 읽어 generator로 XML을 만들고, 렌더링 결과(bytes)를 문서별로 캐시
+    - 공지/FAQ가 바뀌는 트랜잭션이 커밋되면 전체 무효화 (조회수만 바뀐 경우 제외)
+    - URL이 SITEMAP_MAX_URLS를 넘으면 /sitemap.xml은 sitemap index, 실제 URL은 /sitemaps/sitemap-N.xml
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, CachedSnapshot] = {}
+        self._previous: Dict[str, RenderedDocument] = {}
+        self._page_count = 1
+
+    # -------------------------------
+    # 캐시
+    # -------------------------------
+    def get_sitemap(self) -> RenderedDocument:
+        return self._snapshot(SITEMAP_KEY, self._render_sitemap).get()
+
+    def get_sitemap_page(self, page: int) -> Optional[RenderedDocument]:
+        """sitemap index의 N번째 페이지 (범위 밖이면 None)"""
+        self.get_sitemap()  # 페이지 수 갱신
+        if page < 1 or page > self._page_count or self._page_count == 1:
+            return None
+        return self._snapshot(f"{SITEMAP_KEY}-{page}", lambda db: self._render_sitemap_page(db, page)).get()
+
+    def get_rss(self) -> RenderedDocument:
+        return self._snapshot(RSS_KEY, self._render_rss).get()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+        for snapshot in snapshots:
+            snapshot.invalidate()
+
+    def _snapshot(self, key: str, render: Callable[[Session], str]) -> CachedSnapshot:
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = CachedSnapshot(
+                    lambda: self._load(key, render), settings.SEO_FEED_CACHE_SECONDS, name=f"SEO Feed {key}"
+                )
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def _load(self, key: str, render: Callable[[Session], str]) -> RenderedDocument:
+        db = SessionLocal()
+        try:
+            body = render(db).encode("utf-8")
+        finally:
+            db.close()
+        document = RenderedDocument.build(body, self._previous.get(key))
+        self._previous[key] = document
+        return document
+
+    # -------------------------------
+    # sitemap
+    # -------------------------------
+    def _count_urls(self, db: Session) -> int:
+        notice_count = db.scalar(select(func.count(Notice.id)).where(*_published_notice_filter()))
+        faq_count = db.scalar(select(func.count(FAQ.id)).where(*_active_faq_filter()))
+        return len(self._static_urls()) + notice_count + faq_count
+
+    @staticmethod
+    def _static_urls():
+        base_url = settings.FRONTEND_URL
+        return [
+            SitemapUrl(f"{base_url}/", None, "daily", "1.0"),
+            SitemapUrl(f"{base_url}/client/notice", None, "daily", "0.9"),
+            SitemapUrl(f"{base_url}/client/faq", None, "weekly", "0.8"),
+        ]
+
+    def _iter_urls(self, db: Session) -> Iterator[SitemapUrl]:
+        base_url = settings.FRONTEND_URL
+        yield from self._static_urls()
+
+        notices = (
+            select(Notice.id, Notice.updated_at, Notice.created_at)
+            .where(*_published_notice_filter())
+            .order_by(Notice.id)
+            .execution_options(yield_per=FEED_BATCH_SIZE)
+        )
+        for notice_id, updated_at, created_at in db.execute(notices):
+            yield SitemapUrl(f"{base_url}/client/notice/{notice_id}", updated_at or created_at, "weekly", "0.7")
+
+        faqs = (
+            select(FAQ.id, FAQ.updated_at, FAQ.created_at)
+            .where(*_active_faq_filter())
+            .order_by(FAQ.id)
+            .execution_options(yield_per=FEED_BATCH_SIZE)
+        )
+        for faq_id, updated_at, created_at in db.execute(faqs):
+            yield SitemapUrl(f"{base_url}/client/faq/{faq_id}", updated_at or created_at, "monthly", "0.6")
+
+    @staticmethod
+    def _iter_urlset_xml(urls) -> Iterator[str]:
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for url in urls:
+            lastmod = f"    <lastmod>{url.lastmod.strftime('%Y-%m-%d')}</lastmod>\n" if url.lastmod else ""
+            yield (
+                "  <url>\n"
+                f"    <loc>{escape(url.loc)}</loc>\n"
+                f"{lastmod}"
+                f"    <changefreq>{url.changefreq}</changefreq>\n"
+                f"    <priority>{url.priority}</priority>\n"
+                "  </url>\n"
+            )
+        yield "</urlset>"
+
+    @staticmethod
+    def _iter_index_xml(page_count: int) -> Iterator[str]:
+        base_url = settings.FRONTEND_URL
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for page in range(1, page_count + 1):
+            yield (
+                "  <sitemap>\n"
+                f"    <loc>{escape(f'{base_url}/sitemaps/sitemap-{page}.xml')}</loc>\n"
+                f"    <lastmod>{today}</lastmod>\n"
+                "  </sitemap>\n"
+            )
+        yield "</sitemapindex>"
+
+    def _render_sitemap(self, db: Session) -> str:
+        page_count = max(math.ceil(self._count_urls(db) / SITEMAP_MAX_URLS), 1)
+        self._page_count = page_count
+        if page_count == 1:
+            return "".join(self._iter_urlset_xml(self._iter_urls(db)))
+        return "".join(self._iter_index_xml(page_count))
+
+    def _render_sitemap_page(self, db: Session, page: int) -> str:
+        start = (page - 1) * SITEMAP_MAX_URLS
+        urls = itertools.islice(self._iter_urls(db), start, start + SITEMAP_MAX_URLS)
+        return "".join(self._iter_urlset_xml(urls))
+
+    # -------------------------------
+    # RSS
+    # -------------------------------
+    def _render_rss(self, db: Session) -> str:
+        base_url = settings.FRONTEND_URL
+        # 저장된 요약을 쓰고, 아직 백필되지 않은 행만 본문을 함께 읽어 즉석 계산
+        rows = db.execute(
+            select(
+                Notice.id,
+                Notice.title,
+                Notice.excerpt,
+                case((Notice.excerpt.is_(None), Notice.content), else_=None),
+                Notice.created_at,
+            )
+            .where(*_published_notice_filter())
+            .order_by(Notice.created_at.desc())
+            .limit(RSS_ITEM_COUNT)
+        )
+
+        def iter_rss() -> Iterator[str]:
+            yield (
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<rss version="2.0">\n'
+                "  <channel>\n"
+                "    <title>강민성 한국사 - 공지사항</title>\n"
+                f"    <link>{escape(base_url)}/client/notice</link>\n"
+                "    <description>최신 공지사항과 소식</description>\n"
+            )
+            for notice_id, title, excerpt, content, created_at in rows:
+                description = excerpt if excerpt is not None else build_excerpt(content)[0]
+                yield (
+                    "    <item>\n"
+                    f"      <title>{_cdata(title)}</title>\n"
+                    f"      <link>{escape(base_url)}/client/notice/{notice_id}</link>\n"
+                    f"      <description>{_cdata(description)}</description>\n"
+                    f'      <pubDate>{created_at.strftime("%a, %d %b %Y %H:%M:%S +0900")}</pubDate>\n'
+                    "    </item>\n"
+                )
+            yield "  </channel>\n</rss>"
+
+        return "".join(iter_rss())
+
+
+seo_feed_service = SeoFeedService()
+invalidate_on_commit(seo_feed_service, Notice.__tablename__, FAQ.__tablename__, ignore_columns=("views",))
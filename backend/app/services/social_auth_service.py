@@ -2,7 +2,10 @@ from google_auth_oauthlib.flow import Flow
 from fastapi import HTTPException
 from app.config import settings
 import os
-import httpx
+from app.utils.http_client import shared_http_client
+
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
 # 클라이언트(일반 유저) 구글 로그인용 스코프 (openid, 이메일, 프로필)
 CLIENT_LOGIN_SCOPES = [
@@ -156,25 +159,39 @@ def decode_agreement_from_state(state: str | None) -> dict | None:
     return _decode_agreement_state(state)
 
 
-def exchange_google_code_for_userinfo(code: str) -> dict:
+async def exchange_google_code_for_userinfo(code: str) -> dict:
     """
-    인증 코드로 토큰 교환 후 Google userinfo 조회.
+    인증 코드로 토큰 교환 후 Google userinfo 조회 (공유 AsyncClient 사용, 이벤트 루프 비차단).
     Returns: {"email": str, "name": str, "picture": str | None}
     """
     redirect_uri = get_google_client_login_redirect_uri()
-    flow = create_google_flow(redirect_uri=redirect_uri, scopes=CLIENT_LOGIN_SCOPES)
-    flow.fetch_token(code=code)
-    credentials = flow.credentials
+
+    token_resp = await shared_http_client.request(
+        "google",
+        "POST",
+        GOOGLE_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "redirect_uri": redirect_uri,
+            "code": code,
+        },
+    )
+    token_resp.raise_for_status()
+    access_token = token_resp.json().get("access_token")
+    if not access_token:
+        raise HTTPException(status_code=400, detail="Google 토큰 발급 실패")
 
     # userinfo 요청
-    with httpx.Client() as client:
-        resp = client.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {credentials.token}"},
-            timeout=10.0,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await shared_http_client.request(
+        "google",
+        "GET",
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     return {
         "email": (data.get("email") or "").strip(),
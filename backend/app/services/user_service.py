@@ -6,6 +6,32 @@ from datetime import datetime, timedelta
 import re
 from app.models import User
 from app.schemas import PageResponse
+from app.utils.cache import invalidate_on_commit
+from app.utils.counting import TableCounter
+from app.utils.pagination import SortKey, paginate
+from app.utils.search import (
+    SEARCH_SCORE_LABEL,
+    is_substring_search,
+    normalize_search_term,
+    relevance,
+    relevance_sort,
+    text_match,
+)
+
+# 관리자 사용자 목록 정렬 (최신 가입순, keyset 커서 기준)
+USER_ADMIN_SORT = (SortKey(User.created_at), SortKey(User.id))
+
+# 관리자 사용자 목록 total (필터 조합별 캐시, 필터에 쓰이지 않는 컬럼만 바뀐 UPDATE는 무효화하지 않음)
+# 목록은 항상 탈퇴 회원(deleted_at)을 제외하므로 탈퇴 회원까지 세는 테이블 추정치(reltuples)는 쓰지 않음
+user_admin_counter = TableCounter(User.__tablename__, estimate=False)
+invalidate_on_commit(
+    user_admin_counter,
+    User.__tablename__,
+    ignore_columns=(
+        "password_hash", "is_email_verified", "nickname_deactivated_at", "blocked_at", "blocked_reason",
+        "agree_terms", "agree_privacy", "agree_collection", "agree_marketing",
+    ),
+)
 
 # =========================
 # 조회 유틸 (회원가입/검증 재사용)
@@ -36,6 +62,10 @@ def get_user_by_nickname_for_registration(db: Session, nickname: str):
 # 관리자 목록/상세/수정/삭제
 # =========================
 
+def _user_search_filter(term: str):
+    """이메일/닉네임 검색 (3글자 이상 부분 일치는 pg_trgm, 짧은 검색어는 prefix)"""
+    return or_(text_match(User.email, term), text_match(User.nickname, term))
+
 # --- UPDATED: 필터 확장 (q, role, is_active, status) + 페이지 응답 ---
 def list_users_admin(
     db: Session,
@@ -44,12 +74,14 @@ def list_users_admin(
     q: str | None = None,
     role: str | None = None,
     is_active: str | None = None,
-    status: str | None = None
+    status: str | None = None,
+    cursor: str | None = None,
 ):
     query = db.query(User).filter(User.deleted_at.is_(None))  # 백오피스 기본: 삭제 숨김
 
+    q = normalize_search_term(q)
     if q:
-        query = query.filter(or_(User.email.contains(q), User.nickname.contains(q)))
+        query = query.filter(_user_search_filter(q))
 
     if role:
         query = query.filter(User.role == role)
@@ -65,9 +97,22 @@ def list_users_admin(
         elif status == "blocked":
             query = query.filter(User.is_blocked == True)
 
-    total = query.count()
-    items = query.order_by(User.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
-    return PageResponse.create(items=items, total=total, page=page, limit=limit)
+    count = lambda: user_admin_counter.count(db, query, (q, role, is_active, status))
+    if q and is_substring_search(q):
+        # 부분 일치 검색은 유사도 순 (이메일/닉네임 중 더 비슷한 쪽 기준)
+        score = relevance((User.email, User.nickname), q)
+        result = paginate(
+            query.add_columns(score.label(SEARCH_SCORE_LABEL)), relevance_sort(User, score),
+            limit, (page - 1) * limit, cursor, count=count,
+        )
+        items = [row.User for row in result.items]
+    else:
+        result = paginate(query, USER_ADMIN_SORT, limit, (page - 1) * limit, cursor, count=count)
+        items = result.items
+    return PageResponse.create(
+        items=items, total=result.total, page=page, limit=limit,
+        next_cursor=result.next_cursor, total_exact=result.total_exact,
+    )
 
 # --- NEW: 총 카운트 전용 ---
 def count_users_admin(
@@ -79,8 +124,9 @@ def count_users_admin(
 ):
     query = db.query(User).filter(User.deleted_at.is_(None))
 
+    q = normalize_search_term(q)
     if q:
-        query = query.filter(or_(User.email.contains(q), User.nickname.contains(q)))
+        query = query.filter(_user_search_filter(q))
     if role:
         query = query.filter(User.role == role)
     if is_active is not None:
@@ -92,7 +138,7 @@ def count_users_admin(
         elif status == "blocked":
             query = query.filter(User.is_blocked == True)
 
-    return query.count()
+    return user_admin_counter.count(db, query, (q, role, is_active, status))
 
 def get_user_admin(db: Session, user_id: int):
     user = db.query(User).filter(User.id == user_id).first()
@@ -1,8 +1,11 @@
 # Utils package
 from .default_terms import get_default_content
+from .html_text import html_to_text, build_excerpt
 from .auth import get_password_hash, verify_password, create_access_token, set_auth_cookie, clear_auth_cookie, get_current_user_from_cookie, get_current_user_optional
 __all__ = [
     "get_default_content",
+    "html_to_text",
+    "build_excerpt",
     "get_password_hash",
     "verify_password",
     "create_access_token",
@@ -0,0 +1,178 @@
+# app/utils/cache.py
+import itertools
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+_MISSING = object()
+
+
+class CachedSnapshot:
+    """
+    프로세스 내 단일 값 캐시 (stale-while-revalidate)
+
+    - TTL 이내: 캐시된 값을 그대로 반환
+    - TTL 경과: 이전 값을 바로 반환하고 백그라운드 스레드에서 loader로 갱신
+    - 최초 조회 또는 invalidate() 후: 호출한 요청에서 동기로 적재 (동시 요청은 한 번의 적재 결과를 기다려 함께 사용)
+
+    loader는 요청 세션과 무관하게 실행될 수 있으므로 DB가 필요하면 스스로 세션을 열어야 한다.
+    """
+
+    def __init__(self, loader: Callable[[], Any], ttl_seconds: float, name: str = "cache"):
+        self._loader = loader
+        self._ttl = ttl_seconds
+        self._name = name
+        self._lock = threading.Lock()
+        # 캐시가 비었을 때 동기 적재를 한 요청만 실행하도록 잡는 잠금
+        self._load_lock = threading.Lock()
+        self._value: Any = _MISSING
+        self._loaded_at = 0.0
+        self._refreshing = False
+        # invalidate() 이전에 시작된 적재 결과가 새 값을 덮어쓰지 않도록 구분
+        self._generation = 0
+
+    def get(self) -> Any:
+        with self._lock:
+            value = self._value
+            if value is not _MISSING:
+                if time.monotonic() - self._loaded_at < self._ttl:
+                    return value
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh_in_background, daemon=True).start()
+                return value
+        with self._load_lock:
+            # 기다리는 동안 다른 요청이 적재를 끝냈으면 그 값을 사용
+            with self._lock:
+                if self._value is not _MISSING:
+                    return self._value
+            return self.refresh()
+
+    def refresh(self) -> Any:
+        """loader를 실행해 캐시를 즉시 갱신하고 새 값을 반환"""
+        generation = self._generation
+        value = self._loader()
+        with self._lock:
+            if generation == self._generation:
+                self._value = value
+                self._loaded_at = time.monotonic()
+        return value
+
+    def invalidate(self) -> None:
+        """캐시를 비워 다음 조회에서 새로 적재하도록 함"""
+        with self._lock:
+            self._generation += 1
+            self._value = _MISSING
+            self._loaded_at = 0.0
+
+    @property
+    def age(self) -> Optional[float]:
+        """마지막 적재 후 경과 시간(초), 적재 전이면 None"""
+        if self._value is _MISSING:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            # 갱신 실패 시 이전 값을 계속 사용
+            print(f"[{self._name}] 백그라운드 갱신 실패: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+# -------------------------------
+# 테이블 변경 시 캐시 무효화
+# -------------------------------
+_CHANGED_TABLES_KEY = "changed_tables"
+# 테이블명 → [(snapshot, 무시할 컬럼)] ; 무시할 컬럼만 바뀐 UPDATE는 무효화하지 않음 (조회수 등)
+_table_subscribers: Dict[str, List[Tuple[Any, FrozenSet[str]]]] = defaultdict(list)
+_listeners_installed = False
+
+
+def invalidate_on_commit(snapshot: CachedSnapshot, *tables: str, ignore_columns: Iterable[str] = ()) -> None:
+    """지정한 테이블을 변경한 트랜잭션이 커밋되면 snapshot을 무효화 (invalidate()만 있으면 됨)"""
+    _install_session_listeners()
+    ignored = frozenset(ignore_columns)
+    for table in tables:
+        _table_subscribers[table].append((snapshot, ignored))
+
+
+def mark_tables_changed(session: Session, *tables: str) -> None:
+    """ORM 이벤트로 잡히지 않는 변경(COPY, raw SQL 등)을 현재 트랜잭션에 기록 (모든 컬럼 변경으로 취급)"""
+    changed = session.info.setdefault(_CHANGED_TABLES_KEY, {})
+    for table in tables:
+        changed[table] = None
+
+
+def _mark_columns_changed(session: Session, table: str, columns: Set[str]) -> None:
+    changed = session.info.setdefault(_CHANGED_TABLES_KEY, {})
+    if table in changed and changed[table] is None:
+        return
+    changed[table] = changed.get(table, set()) | columns
+
+
+def _install_session_listeners() -> None:
+    global _listeners_installed
+    if _listeners_installed:
+        return
+    event.listen(Session, "after_flush", _on_after_flush)
+    event.listen(Session, "do_orm_execute", _on_orm_execute)
+    event.listen(Session, "after_commit", _on_after_commit)
+    event.listen(Session, "after_rollback", _on_after_rollback)
+    _listeners_installed = True
+
+
+def _subscribed_table(obj) -> Optional[str]:
+    table = getattr(obj, "__table__", None)
+    if table is not None and table.name in _table_subscribers:
+        return table.name
+    return None
+
+
+def _on_after_flush(session: Session, flush_context) -> None:
+    # after_flush 시점에는 new/dirty/deleted와 속성 변경 이력이 아직 flush 이전 상태
+    for obj in itertools.chain(session.new, session.deleted):
+        table = _subscribed_table(obj)
+        if table:
+            mark_tables_changed(session, table)
+    for obj in session.dirty:
+        table = _subscribed_table(obj)
+        if not table:
+            continue
+        columns = {attr.key for attr in inspect(obj).attrs if attr.history.has_changes()}
+        if columns:
+            _mark_columns_changed(session, table, columns)
+
+
+def _on_orm_execute(orm_execute_state) -> None:
+    # query.update()/delete(), insert()/update()/delete() 구문 실행
+    statement = orm_execute_state.statement
+    if not getattr(statement, "is_dml", False):
+        return
+    table_name = getattr(getattr(statement, "table", None), "name", None)
+    if table_name in _table_subscribers:
+        mark_tables_changed(orm_execute_state.session, table_name)
+
+
+def _on_after_commit(session: Session) -> None:
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if not changed:
+        return
+    snapshots = {}
+    for table, columns in changed.items():
+        for snapshot, ignored in _table_subscribers.get(table, ()):
+            if columns is None or columns - ignored:
+                snapshots[id(snapshot)] = snapshot
+    for snapshot in snapshots.values():
+        snapshot.invalidate()
+
+
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_TABLES_KEY, None)
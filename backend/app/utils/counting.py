@@ -0,0 +1,89 @@
+# app/utils/counting.py
+import json
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+# 테이블별로 보관할 필터 조합 수 (검색어마다 키가 생기므로 상한을 둠)
+COUNT_CACHE_MAX_ENTRIES = 256
+
+RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+
+
+class CountResult(NamedTuple):
+    total: int
+    # False면 플래너 추정치 (화면에는 "약 N건"으로 표시)
+    exact: bool = True
+
+
+class TableCounter:
+    """
+    목록 total 계산 전략 (테이블 하나 단위)
+
+    - 필터 없는 전체 목록이고 테이블이 COUNT_ESTIMATE_MIN_ROWS 이상이면 플래너 추정치
+      (pg_class.reltuples, 한 번도 ANALYZE되지 않았으면 EXPLAIN의 Plan Rows)
+      단, 전체 목록에도 항상 조건이 붙는 테이블(soft delete 제외 등)은 estimate=False로 만들어
+      테이블 전체 행 수가 목록 total로 나가지 않게 함
+    - 그 외(작은 테이블, 필터/검색 조건이 있는 목록)는 정확한 count
+    - 결과는 필터 조합별로 COUNT_CACHE_SECONDS 동안 캐시하고,
+      테이블을 바꾼 트랜잭션이 커밋되면 전부 무효화 (invalidate_on_commit으로 등록)
+    """
+
+    def __init__(self, table_name: str, estimate: bool = True):
+        self._table_name = table_name
+        self._use_estimate = estimate
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, Tuple[CountResult, float]] = {}
+
+    def count(self, db: Session, query, filters: Tuple = ()) -> CountResult:
+        """filters: 목록에 적용한 필터 값들 (캐시 키, 모두 비어 있으면 전체 목록으로 취급)"""
+        key = tuple(filters)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached and time.monotonic() - cached[1] < settings.COUNT_CACHE_SECONDS:
+            return cached[0]
+
+        result = None
+        if self._use_estimate and not any(value not in (None, "") for value in key):
+            estimate = self._estimate(db)
+            if estimate is not None and estimate >= settings.COUNT_ESTIMATE_MIN_ROWS:
+                result = CountResult(estimate, exact=False)
+        if result is None:
+            result = CountResult(query.order_by(None).count())
+
+        with self._lock:
+            if len(self._entries) >= COUNT_CACHE_MAX_ENTRIES:
+                # 가장 오래 전에 계산한 항목부터 제거
+                self._entries.pop(min(self._entries, key=lambda k: self._entries[k][1]))
+            self._entries[key] = (result, time.monotonic())
+        return result
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _estimate(self, db: Session) -> Optional[int]:
+        """PostgreSQL 플래너 통계 기반 행 수 (다른 DB거나 통계를 얻지 못하면 None)"""
+        bind = db.get_bind()
+        if bind.dialect.name != "postgresql":
+            return None
+        try:
+            # 실패해도 요청 트랜잭션이 abort 상태로 남지 않도록 savepoint 안에서 조회
+            with db.begin_nested():
+                reltuples = db.execute(RELTUPLES_SQL, {"table": self._table_name}).scalar()
+                # PostgreSQL 14+: 한 번도 VACUUM/ANALYZE되지 않은 테이블은 -1
+                if reltuples is not None and reltuples >= 0:
+                    return int(reltuples)
+                table = bind.dialect.identifier_preparer.quote(self._table_name)
+                plan: Any = db.execute(text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            print(f"[Count] {self._table_name} 추정치 조회 실패, 정확한 count 사용: {e}")
+            return None
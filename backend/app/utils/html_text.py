@@ -0,0 +1,25 @@
+# app/utils/html_text.py
+import html
+import re
+from typing import Optional, Tuple
+
+# 목록 카드/RSS description에 쓰는 평문 요약 길이 (Notice.excerpt 컬럼 길이와 맞춤)
+EXCERPT_LENGTH = 200
+
+_TAG_RE = re.compile(r"<[^<]+?>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def html_to_text(value: Optional[str]) -> str:
+    """에디터 HTML에서 태그를 걷어내고 엔티티 복원 + 공백 정리한 평문"""
+    if not value:
+        return ""
+    # 태그 경계에서 단어가 붙지 않도록 공백으로 치환
+    text = html.unescape(_TAG_RE.sub(" ", value))
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def build_excerpt(value: Optional[str], length: int = EXCERPT_LENGTH) -> Tuple[str, int]:
+    """(평문 요약, 평문 전체 글자 수)"""
+    text = html_to_text(value)
+    return text[:length], len(text)
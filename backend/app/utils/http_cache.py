@@ -0,0 +1,62 @@
+# app/utils/http_cache.py
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+@dataclass(frozen=True)
+class RenderedDocument:
+    """미리 렌더링해 캐시해 두는 응답 본문 + 조건부 요청용 검증자(ETag, Last-Modified)"""
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def build(cls, body: bytes, previous: Optional["RenderedDocument"] = None) -> "RenderedDocument":
+        """본문이 이전과 같으면 이전 문서를 그대로 반환해 Last-Modified가 움직이지 않게 함"""
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if previous and previous.etag == etag:
+            return previous
+        # HTTP 날짜는 초 단위이므로 If-Modified-Since 비교가 맞도록 마이크로초 제거
+        return cls(body=body, etag=etag, last_modified=datetime.now(timezone.utc).replace(microsecond=0))
+
+    @property
+    def last_modified_http(self) -> str:
+        return format_datetime(self.last_modified, usegmt=True)
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+def conditional_response(
+    request: Request,
+    document: RenderedDocument,
+    media_type: str,
+    max_age: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """캐시된 문서를 ETag/Last-Modified와 함께 응답하고, 클라이언트 사본이 최신이면 304"""
+    validators = {
+        "ETag": document.etag,
+        "Last-Modified": document.last_modified_http,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if document.is_not_modified(request):
+        return Response(status_code=304, headers=validators)
+    return Response(content=document.body, media_type=media_type, headers={**validators, **(headers or {})})
@@ -0,0 +1,111 @@
+# app/utils/http_client.py
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+import httpx
+
+from app.config import settings
+
+# provider별로 보관할 최근 응답 시간 표본 수 (p50/p95 계산용)
+LATENCY_SAMPLE_SIZE = 200
+
+
+class LatencyStats:
+    """외부 호출 응답 시간 통계 (누적 + 최근 표본)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._recent: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def record(self, elapsed_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.count += 1
+            if not ok:
+                self.errors += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            self._recent.append(elapsed_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, errors, total_ms, max_ms = self.count, self.errors, self.total_ms, self.max_ms
+        return {
+            "count": count,
+            "errors": errors,
+            "avg_ms": round(total_ms / count, 1) if count else None,
+            "p50_ms": round(statistics.median(recent), 1) if recent else None,
+            "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 1) if recent else None,
+            "max_ms": round(max_ms, 1) if count else None,
+        }
+
+
+class SharedHttpClient:
+    """
+    앱 lifespan 동안 유지되는 공유 httpx.AsyncClient (keep-alive, HTTP/2)
+
+    - 소셜 로그인 토큰 교환/프로필 조회가 매번 새 TLS 연결을 맺지 않도록 연결을 재사용
+    - provider별 타임아웃(*_OAUTH_TIMEOUT_SECONDS)과 응답 시간 통계를 함께 관리
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._stats: Dict[str, LatencyStats] = {}
+
+    @staticmethod
+    def _timeout_for(provider: str) -> float:
+        return {
+            "google": settings.GOOGLE_OAUTH_TIMEOUT_SECONDS,
+            "naver": settings.NAVER_OAUTH_TIMEOUT_SECONDS,
+        }.get(provider, settings.HTTP_CLIENT_DEFAULT_TIMEOUT_SECONDS)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # lifespan 밖(스크립트 등)에서 호출되면 최초 사용 시 생성
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=settings.HTTP_CLIENT_DEFAULT_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+                ),
+            )
+        return self._client
+
+    async def start(self) -> None:
+        self._get_client()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def request(self, provider: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """provider 타임아웃을 적용해 요청하고 응답 시간을 기록 (raise_for_status는 호출자)"""
+        kwargs.setdefault("timeout", self._timeout_for(provider))
+        stats = self._stats.setdefault(provider, LatencyStats())
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = await self._get_client().request(method, url, **kwargs)
+            ok = response.is_success
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats.record(elapsed_ms, ok)
+            if elapsed_ms >= settings.HTTP_CLIENT_SLOW_LOG_MS:
+                print(f"[HTTP Client] 느린 외부 호출 ({provider} {method} {url}): {elapsed_ms:.0f}ms")
+
+    def metrics(self) -> Dict[str, dict]:
+        return {provider: stats.snapshot() for provider, stats in self._stats.items()}
+
+
+shared_http_client = SharedHttpClient()
@@ -0,0 +1,128 @@
+# app/utils/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+from app.utils.counting import CountResult
+
+
+class SortKey(NamedTuple):
+    """목록 정렬 기준 한 개 (마지막 키는 항상 유일한 값(id)이어야 커서가 결정적임)"""
+    column: Any
+    descending: bool = True
+    # 결과 행에서 값을 읽을 속성명 (기본: column.key — ORM 엔티티/컬럼 projection 모두 동작)
+    # "User.id"처럼 점으로 이으면 Row(User, ...)의 엔티티 속성을 읽음
+    attr: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.attr or self.column.key
+
+    def value_of(self, row: Any) -> Any:
+        value = row
+        for part in self.name.split("."):
+            value = getattr(value, part)
+        return value
+
+    def order_by(self):
+        return self.column.desc() if self.descending else self.column.asc()
+
+
+class Page(NamedTuple):
+    items: list
+    total: int
+    next_cursor: Optional[str] = None
+    # False면 total이 플래너 추정치 (app/utils/counting.py)
+    total_exact: bool = True
+
+
+# -------------------------------
+# 커서 인코딩 (클라이언트에는 불투명한 문자열)
+# -------------------------------
+def _dump_value(value: Any):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _load_value(value: Any):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(sort_keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    payload = {"k": [key.name for key in sort_keys], "v": [_dump_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort_keys: Sequence[SortKey], cursor: str) -> List[Any]:
+    """다른 목록/정렬에서 만든 커서나 손상된 값이면 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["k"] != [key.name for key in sort_keys] or len(payload["v"]) != len(sort_keys):
+            raise ValueError("sort keys mismatch")
+        return [_load_value(v) for v in payload["v"]]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+
+
+# -------------------------------
+# 쿼리 적용
+# -------------------------------
+def _after(sort_keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    정렬 순서상 values 다음에 오는 행 조건.
+    키마다 방향이 달라도 되도록 (a > x) OR (a = x AND b < y) OR ... 형태로 펼침.
+    """
+    clauses = []
+    for i, key in enumerate(sort_keys):
+        equal_prefix = [sort_keys[j].column == values[j] for j in range(i)]
+        beyond = key.column < values[i] if key.descending else key.column > values[i]
+        clauses.append(and_(*equal_prefix, beyond))
+    return or_(*clauses)
+
+
+def _row_values(row: Any, sort_keys: Sequence[SortKey]) -> List[Any]:
+    return [key.value_of(row) for key in sort_keys]
+
+
+def paginate(
+    query,
+    sort_keys: Sequence[SortKey],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: Optional[Callable[[], CountResult]] = None,
+) -> Page:
+    """
+    (sort key, id) 기반 keyset 페이지네이션.
+
+    - cursor가 있으면 WHERE (정렬 키) > 커서 로 이어서 조회 → 몇 번째 페이지든 같은 비용
+    - cursor가 없으면 기존 OFFSET 방식 (첫 페이지 / 페이지 번호 이동 호환용)
+    - 어느 쪽이든 다음 페이지가 있으면 next_cursor를 함께 반환
+    - count를 주면 total 계산을 위임 (TableCounter: 캐시/추정치), 없으면 정확한 count
+    """
+    limit = max(limit, 1)
+    total = count() if count else CountResult(query.count())
+    ordered = query.order_by(*[key.order_by() for key in sort_keys])
+    if cursor:
+        ordered = ordered.filter(_after(sort_keys, decode_cursor(sort_keys, cursor)))
+    else:
+        ordered = ordered.offset(max(offset, 0))
+
+    # 한 건 더 읽어 다음 페이지 존재 여부 확인
+    rows = ordered.limit(limit + 1).all()
+    next_cursor = encode_cursor(sort_keys, _row_values(rows[limit - 1], sort_keys)) if len(rows) > limit else None
+    return Page(rows[:limit], total.total, next_cursor, total.exact)
@@ -0,0 +1,58 @@
+# app/utils/search.py
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy import Float, cast, func
+
+from app.utils.pagination import SortKey
+
+# pg_trgm은 3글자 단위로 색인하므로 이보다 짧은 검색어는 GIN 인덱스를 타지 못함 → prefix 검색으로 처리
+TRGM_MIN_LENGTH = 3
+SEARCH_SCORE_LABEL = "search_score"
+
+
+def normalize_search_term(value: Optional[str]) -> Optional[str]:
+    """앞뒤 공백 제거, 빈 검색어는 None"""
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def is_substring_search(term: str) -> bool:
+    return len(term) >= TRGM_MIN_LENGTH
+
+
+def text_match(column, term: str):
+    """
+    검색어 길이에 따라
+    - 3글자 이상: 부분 일치 ILIKE (pg_trgm GIN 인덱스)
+    - 그보다 짧으면: lower(column) prefix 일치 (text_pattern_ops btree 인덱스)
+    """
+    if is_substring_search(term):
+        return column.ilike(f"%{escape_like(term)}%", escape="\\")
+    return func.lower(column).like(escape_like(term.lower()) + "%", escape="\\")
+
+
+def relevance(columns: Sequence, term: str):
+    """
+    부분 일치 검색 정렬 점수: 컬럼별 word_similarity 중 최댓값 (높을수록 앞)
+    word_similarity는 real이므로 double precision으로 캐스팅 — 커서 값이 Python float(JSON)로 왕복해도
+    keyset 조건의 동점 비교(score = :v)가 정확히 맞도록 ORDER BY와 커서가 같은 타입을 씀
+    """
+    scores = [func.word_similarity(term, column) for column in columns]
+    return cast(scores[0] if len(scores) == 1 else func.greatest(*scores), Float(53))
+
+
+def relevance_sort(entity, score) -> Tuple[SortKey, SortKey]:
+    """
+    query(entity, score.label(SEARCH_SCORE_LABEL)) 결과를 (점수 내림차순, id)로 keyset 페이지네이션하기 위한 정렬 키.
+    결과 행은 Row(entity, search_score)이므로 id는 "<엔티티명>.id" 경로로 읽음.
+    """
+    return (
+        SortKey(score, attr=SEARCH_SCORE_LABEL),
+        SortKey(entity.id, attr=f"{entity.__name__}.id"),
+    )
@@ -0,0 +1,74 @@
+# migrations/env.py
+"""
+Alembic 실행 환경
+
+- DB URL은 app.config.settings.DATABASE_URL (ENV_FILE로 .env / .env.staging 선택)
+- target_metadata는 모든 모델이 등록된 Base.metadata (autogenerate 비교 대상)
+"""
+import re
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.config import settings
+from app.database.connection import Base
+# 모든 모델 import (metadata 등록용, 누락되면 autogenerate가 테이블 삭제로 인식함)
+from app.models import *  # noqa: F401,F403
+from app.models.quiz import (  # noqa: F401
+    Question, Choice, UserQuizHistory, QuizBundle,
+    QuizBundleQuestion, UserQuizBundleProgress, Topic, QuestionTopicLink,
+    UserQuizHistoryRollup,
+)
+
+config = context.config
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# user_quiz_history의 월/기본 파티션은 런타임에 생성·보관되므로 autogenerate 비교에서 제외
+_QUIZ_HISTORY_PARTITION_RE = re.compile(r"^user_quiz_history_(p\d{6}|default)$")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    return not (type_ == "table" and _QUIZ_HISTORY_PARTITION_RE.match(name))
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL만 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        compare_type=True,
+        include_name=include_name,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            include_name=include_name,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,387 @@
+"""baseline: 기존 create_all 스키마
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+
+Alembic 도입 전 create_all로 만들던 원래 스키마를 그대로 옮긴 기준 리비전.
+이미 create_all로 만들어진 DB는 이 리비전을 실행하지 않고 stamp만 함 (README 참고).
+그 뒤에 추가된 컬럼/인덱스(업로드 큐, 추첨 seed, 공지 요약, 대상자 중복/검색 인덱스 등)는
+0002_catch_up_schema에서 IF NOT EXISTS로 추가하므로, stamp한 DB와 새 DB 모두 upgrade head로 같은 스키마가 됨.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# 퀴즈 모델의 Enum 타입 (questions/quiz_bundles가 공유하므로 테이블 생성과 분리해서 한 번만 생성)
+question_type = postgresql.ENUM("MULTIPLE", "SHORT", name="questiontype", create_type=False)
+quiz_category = postgresql.ENUM("PRE_MODERN_HISTORY", "MODERN_HISTORY", name="quizcategory", create_type=False)
+quiz_difficulty = postgresql.ENUM("BASIC", "STANDARD", "ADVANCED", name="quizdifficulty", create_type=False)
+
+
+def _id_column() -> sa.Column:
+    return sa.Column("id", sa.Integer(), autoincrement=True, nullable=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for enum_type in (question_type, quiz_category, quiz_difficulty):
+        enum_type.create(bind, checkfirst=True)
+
+    # -------------------------------
+    # 회원
+    # -------------------------------
+    op.create_table(
+        "users",
+        _id_column(),
+        sa.Column("email", sa.String(100), nullable=False, comment="이메일"),
+        sa.Column("password_hash", sa.String(255), nullable=False, comment="비밀번호 해시"),
+        sa.Column("nickname", sa.String(15), nullable=False, comment="닉네임"),
+        sa.Column("role", sa.String(20), nullable=False, comment="사용자 권한 (member/admin)"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="활성 상태"),
+        sa.Column("is_email_verified", sa.Boolean(), nullable=True, comment="이메일 인증 여부"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="가입일시"),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True, comment="탈퇴일시"),
+        sa.Column("nickname_deactivated_at", sa.DateTime(timezone=True), nullable=True, comment="닉네임 비활성화 일시"),
+        sa.Column("is_blocked", sa.Boolean(), nullable=True, comment="차단 여부"),
+        sa.Column("blocked_at", sa.DateTime(timezone=True), nullable=True, comment="차단 일시"),
+        sa.Column("blocked_reason", sa.String(500), nullable=True, comment="차단 사유"),
+        sa.Column("agree_terms", sa.Boolean(), nullable=True, comment="서비스 이용약관 동의"),
+        sa.Column("agree_privacy", sa.Boolean(), nullable=True, comment="개인정보처리방침 동의"),
+        sa.Column("agree_collection", sa.Boolean(), nullable=True, comment="개인정보수집 및 이용동의"),
+        sa.Column("agree_marketing", sa.Boolean(), nullable=True, comment="마케팅정보 수집 및 이용 동의"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("nickname"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "temp_users",
+        _id_column(),
+        sa.Column("email", sa.String(100), nullable=False, comment="이메일"),
+        sa.Column("password_hash", sa.String(255), nullable=False, comment="비밀번호 해시"),
+        sa.Column("nickname", sa.String(15), nullable=False, comment="닉네임"),
+        sa.Column("verification_token", sa.String(255), nullable=False, comment="이메일 인증 토큰"),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False, comment="토큰 만료 시간"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성 시각"),
+        sa.Column("agree_terms", sa.Boolean(), nullable=True, comment="서비스 이용약관 동의"),
+        sa.Column("agree_privacy", sa.Boolean(), nullable=True, comment="개인정보처리방침 동의"),
+        sa.Column("agree_collection", sa.Boolean(), nullable=True, comment="개인정보수집 및 이용 동의"),
+        sa.Column("agree_marketing", sa.Boolean(), nullable=True, comment="마케팅정보 수집 및 이용 동의"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("nickname"),
+        sa.UniqueConstraint("verification_token"),
+    )
+    op.create_index("ix_temp_users_id", "temp_users", ["id"])
+
+    # -------------------------------
+    # 업로드 / 대상자 / 추첨
+    # -------------------------------
+    op.create_table(
+        "upload_files",
+        _id_column(),
+        sa.Column("original_filename", sa.String(255), nullable=False),
+        sa.Column("saved_filename", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=True),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("upload_type", sa.String(20), nullable=False),
+        sa.Column("drive_file_id", sa.String(255), nullable=True),
+        sa.Column("drive_web_view_link", sa.String(500), nullable=True),
+        sa.Column("drive_download_link", sa.String(500), nullable=True),
+        sa.Column("drive_created_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_upload_files_id", "upload_files", ["id"])
+
+    op.create_table(
+        "participants",
+        _id_column(),
+        sa.Column("name", sa.String(100), nullable=False, comment="이름"),
+        sa.Column("email", sa.String(100), nullable=False, comment="이메일"),
+        sa.Column("description", sa.String(500), nullable=True, comment="상세"),
+        sa.Column("upload_file_id", sa.Integer(), nullable=True, comment="업로드 파일 ID"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.ForeignKeyConstraint(["upload_file_id"], ["upload_files.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_participants_id", "participants", ["id"])
+
+    op.create_table(
+        "draw_records",
+        _id_column(),
+        sa.Column("title", sa.String(200), nullable=False, comment="추첨 제목"),
+        sa.Column("content", sa.Text(), nullable=True, comment="추첨 내용"),
+        sa.Column("draw_datetime", sa.DateTime(timezone=True), nullable=False, comment="추첨일시"),
+        sa.Column("total_participants", sa.Integer(), nullable=False, comment="대상자 수 (전체)"),
+        sa.Column("winner_count", sa.Integer(), nullable=False, comment="당첨자 수"),
+        sa.Column("upload_file_id", sa.Integer(), nullable=True, comment="업로드 파일 ID"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.ForeignKeyConstraint(["upload_file_id"], ["upload_files.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_draw_records_id", "draw_records", ["id"])
+
+    op.create_table(
+        "draw_participants",
+        _id_column(),
+        sa.Column("draw_record_id", sa.Integer(), nullable=False, comment="추첨 기록 ID"),
+        sa.Column("participant_number", sa.Integer(), nullable=False, comment="대상자 넘버 (순서구분용)"),
+        sa.Column("name", sa.String(100), nullable=False, comment="이름"),
+        sa.Column("email", sa.String(100), nullable=False, comment="이메일"),
+        sa.Column("description", sa.String(500), nullable=True, comment="상세"),
+        sa.Column("is_winner", sa.Boolean(), nullable=True, comment="당첨자 여부"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.ForeignKeyConstraint(["draw_record_id"], ["draw_records.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_draw_participants_id", "draw_participants", ["id"])
+
+    # -------------------------------
+    # 약관 / 공지 / FAQ / 알림
+    # -------------------------------
+    op.create_table(
+        "terms",
+        _id_column(),
+        sa.Column("key", sa.String(50), nullable=False, comment="약관 식별 키 (terms, privacy, collection, marketing)"),
+        sa.Column("title", sa.String(100), nullable=False, comment="약관 제목"),
+        sa.Column("content", sa.String(10000), nullable=False, comment="약관 내용"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="활성 상태"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_terms_id", "terms", ["id"])
+    op.create_index("ix_terms_key", "terms", ["key"], unique=True)
+
+    op.create_table(
+        "notice_categories",
+        _id_column(),
+        sa.Column("name", sa.String(50), nullable=False, comment="카테고리명"),
+        sa.Column("order", sa.Integer(), nullable=False, comment="정렬 순서"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="활성 여부"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index("ix_notice_categories_id", "notice_categories", ["id"])
+
+    op.create_table(
+        "notices",
+        _id_column(),
+        sa.Column("author_id", sa.Integer(), nullable=False, comment="작성자 ID"),
+        sa.Column("category_id", sa.Integer(), nullable=True, comment="카테고리 ID"),
+        sa.Column("title", sa.String(200), nullable=False, comment="제목"),
+        sa.Column("content", sa.Text(), nullable=False, comment="내용"),
+        sa.Column("publish_status", sa.String(20), nullable=False, comment="발행 상태 (published/scheduled/private)"),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True, comment="발행일시"),
+        sa.Column("first_published_at", sa.DateTime(timezone=True), nullable=True, comment="최초 발행일시"),
+        sa.Column("views", sa.Integer(), nullable=True, comment="조회수"),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True, comment="삭제 여부"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True, comment="삭제일시"),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["category_id"], ["notice_categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_notices_id", "notices", ["id"])
+
+    op.create_table(
+        "faq_categories",
+        _id_column(),
+        sa.Column("name", sa.String(50), nullable=False, comment="카테고리명"),
+        sa.Column("order", sa.Integer(), nullable=False, comment="정렬 순서"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="활성 상태"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index("ix_faq_categories_id", "faq_categories", ["id"])
+
+    op.create_table(
+        "faqs",
+        _id_column(),
+        sa.Column("category_id", sa.Integer(), nullable=True, comment="카테고리 ID"),
+        sa.Column("question", sa.String(300), nullable=False, comment="질문"),
+        sa.Column("answer", sa.Text(), nullable=False, comment="답변"),
+        sa.Column("order", sa.Integer(), nullable=False, comment="정렬 순서"),
+        sa.Column("is_active", sa.Boolean(), nullable=True, comment="공개 여부"),
+        sa.Column("views", sa.Integer(), nullable=True, comment="조회수"),
+        sa.Column("is_deleted", sa.Boolean(), nullable=True, comment="삭제 여부"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="수정일시"),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True, comment="삭제일시"),
+        sa.ForeignKeyConstraint(["category_id"], ["faq_categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_faqs_id", "faqs", ["id"])
+
+    op.create_table(
+        "notifications",
+        _id_column(),
+        sa.Column("type", sa.String(50), nullable=False, comment="알림 타입 (user_joined, draw_saved)"),
+        sa.Column("title", sa.String(200), nullable=False, comment="알림 제목"),
+        sa.Column("content", sa.Text(), nullable=True, comment="알림 내용"),
+        sa.Column("is_read", sa.Boolean(), nullable=True, comment="읽음 여부"),
+        sa.Column("related_id", sa.Integer(), nullable=True, comment="관련 ID (사용자 ID 또는 추첨 기록 ID)"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True, comment="생성일시"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_notifications_id", "notifications", ["id"])
+
+    # -------------------------------
+    # 퀴즈
+    # -------------------------------
+    op.create_table(
+        "questions",
+        _id_column(),
+        sa.Column("question_text", sa.Text(), nullable=False),
+        sa.Column("type", question_type, nullable=False),
+        sa.Column("correct_answer", sa.Text(), nullable=False),
+        sa.Column("explanation", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("category", quiz_category, nullable=False),
+        sa.Column("difficulty", quiz_difficulty, nullable=False),
+        sa.Column("image_url", sa.String(512), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_questions_id", "questions", ["id"])
+
+    op.create_table(
+        "choices",
+        _id_column(),
+        sa.Column("question_id", sa.Integer(), nullable=True),
+        sa.Column("content", sa.String(255), nullable=False),
+        sa.Column("is_correct", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_choices_id", "choices", ["id"])
+
+    op.create_table(
+        "quiz_bundles",
+        _id_column(),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", quiz_category, nullable=True),
+        sa.Column("difficulty", quiz_difficulty, nullable=True),
+        sa.Column("question_count", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_quiz_bundles_id", "quiz_bundles", ["id"])
+
+    op.create_table(
+        "user_quiz_history",
+        _id_column(),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("question_id", sa.Integer(), nullable=True),
+        sa.Column("bundle_id", sa.Integer(), nullable=True),
+        sa.Column("user_answer", sa.Text(), nullable=False),
+        sa.Column("is_correct", sa.Boolean(), nullable=True),
+        sa.Column("solved_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["bundle_id"], ["quiz_bundles.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_quiz_history_id", "user_quiz_history", ["id"])
+
+    op.create_table(
+        "quiz_bundle_questions",
+        _id_column(),
+        sa.Column("bundle_id", sa.Integer(), nullable=True),
+        sa.Column("question_id", sa.Integer(), nullable=True),
+        sa.Column("order", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["bundle_id"], ["quiz_bundles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_quiz_bundle_questions_id", "quiz_bundle_questions", ["id"])
+
+    op.create_table(
+        "user_quiz_bundle_progress",
+        _id_column(),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("bundle_id", sa.Integer(), nullable=False),
+        sa.Column("total_questions", sa.Integer(), nullable=False),
+        sa.Column("correct_answers", sa.Integer(), nullable=False),
+        sa.Column("completed", sa.Boolean(), nullable=True),
+        sa.Column("in_progress", sa.Boolean(), nullable=True),
+        sa.Column("last_question_id", sa.Integer(), nullable=True),
+        sa.Column("last_question_order", sa.Integer(), nullable=True),
+        sa.Column("last_played_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["bundle_id"], ["quiz_bundles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["last_question_id"], ["questions.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "bundle_id", name="uq_user_bundle_progress"),
+    )
+    op.create_index("ix_user_quiz_bundle_progress_id", "user_quiz_bundle_progress", ["id"])
+
+    op.create_table(
+        "quiz_topics",
+        _id_column(),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index("ix_quiz_topics_id", "quiz_topics", ["id"])
+
+    op.create_table(
+        "question_topic_links",
+        _id_column(),
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("topic_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["topic_id"], ["quiz_topics.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("question_id", "topic_id", name="uq_question_topic"),
+    )
+    op.create_index("ix_question_topic_links_id", "question_topic_links", ["id"])
+
+
+def downgrade() -> None:
+    for table in (
+        "question_topic_links",
+        "quiz_topics",
+        "user_quiz_bundle_progress",
+        "quiz_bundle_questions",
+        "user_quiz_history",
+        "quiz_bundles",
+        "choices",
+        "questions",
+        "notifications",
+        "faqs",
+        "faq_categories",
+        "notices",
+        "notice_categories",
+        "terms",
+        "draw_participants",
+        "draw_records",
+        "participants",
+        "upload_files",
+        "temp_users",
+        "users",
+    ):
+        op.drop_table(table)
+
+    bind = op.get_bind()
+    for enum_type in (quiz_difficulty, quiz_category, question_type):
+        enum_type.drop(bind, checkfirst=True)
@@ -0,0 +1,123 @@
+"""catch-up schema: Alembic 도입 전 모델에 추가됐지만 create_all로는 기존 DB에 반영되지 않던 컬럼/인덱스
+
+Revision ID: 0002_catch_up_schema
+Revises: 0001_baseline
+Create Date: 2026-10-19
+
+- upload_files: Google Drive 비동기 업로드 큐 컬럼 + ix_upload_files_drive_status
+- draw_records.random_seed (추첨 재현용 seed)
+- notices.excerpt / content_length (목록/RSS용 본문 요약, 값은 scripts/backfill_notice_excerpts.py로 채움)
+- participants: 업로드 중복 제거 유니크 인덱스 + 관리자 검색 인덱스(pg_trgm / prefix)
+- users: 관리자 검색 인덱스, notifications: 읽지 않은 알림 부분 인덱스, draw_participants: 상세 keyset 인덱스
+
+stamp 0001_baseline한 기존 DB에는 일부(스크립트로 먼저 만든 인덱스 등)가 이미 있을 수 있으므로
+모두 IF NOT EXISTS로 추가함. 대상자 중복이 남아 있으면 유니크 인덱스를 만들 수 없으므로
+scripts/dedupe_participants.py --apply를 먼저 실행하라는 오류로 중단.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_catch_up_schema"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼, 타입/기본값, 코멘트)
+COLUMNS = (
+    ("upload_files", "drive_status", "VARCHAR(20)", None),
+    ("upload_files", "drive_folder_id", "VARCHAR(255)", None),
+    ("upload_files", "drive_attempts", "INTEGER NOT NULL DEFAULT 0", None),
+    ("upload_files", "drive_next_attempt_at", "TIMESTAMP WITH TIME ZONE", None),
+    ("upload_files", "drive_last_error", "VARCHAR(500)", None),
+    ("upload_files", "mime_type", "VARCHAR(100)", None),
+    ("draw_records", "random_seed", "BIGINT", "추첨 재현용 seed"),
+    ("notices", "excerpt", "VARCHAR(200)", "본문 요약 (태그 제거 평문, 목록/RSS용)"),
+    ("notices", "content_length", "INTEGER", "본문 평문 글자 수"),
+)
+
+# (인덱스명, 테이블, 컬럼/표현식, 추가 옵션) — app/models의 __table_args__ / index=True와 동일
+INDEXES = (
+    ("ix_upload_files_drive_status", "upload_files", ["drive_status"], {}),
+    ("ix_notifications_unread", "notifications", ["id"], {"postgresql_where": sa.text("is_read = false")}),
+    ("ix_draw_participants_record_number", "draw_participants", ["draw_record_id", "participant_number"], {}),
+    (
+        "uq_participants_name_email_normalized",
+        "participants",
+        [sa.text("lower(btrim(name))"), sa.text("lower(btrim(email))")],
+        {"unique": True},
+    ),
+    ("ix_users_email_trgm", "users", ["email"], {"postgresql_using": "gin", "postgresql_ops": {"email": "gin_trgm_ops"}}),
+    (
+        "ix_users_nickname_trgm",
+        "users",
+        ["nickname"],
+        {"postgresql_using": "gin", "postgresql_ops": {"nickname": "gin_trgm_ops"}},
+    ),
+    ("ix_users_email_lower_prefix", "users", [sa.text("lower(email) text_pattern_ops")], {}),
+    ("ix_users_nickname_lower_prefix", "users", [sa.text("lower(nickname) text_pattern_ops")], {}),
+    (
+        "ix_participants_name_trgm",
+        "participants",
+        ["name"],
+        {"postgresql_using": "gin", "postgresql_ops": {"name": "gin_trgm_ops"}},
+    ),
+    (
+        "ix_participants_email_trgm",
+        "participants",
+        ["email"],
+        {"postgresql_using": "gin", "postgresql_ops": {"email": "gin_trgm_ops"}},
+    ),
+    (
+        "ix_participants_description_trgm",
+        "participants",
+        ["description"],
+        {"postgresql_using": "gin", "postgresql_ops": {"description": "gin_trgm_ops"}},
+    ),
+    ("ix_participants_name_lower_prefix", "participants", [sa.text("lower(name) text_pattern_ops")], {}),
+    ("ix_participants_email_lower_prefix", "participants", [sa.text("lower(email) text_pattern_ops")], {}),
+)
+
+COUNT_DUPLICATE_PARTICIPANTS_SQL = """
+SELECT count(*) - count(DISTINCT (lower(btrim(name)), lower(btrim(email))))
+FROM participants
+"""
+
+# 이전에 CONCURRENTLY 생성이 중단되어 남은 INVALID 인덱스 (IF NOT EXISTS가 건너뛰지 않도록 먼저 삭제)
+INVALID_INDEXES_SQL = """
+SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column, definition, comment in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {definition}")
+        if comment:
+            op.execute(sa.text(f"COMMENT ON COLUMN {table}.{column} IS :comment").bindparams(comment=comment))
+
+    duplicates = bind.execute(sa.text(COUNT_DUPLICATE_PARTICIPANTS_SQL)).scalar() or 0
+    if duplicates:
+        raise RuntimeError(
+            f"중복 대상자 {duplicates}명이 있어 uq_participants_name_email_normalized를 만들 수 없습니다. "
+            "python scripts/dedupe_participants.py --apply 실행 후 다시 시도하세요."
+        )
+
+    # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY (트랜잭션 밖에서만 실행 가능)
+    with op.get_context().autocommit_block():
+        names = [name for name, _table, _columns, _options in INDEXES]
+        for name in bind.execute(sa.text(INVALID_INDEXES_SQL), {"names": names}).scalars().all():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        for name, table, columns, options in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **options)
+        op.execute("ANALYZE participants")
+        op.execute("ANALYZE users")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _options in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    for table, column, _definition, _comment in reversed(COLUMNS):
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {column}")
@@ -0,0 +1,74 @@
+"""performance indexes: FK 컬럼 + 관리자/공개 목록 정렬
+
+Revision ID: 0003_performance_indexes
+Revises: 0002_catch_up_schema
+Create Date: 2026-10-19
+
+create_all 시절에는 기존 테이블에 인덱스를 추가할 방법이 없어 빠져 있던 인덱스들.
+- FK 컬럼: 조인 / 부모 삭제 시 참조 확인(ON DELETE CASCADE 포함)이 seq scan이 되지 않도록
+- 목록 정렬: keyset 페이지네이션(app/utils/pagination.py)의 (정렬 키, id) 순서 그대로
+
+운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 만들고, 이미 있는 인덱스는 건너뜀.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_performance_indexes"
+down_revision = "0002_catch_up_schema"
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼/표현식, 부분 인덱스 조건)
+INDEXES = (
+    # FK
+    ("ix_notices_author_id", "notices", ["author_id"], None),
+    ("ix_notices_category_id", "notices", ["category_id"], None),
+    ("ix_faqs_category_id", "faqs", ["category_id"], None),
+    ("ix_participants_upload_file_id", "participants", ["upload_file_id"], None),
+    ("ix_draw_records_upload_file_id", "draw_records", ["upload_file_id"], None),
+    ("ix_choices_question_id", "choices", ["question_id"], None),
+    ("ix_quiz_bundle_questions_question_id", "quiz_bundle_questions", ["question_id"], None),
+    ("ix_question_topic_links_topic_id", "question_topic_links", ["topic_id"], None),
+    ("ix_user_quiz_bundle_progress_bundle_id", "user_quiz_bundle_progress", ["bundle_id"], None),
+    # 문제집 문제 순서 조회 (bundle_id = ? ORDER BY order)
+    ("ix_quiz_bundle_questions_bundle_order", "quiz_bundle_questions", ["bundle_id", "order"], None),
+    # 관리자 목록 keyset (created_at DESC, id DESC)
+    ("ix_users_created_at_id", "users", ["created_at", "id"], None),
+    ("ix_draw_records_created_at_id", "draw_records", ["created_at", "id"], None),
+    ("ix_notifications_created_at_id", "notifications", ["created_at", "id"], None),
+    ("ix_notices_admin_list", "notices", ["created_at", "id"], "is_deleted = false"),
+    # 관리자 FAQ 목록 (order ASC, created_at DESC, id DESC)
+    (
+        "ix_faqs_admin_order",
+        "faqs",
+        ["order", sa.text("created_at DESC"), sa.text("id DESC")],
+        "is_deleted = false",
+    ),
+    # 공개 공지 목록 / 이전·다음글 (coalesce(published_at, created_at), id)
+    (
+        "ix_notices_public_timeline",
+        "notices",
+        [sa.text("coalesce(published_at, created_at)"), "id"],
+        "is_deleted = false",
+    ),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,63 @@
+"""quiz history indexes: 풀이 기록 / 테마형 진행 조회 패턴별 복합·부분 인덱스
+
+Revision ID: 0004_quiz_history_indexes
+Revises: 0003_performance_indexes
+Create Date: 2026-10-19
+
+- user_quiz_history: 마이페이지 통계, 오답 노트, 테마형 기록/초기화 + 관리자 통계
+  ((user_id, bundle_id) 조회는 bundle_id IS NOT NULL 부분 인덱스 (bundle_id, user_id)로 처리)
+- user_quiz_bundle_progress: 마이페이지 테마형 기록 (last_played_at 순)
+(user_id, bundle_id) 진행 조회는 uq_user_bundle_progress가 담당.
+실제 쿼리가 인덱스를 타는지는 scripts/check_quiz_indexes.py로 확인.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_quiz_history_indexes"
+down_revision = "0003_performance_indexes"
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼, 추가 옵션)
+INDEXES = (
+    (
+        "ix_user_quiz_history_user_question",
+        "user_quiz_history",
+        ["user_id", "question_id"],
+        {"postgresql_include": ["is_correct"]},
+    ),
+    (
+        "ix_user_quiz_history_wrong",
+        "user_quiz_history",
+        ["user_id", "solved_at"],
+        {"postgresql_where": sa.text("is_correct IS false")},
+    ),
+    ("ix_user_quiz_history_question", "user_quiz_history", ["question_id"], {"postgresql_include": ["is_correct"]}),
+    (
+        "ix_user_quiz_history_bundle_user",
+        "user_quiz_history",
+        ["bundle_id", "user_id"],
+        {"postgresql_include": ["is_correct"], "postgresql_where": sa.text("bundle_id IS NOT NULL")},
+    ),
+    (
+        "ix_user_quiz_bundle_progress_user_last_played",
+        "user_quiz_bundle_progress",
+        ["user_id", "last_played_at"],
+        {},
+    ),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **options)
+        op.execute("ANALYZE user_quiz_history")
+        op.execute("ANALYZE user_quiz_bundle_progress")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _options in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,162 @@
+"""partition user_quiz_history by month (solved_at) + rollups for archived months
+
+Revision ID: 0005_partition_quiz_history
+Revises: 0004_quiz_history_indexes
+Create Date: 2026-10-19
+
+- 기존 user_quiz_history를 solved_at 월 단위 RANGE 파티션 테이블로 옮김
+  (PK는 파티션 키를 포함해야 하므로 (id, solved_at), solved_at NOT NULL — NULL이던 행은 이관 시각으로 채움)
+- 가장 오래된 기록의 달부터 이번 달 + MONTHS_AHEAD까지 월 파티션 + 기본 파티션 생성
+  (이후 월은 앱의 quiz_history_partitions가 주기적으로 생성)
+- 보관(분리)된 월의 통계용 집계 테이블 user_quiz_history_rollups 생성
+
+기존 행을 새 테이블로 복사하는 동안 user_quiz_history 쓰기가 막히므로 트래픽이 적은 시간에 실행.
+downgrade는 파티션 데이터를 일반 테이블로 되돌리며, 보관 파일로 내린 월의 집계(rollups)는 사라짐.
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_partition_quiz_history"
+down_revision = "0004_quiz_history_indexes"
+branch_labels = None
+depends_on = None
+
+# 이번 달 이후 미리 만들어 둘 월 파티션 수 (settings.QUIZ_HISTORY_PARTITION_MONTHS_AHEAD 기본값과 같게)
+MONTHS_AHEAD = 2
+
+COLUMNS = "id, user_id, question_id, bundle_id, user_answer, is_correct, solved_at"
+
+# 0001/0004에서 만든 user_quiz_history 인덱스 (이름이 같은 새 인덱스를 만들기 전에 정리)
+INDEX_NAMES = (
+    "ix_user_quiz_history_id",
+    "ix_user_quiz_history_user_question",
+    "ix_user_quiz_history_wrong",
+    "ix_user_quiz_history_question",
+    "ix_user_quiz_history_bundle_user",
+)
+
+TABLE_SQL = """
+CREATE TABLE user_quiz_history (
+    id INTEGER NOT NULL DEFAULT nextval('user_quiz_history_id_seq'::regclass),
+    user_id INTEGER REFERENCES users (id) ON DELETE CASCADE,
+    question_id INTEGER REFERENCES questions (id) ON DELETE CASCADE,
+    bundle_id INTEGER REFERENCES quiz_bundles (id) ON DELETE SET NULL,
+    user_answer TEXT NOT NULL,
+    is_correct BOOLEAN,
+    solved_at TIMESTAMP WITHOUT TIME ZONE {solved_at},
+    CONSTRAINT user_quiz_history_pkey PRIMARY KEY ({primary_key})
+){partition_by}
+"""
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_user_quiz_history_id", "user_quiz_history", ["id"])
+    op.create_index(
+        "ix_user_quiz_history_user_question",
+        "user_quiz_history",
+        ["user_id", "question_id"],
+        postgresql_include=["is_correct"],
+    )
+    op.create_index(
+        "ix_user_quiz_history_wrong",
+        "user_quiz_history",
+        ["user_id", "solved_at"],
+        postgresql_where=sa.text("is_correct IS false"),
+    )
+    op.create_index("ix_user_quiz_history_question", "user_quiz_history", ["question_id"], postgresql_include=["is_correct"])
+    op.create_index(
+        "ix_user_quiz_history_bundle_user",
+        "user_quiz_history",
+        ["bundle_id", "user_id"],
+        postgresql_include=["is_correct"],
+        postgresql_where=sa.text("bundle_id IS NOT NULL"),
+    )
+
+
+def _set_aside(old_name: str) -> None:
+    """현재 user_quiz_history를 old_name으로 바꾸고, 새 테이블이 쓸 이름(인덱스/PK/시퀀스 소유)을 비워 둠"""
+    op.execute(f"ALTER TABLE user_quiz_history RENAME TO {old_name}")
+    for name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute(f"ALTER INDEX user_quiz_history_pkey RENAME TO {old_name}_pkey")
+    # id 시퀀스는 새 테이블이 이어서 사용
+    op.execute("ALTER SEQUENCE user_quiz_history_id_seq OWNED BY NONE")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    _set_aside("user_quiz_history_legacy")
+    op.execute(
+        TABLE_SQL.format(
+            solved_at="NOT NULL DEFAULT (now() AT TIME ZONE 'utc')",
+            primary_key="id, solved_at",
+            partition_by=" PARTITION BY RANGE (solved_at)",
+        )
+    )
+    op.execute("ALTER SEQUENCE user_quiz_history_id_seq OWNED BY user_quiz_history.id")
+
+    # 월 파티션: 가장 오래된 기록의 달 ~ 이번 달 + MONTHS_AHEAD
+    current = datetime.utcnow().date().replace(day=1)
+    oldest = bind.execute(sa.text("SELECT min(solved_at) FROM user_quiz_history_legacy")).scalar()
+    month = oldest.date().replace(day=1) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE user_quiz_history_p{month:%Y%m} PARTITION OF user_quiz_history "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+        month = upper
+    # 파티션이 아직 없는 범위의 행을 받아 주는 기본 파티션 (앱이 해당 월 파티션을 만들 때 옮김)
+    op.execute("CREATE TABLE user_quiz_history_default PARTITION OF user_quiz_history DEFAULT")
+
+    op.execute(
+        f"INSERT INTO user_quiz_history ({COLUMNS}) "
+        f"SELECT id, user_id, question_id, bundle_id, user_answer, is_correct, "
+        f"COALESCE(solved_at, now() AT TIME ZONE 'utc') FROM user_quiz_history_legacy"
+    )
+    op.drop_table("user_quiz_history_legacy")
+    # 데이터를 채운 뒤 인덱스 생성 (부모에 만들면 모든 파티션에 같은 인덱스가 생김)
+    _create_indexes()
+
+    op.create_table(
+        "user_quiz_history_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("question_id", sa.Integer(), nullable=True),
+        sa.Column("bundle_id", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("correct", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["question_id"], ["questions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["bundle_id"], ["quiz_bundles.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_user_quiz_history_rollups_id", "user_quiz_history_rollups", ["id"])
+    op.create_index("ix_user_quiz_history_rollups_month", "user_quiz_history_rollups", ["month"])
+    op.create_index("ix_user_quiz_history_rollups_user_question", "user_quiz_history_rollups", ["user_id", "question_id"])
+    op.create_index("ix_user_quiz_history_rollups_question", "user_quiz_history_rollups", ["question_id"])
+    op.create_index("ix_user_quiz_history_rollups_bundle_user", "user_quiz_history_rollups", ["bundle_id", "user_id"])
+
+    op.execute("ANALYZE user_quiz_history")
+
+
+def downgrade() -> None:
+    op.drop_table("user_quiz_history_rollups")
+
+    _set_aside("user_quiz_history_partitioned")
+    op.execute(TABLE_SQL.format(solved_at="", primary_key="id", partition_by=""))
+    op.execute("ALTER SEQUENCE user_quiz_history_id_seq OWNED BY user_quiz_history.id")
+    op.execute(f"INSERT INTO user_quiz_history ({COLUMNS}) SELECT {COLUMNS} FROM user_quiz_history_partitioned")
+    # 부모를 삭제하면 붙어 있는 파티션도 함께 삭제됨 (분리된 채 남은 파티션은 수동 정리)
+    op.execute("DROP TABLE user_quiz_history_partitioned")
+    _create_indexes()
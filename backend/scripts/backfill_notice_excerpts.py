@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+공지사항(notices)의 평문 요약(excerpt)/글자 수(content_length) 컬럼을 추가하고
+기존 행을 채우는 스크립트.
+
+- 컬럼이 이미 있으면 추가는 건너뜁니다.
+- excerpt가 비어 있는 행만 BATCH_SIZE건씩 나눠 계산/커밋합니다. (중단 후 재실행 가능)
+- --all 을 주면 요약 규칙이 바뀐 경우를 위해 모든 행을 다시 계산합니다.
+
+사용법:
+    python scripts/backfill_notice_excerpts.py                 # 대상 건수만 확인
+    python scripts/backfill_notice_excerpts.py --apply         # 컬럼 추가 + 비어 있는 행 백필
+    python scripts/backfill_notice_excerpts.py --apply --all   # 모든 행 재계산
+"""
+
+import sys
+import os
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, text
+from app.database.connection import SessionLocal
+from app.models import Notice
+from app.utils.html_text import build_excerpt
+
+BATCH_SIZE = 500
+
+ADD_COLUMNS_SQL = """
+ALTER TABLE notices
+    ADD COLUMN IF NOT EXISTS excerpt VARCHAR(200),
+    ADD COLUMN IF NOT EXISTS content_length INTEGER
+"""
+
+MISSING_COLUMNS_SQL = """
+SELECT count(*) FROM (VALUES ('excerpt'), ('content_length')) AS expected (column_name)
+WHERE NOT EXISTS (
+    SELECT 1 FROM information_schema.columns c
+    WHERE c.table_schema = current_schema() AND c.table_name = 'notices' AND c.column_name = expected.column_name
+)
+"""
+
+
+def run(apply: bool, recompute_all: bool):
+    db = SessionLocal()
+    try:
+        columns_missing = bool(db.execute(text(MISSING_COLUMNS_SQL)).scalar())
+        if columns_missing and not apply:
+            # 컬럼이 없으면 모든 행이 백필 대상 (Notice.excerpt를 조회할 수 없으므로 전체 건수로 확인)
+            total = db.scalar(select(func.count()).select_from(Notice.__table__)) or 0
+            print(f"excerpt/content_length 컬럼 없음, 백필 대상 공지: {total}건")
+            print("--apply 옵션을 주면 컬럼을 추가하고 요약을 채웁니다.")
+            return
+        if columns_missing:
+            db.execute(text(ADD_COLUMNS_SQL))
+            db.commit()
+
+        pending = Notice.id > 0 if recompute_all else Notice.excerpt.is_(None)
+        total = db.scalar(select(func.count(Notice.id)).where(pending)) or 0
+        print(f"백필 대상 공지: {total}건")
+        if not apply:
+            print("--apply 옵션을 주면 컬럼을 추가하고 요약을 채웁니다.")
+            return
+
+        # id 순으로 잘라 가며 처리 (본문 HTML은 배치 단위로만 메모리에 올림)
+        last_id, updated = 0, 0
+        while True:
+            rows = db.execute(
+                select(Notice.id, Notice.content)
+                .where(pending, Notice.id > last_id)
+                .order_by(Notice.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            for notice_id, content in rows:
+                excerpt, content_length = build_excerpt(content)
+                db.execute(
+                    Notice.__table__.update()
+                    .where(Notice.id == notice_id)
+                    .values(excerpt=excerpt, content_length=content_length)
+                )
+            db.commit()
+            last_id = rows[-1][0]
+            updated += len(rows)
+            print(f"  {updated}/{total}건 처리")
+
+        print(f"✅ 공지 요약 백필 완료: {updated}건")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 공지 요약 백필 중 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(apply="--apply" in args, recompute_all="--all" in args)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+관리자 검색 쿼리 지연시간 벤치마크 (합성 데이터, 기본 100만 행).
+
+세션 전용 임시 테이블(bench_participants)에 대상자와 같은 모양의 데이터를 만들고,
+서비스와 같은 형태의 검색 쿼리를 인덱스 없이 / pg_trgm·prefix 인덱스 생성 후 각각 실행해 중앙값(ms)을 비교합니다.
+임시 테이블이라 실제 테이블에는 영향이 없고, 연결을 닫으면 사라집니다. (pg_trgm 확장은 필요)
+
+사용법:
+    python scripts/benchmark_search.py                       # 1,000,000행, 쿼리당 5회
+    python scripts/benchmark_search.py --rows 200000 --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database.connection import engine
+
+SEED_SQL = """
+CREATE TEMP TABLE bench_participants AS
+SELECT
+    g AS id,
+    (ARRAY['김','이','박','최','정','강','조','윤','장','임'])[1 + g % 10]
+        || (ARRAY['민','서','지','현','수','영','준','하','예','도'])[1 + (g / 10) % 10]
+        || (ARRAY['호','연','우','진','아','윤','빈','원','희','린'])[1 + (g / 100) % 10] AS name,
+    'user' || g || '.' || substr(md5(g::text), 1, 6) || '@' ||
+        (ARRAY['gmail.com','naver.com','daum.net','kakao.com'])[1 + g % 4] AS email,
+    '수강생 메모 ' || substr(md5((g * 7)::text), 1, 24) AS description
+FROM generate_series(1, :rows) AS g
+"""
+
+INDEX_SQL = [
+    "CREATE INDEX ON bench_participants USING gin (name gin_trgm_ops)",
+    "CREATE INDEX ON bench_participants USING gin (email gin_trgm_ops)",
+    "CREATE INDEX ON bench_participants (lower(name) text_pattern_ops)",
+    "CREATE INDEX ON bench_participants (lower(email) text_pattern_ops)",
+]
+
+# (설명, SQL) — app/utils/search.py의 text_match/relevance와 같은 형태
+QUERIES = [
+    ("이름 prefix (2자)", "SELECT * FROM bench_participants WHERE lower(name) LIKE '김민%' ORDER BY id LIMIT 10"),
+    ("이메일 prefix (2자)", "SELECT * FROM bench_participants WHERE lower(email) LIKE 'us%' ORDER BY id LIMIT 10"),
+    (
+        "이메일 부분 일치 + 유사도 정렬",
+        "SELECT *, word_similarity('a1b2', email) AS s FROM bench_participants "
+        "WHERE email ILIKE '%a1b2%' ORDER BY s DESC, id LIMIT 10",
+    ),
+    (
+        "이름 부분 일치 + 유사도 정렬",
+        "SELECT *, word_similarity('민수호', name) AS s FROM bench_participants "
+        "WHERE name ILIKE '%민수호%' ORDER BY s DESC, id LIMIT 10",
+    ),
+    ("이메일 부분 일치 count", "SELECT count(*) FROM bench_participants WHERE email ILIKE '%a1b2%'"),
+]
+
+
+def measure(conn, sql: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(text(sql)).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run(rows: int, repeat: int):
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        print(f"합성 데이터 {rows:,}행 생성 중...")
+        conn.execute(text(SEED_SQL), {"rows": rows})
+        conn.execute(text("ANALYZE bench_participants"))
+
+        before = {label: measure(conn, sql, repeat) for label, sql in QUERIES}
+
+        print("인덱스 생성 중...")
+        started = time.perf_counter()
+        for sql in INDEX_SQL:
+            conn.execute(text(sql))
+        conn.execute(text("ANALYZE bench_participants"))
+        print(f"  인덱스 생성 {time.perf_counter() - started:.1f}s")
+
+        after = {label: measure(conn, sql, repeat) for label, sql in QUERIES}
+
+    print()
+    print(f"{'쿼리':<32}{'인덱스 없음(ms)':>16}{'인덱스 사용(ms)':>16}{'배율':>8}")
+    for label, _ in QUERIES:
+        ratio = before[label] / after[label] if after[label] else float("inf")
+        print(f"{label:<32}{before[label]:>16.1f}{after[label]:>16.1f}{ratio:>7.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="관리자 검색 쿼리 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 데이터 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+퀴즈 풀이 기록 인덱스 회귀 확인 (EXPLAIN 기반, 로컬 PostgreSQL 전용).
+
+임시 스키마(quiz_index_check)에 모델 그대로 테이블/인덱스를 만들고 합성 데이터를 채운 뒤,
+실제 서비스 함수(오답 노트, 테마형 상세, 마이페이지 통계, 진행 초기화, 관리자 통계)를 실행하면서
+user_quiz_history / user_quiz_bundle_progress를 읽는 SQL을 가로채 EXPLAIN 합니다.
+
+- 기대한 인덱스가 계획에 없거나 두 테이블(데이터가 있는 파티션)을 Seq Scan하면 ❌ (종료 코드 1)
+- 풀이 기록은 최근 SEED_DAYS일에 걸쳐 월 파티션에 나뉘어 들어가며, 파티션 인덱스는 부모 인덱스 이름으로 비교
+- 관리자 통계는 전체 집계라 계획만 출력 (참고용)
+- 끝나면 임시 스키마를 삭제 (--keep으로 유지 가능), 실제 테이블에는 영향 없음
+
+사용법:
+    python scripts/check_quiz_indexes.py                       # 사용자 2,000명 x 기록 100건
+    python scripts/check_quiz_indexes.py --users 5000 --history-per-user 200
+    python scripts/check_quiz_indexes.py --verbose             # 가로챈 SQL의 계획 전체 출력
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database.connection import Base
+from app.models import *  # noqa: F401,F403 (metadata 등록용)
+from app.services import mypage_service, quiz_service
+from app.services.quiz_history_partition_service import quiz_history_partitions
+
+SCHEMA = "quiz_index_check"
+TRACKED_TABLES = ("user_quiz_history", "user_quiz_bundle_progress")
+BUNDLE_SIZE = 10
+# 풀이 기록을 흩어 놓을 기간 (월 파티션 여러 개에 걸치도록)
+SEED_DAYS = 90
+SEED_MONTHS_BACK = 3
+
+# 임시 스키마의 파티션/파티션 인덱스 → 부모 이름, 테이블 행 수
+PARTITION_MAP_SQL = """
+SELECT c.relname AS child, p.relname AS parent, c.reltuples::bigint AS rows
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+JOIN pg_class p ON p.oid = i.inhparent
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = :schema
+"""
+
+# search_path 첫 번째가 임시 스키마라 모델/서비스 SQL이 그대로 임시 스키마 테이블을 가리킴
+engine = create_engine(settings.DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, password_hash, nickname, role, is_active)
+    SELECT 'quiz' || g || '@example.com', 'x', 'q' || g, 'member', true
+    FROM generate_series(1, :users) AS g
+    """,
+    """
+    INSERT INTO questions (question_text, type, correct_answer, created_at, category, difficulty)
+    SELECT '문제 ' || g, 'MULTIPLE', '1', now(),
+           ((ARRAY['PRE_MODERN_HISTORY','MODERN_HISTORY'])[1 + g % 2])::quizcategory,
+           ((ARRAY['BASIC','STANDARD','ADVANCED'])[1 + g % 3])::quizdifficulty
+    FROM generate_series(1, :questions) AS g
+    """,
+    """
+    INSERT INTO quiz_bundles (title, question_count, is_active, created_at)
+    SELECT '테마형 ' || g, :bundle_size, true, now()
+    FROM generate_series(1, :bundles) AS g
+    """,
+    """
+    INSERT INTO quiz_bundle_questions (bundle_id, question_id, "order")
+    SELECT b, 1 + (b * :bundle_size + k) % :questions, k
+    FROM generate_series(1, :bundles) AS b, generate_series(1, :bundle_size) AS k
+    """,
+    # 절반은 테마형 풀이(bundle_id 있음), 정답률 약 70%
+    """
+    INSERT INTO user_quiz_history (user_id, question_id, bundle_id, user_answer, is_correct, solved_at)
+    SELECT u,
+           1 + (u * 31 + k * 17) % :questions,
+           CASE WHEN k % 2 = 0 THEN 1 + (u + k) % :bundles END,
+           '1',
+           (u + k) % 10 < 7,
+           (now() AT TIME ZONE 'utc') - make_interval(secs => k * :spread_seconds)
+    FROM generate_series(1, :users) AS u, generate_series(1, :history_per_user) AS k
+    """,
+    """
+    INSERT INTO user_quiz_bundle_progress
+        (user_id, bundle_id, total_questions, correct_answers, completed, in_progress,
+         last_question_order, last_played_at)
+    SELECT u, b, :bundle_size, 7, b % 2 = 0, b % 2 = 1, 0, now() - make_interval(days => b)
+    FROM generate_series(1, :users) AS u, generate_series(1, LEAST(:bundles, 10)) AS b
+    """,
+]
+
+
+def setup(params: dict):
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        # 임시 스키마는 비어 있으므로 존재 확인 없이 생성 (public의 같은 이름 테이블/타입과 무관하게)
+        Base.metadata.create_all(conn, checkfirst=False)
+
+    # 운영과 같은 방식으로 월 파티션 생성 (시드 기간 + 앞으로의 달)
+    with Session(bind=engine) as db:
+        quiz_history_partitions.ensure_partitions(db, months_back=SEED_MONTHS_BACK)
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for sql in SEED_SQL:
+            conn.execute(text(sql), params)
+        tables = ("users", "questions", "quiz_bundles", "quiz_bundle_questions", "user_quiz_history_rollups")
+        for table in tables + TRACKED_TABLES:
+            conn.execute(text(f"VACUUM ANALYZE {table}"))
+
+
+def partition_map() -> dict:
+    """파티션(테이블/인덱스) 이름 → (부모 이름, 행 수)"""
+    with engine.connect() as conn:
+        rows = conn.execute(text(PARTITION_MAP_SQL), {"schema": SCHEMA}).all()
+    return {row.child: (row.parent, int(row.rows)) for row in rows}
+
+
+def drop():
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+# -------------------------------
+# 실행 계획 수집
+# -------------------------------
+def capture(func):
+    """func(db) 실행 중 추적 테이블을 읽는 SQL (statement, parameters) 목록"""
+    captured = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and any(table in statement for table in TRACKED_TABLES):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        with Session(bind=engine) as db:
+            func(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return captured
+
+
+def explain(statements) -> list:
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plans.append((statement, plan[0]["Plan"]))
+        conn.rollback()
+    return plans
+
+
+def walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def summarize(plan: dict, partitions: dict):
+    """
+    (사용한 인덱스 집합, Seq Scan한 추적 테이블 파티션 집합)
+    파티션 인덱스는 부모 인덱스 이름으로 바꾸고, 빈 파티션의 Seq Scan은 정상으로 봄
+    """
+    indexes, seq_scans = set(), set()
+    for node in walk(plan):
+        if node.get("Index Name"):
+            indexes.add(partitions.get(node["Index Name"], (node["Index Name"], 0))[0])
+        relation = node.get("Relation Name")
+        if node["Node Type"] == "Seq Scan" and relation:
+            parent, rows = partitions.get(relation, (relation, 1))
+            if parent in TRACKED_TABLES and rows > 0:
+                seq_scans.add(relation)
+    return indexes, seq_scans
+
+
+def render(node: dict, depth: int = 0) -> str:
+    label = node["Node Type"]
+    if node.get("Index Name"):
+        label += f" using {node['Index Name']}"
+    if node.get("Relation Name"):
+        label += f" on {node['Relation Name']}"
+    lines = [f"{'  ' * depth}-> {label} (rows={node.get('Plan Rows')})"]
+    for child in node.get("Plans", []):
+        lines.append(render(child, depth + 1))
+    return "\n".join(lines)
+
+
+# -------------------------------
+# 시나리오
+# -------------------------------
+def scenarios(user_id: int, bundle_id: int):
+    """(설명, 실행 함수, 계획에 반드시 나와야 하는 인덱스, 검증 여부)"""
+    return [
+        (
+            "오답 노트 (get_wrong_answers)",
+            lambda db: mypage_service.get_wrong_answers(db, user_id),
+            {"ix_user_quiz_history_wrong"},
+            True,
+        ),
+        (
+            "오답 노트 테마형 필터 (get_wrong_answers bundle_id)",
+            lambda db: mypage_service.get_wrong_answers(db, user_id, bundle_id=bundle_id),
+            set(),
+            True,
+        ),
+        (
+            "테마형 상세 + 풀이 기록 (get_quiz_bundle)",
+            lambda db: quiz_service.get_quiz_bundle(db, bundle_id, user_id=user_id),
+            {"ix_user_quiz_history_bundle_user", "uq_user_bundle_progress"},
+            True,
+        ),
+        (
+            "마이페이지 통계 (get_user_quiz_stats)",
+            lambda db: mypage_service.get_user_quiz_stats(db, user_id),
+            {"ix_user_quiz_history_user_question"},
+            True,
+        ),
+        (
+            "마이페이지 테마형 기록 (get_bundle_history)",
+            lambda db: mypage_service.get_bundle_history(db, user_id),
+            {"ix_user_quiz_bundle_progress_user_last_played"},
+            True,
+        ),
+        (
+            "관리자 퀴즈 통계 (get_admin_quiz_statistics)",
+            lambda db: quiz_service.get_admin_quiz_statistics(db),
+            set(),
+            False,
+        ),
+        # 데이터를 지우므로 마지막에 실행
+        (
+            "테마형 진행 초기화 (reset_user_bundle_progress)",
+            lambda db: quiz_service.reset_user_bundle_progress(db, user_id=user_id, bundle_id=bundle_id),
+            {"ix_user_quiz_history_bundle_user", "uq_user_bundle_progress"},
+            True,
+        ),
+    ]
+
+
+def run(args) -> bool:
+    params = {
+        "users": args.users,
+        "questions": args.questions,
+        "bundles": args.bundles,
+        "bundle_size": BUNDLE_SIZE,
+        "history_per_user": args.history_per_user,
+        "spread_seconds": SEED_DAYS * 86400 // max(args.history_per_user, 1),
+    }
+    print(f"임시 스키마 {SCHEMA}에 합성 데이터 생성 중 (기록 {args.users * args.history_per_user:,}건)...")
+    setup(params)
+    partitions = partition_map()
+
+    # 테마형 풀이 기록과 진행 기록이 모두 있는 사용자/테마형
+    user_id = args.users // 2
+    with engine.connect() as conn:
+        bundle_id = conn.execute(
+            text(
+                "SELECT h.bundle_id FROM user_quiz_history h "
+                "JOIN user_quiz_bundle_progress p ON p.user_id = h.user_id AND p.bundle_id = h.bundle_id "
+                "WHERE h.user_id = :user_id LIMIT 1"
+            ),
+            {"user_id": user_id},
+        ).scalar()
+    if bundle_id is None:
+        print("❌ 시드 데이터에서 테마형 풀이 기록을 찾지 못했습니다. --bundles를 줄여 다시 실행하세요.")
+        return False
+
+    ok = True
+    for label, func, expected, strict in scenarios(user_id, bundle_id):
+        plans = explain(capture(func))
+        used, seq_scans = set(), set()
+        for _statement, plan in plans:
+            indexes, seqs = summarize(plan, partitions)
+            used |= indexes
+            seq_scans |= seqs
+
+        missing = expected - used
+        passed = not missing and not seq_scans
+        mark = ("✅" if passed else "❌") if strict else "ℹ️ "
+        print(f"{mark} {label}: 사용 인덱스 {sorted(used) or '-'}")
+        if strict and missing:
+            print(f"    기대한 인덱스 미사용: {sorted(missing)}")
+        if seq_scans:
+            print(f"    Seq Scan: {sorted(seq_scans)}")
+        if args.verbose or (strict and not passed):
+            for statement, plan in plans:
+                print("    " + " ".join(statement.split())[:200])
+                print("\n".join("    " + line for line in render(plan).splitlines()))
+        ok = ok and (passed or not strict)
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="퀴즈 풀이 기록 인덱스 EXPLAIN 회귀 확인")
+    parser.add_argument("--users", type=int, default=2000, help="합성 사용자 수")
+    parser.add_argument("--history-per-user", type=int, default=100, help="사용자당 풀이 기록 수")
+    parser.add_argument("--questions", type=int, default=500, help="합성 문제 수")
+    parser.add_argument("--bundles", type=int, default=50, help="합성 테마형 수")
+    parser.add_argument("--verbose", action="store_true", help="가로챈 SQL과 계획 전체 출력")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 임시 스키마를 삭제하지 않음")
+    args = parser.parse_args()
+
+    try:
+        success = run(args)
+    finally:
+        if not args.keep:
+            drop()
+    print()
+    print("✅ 모든 쿼리가 기대한 인덱스를 사용합니다." if success else "❌ 인덱스를 타지 않는 쿼리가 있습니다.")
+    sys.exit(0 if success else 1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+관리자 회원/대상자 검색용 pg_trgm 확장과 인덱스를 기존 DB에 생성하는 스크립트.
+
+create_all은 이미 있는 테이블에 새 인덱스를 만들지 않으므로, 운영 중인 DB에는 이 스크립트로 한 번 생성합니다.
+- CREATE INDEX CONCURRENTLY로 만들어 테이블 쓰기를 막지 않습니다.
+- 이미 있는 인덱스는 건너뜁니다.
+
+사용법:
+    python scripts/create_search_indexes.py            # 없는 인덱스 확인
+    python scripts/create_search_indexes.py --apply    # 확장 + 인덱스 생성
+"""
+
+import sys
+import os
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database.connection import engine
+
+CREATE_EXTENSION_SQL = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+# 인덱스명 → 생성 DDL (app/models/user_model.py, participant_model.py의 __table_args__와 동일)
+SEARCH_INDEXES = {
+    "ix_users_email_trgm": "ON users USING gin (email gin_trgm_ops)",
+    "ix_users_nickname_trgm": "ON users USING gin (nickname gin_trgm_ops)",
+    "ix_users_email_lower_prefix": "ON users (lower(email) text_pattern_ops)",
+    "ix_users_nickname_lower_prefix": "ON users (lower(nickname) text_pattern_ops)",
+    "ix_participants_name_trgm": "ON participants USING gin (name gin_trgm_ops)",
+    "ix_participants_email_trgm": "ON participants USING gin (email gin_trgm_ops)",
+    "ix_participants_description_trgm": "ON participants USING gin (description gin_trgm_ops)",
+    "ix_participants_name_lower_prefix": "ON participants (lower(name) text_pattern_ops)",
+    "ix_participants_email_lower_prefix": "ON participants (lower(email) text_pattern_ops)",
+}
+
+EXISTING_INDEXES_SQL = text("SELECT indexname FROM pg_indexes WHERE indexname = ANY(:names)")
+INVALID_INDEXES_SQL = text("""
+SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+""")
+
+
+def run(apply: bool):
+    names = list(SEARCH_INDEXES)
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        try:
+            existing = set(conn.execute(EXISTING_INDEXES_SQL, {"names": names}).scalars())
+            # 이전에 CONCURRENTLY 생성이 중단되면 INVALID 인덱스가 남으므로 다시 생성
+            invalid = set(conn.execute(INVALID_INDEXES_SQL, {"names": names}).scalars())
+            missing = [name for name in names if name not in existing or name in invalid]
+            print(f"생성할 검색 인덱스: {len(missing)}개")
+            for name in missing:
+                print(f"  - {name}{' (INVALID, 재생성)' if name in invalid else ''}")
+            if not apply:
+                print("--apply 옵션을 주면 pg_trgm 확장과 인덱스를 생성합니다.")
+                return
+
+            conn.execute(text(CREATE_EXTENSION_SQL))
+            for name in missing:
+                if name in invalid:
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                print(f"  {name} 생성 중...")
+                conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {SEARCH_INDEXES[name]}"))
+            conn.execute(text("ANALYZE users"))
+            conn.execute(text("ANALYZE participants"))
+            print("✅ 검색 인덱스 생성 완료")
+        except Exception as e:
+            print(f"❌ 검색 인덱스 생성 중 오류 발생: {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    run(apply="--apply" in sys.argv[1:])
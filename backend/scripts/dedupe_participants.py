@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+대상자(participants) 테이블의 중복 (이름, 이메일)을 정리하고
+업로드 중복 제거에 쓰이는 유니크 함수 인덱스를 생성하는 스크립트.
+
+- 대소문자/앞뒤 공백을 무시한 (이름, 이메일)이 같은 행 중 id가 가장 작은 행만 남깁니다.
+- 이미 인덱스가 있으면 인덱스 생성은 건너뜁니다.
+
+사용법:
+    python scripts/dedupe_participants.py            # 중복 건수만 확인
+    python scripts/dedupe_participants.py --apply    # 중복 삭제 + 인덱스 생성
+"""
+
+import sys
+import os
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database.connection import SessionLocal
+
+COUNT_DUPLICATES_SQL = """
+SELECT count(*) - count(DISTINCT (lower(btrim(name)), lower(btrim(email))))
+FROM participants
+"""
+
+DELETE_DUPLICATES_SQL = """
+DELETE FROM participants p
+USING participants keep
+WHERE lower(btrim(p.name)) = lower(btrim(keep.name))
+  AND lower(btrim(p.email)) = lower(btrim(keep.email))
+  AND p.id > keep.id
+"""
+
+CREATE_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS uq_participants_name_email_normalized
+ON participants (lower(btrim(name)), lower(btrim(email)))
+"""
+
+
+def run(apply: bool):
+    db = SessionLocal()
+    try:
+        duplicates = db.execute(text(COUNT_DUPLICATES_SQL)).scalar() or 0
+        print(f"중복 대상자: {duplicates}명")
+        if not apply:
+            print("--apply 옵션을 주면 중복을 삭제하고 인덱스를 생성합니다.")
+            return
+
+        deleted = db.execute(text(DELETE_DUPLICATES_SQL)).rowcount
+        db.execute(text(CREATE_INDEX_SQL))
+        db.commit()
+        print(f"✅ 중복 {deleted}명 삭제, 유니크 인덱스 생성 완료")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 중복 정리 중 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run(apply="--apply" in sys.argv[1:])
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 데이터베이스 초기화 스크립트
-모든 테이블을 삭제하고 재생성합니다.
+모든 테이블을 삭제하고 Alembic 마이그레이션(alembic upgrade head)으로 재생성합니다.
 """
 
 import sys
@@ -20,10 +20,16 @@ from app.models import (
 # Quiz 모델들도 import (누락되면 테이블 삭제 시 오류 발생)
 from app.models.quiz import (
     Question, Choice, UserQuizHistory, QuizBundle,
-    QuizBundleQuestion, UserQuizBundleProgress, Topic, QuestionTopicLink
+    QuizBundleQuestion, UserQuizBundleProgress, Topic, QuestionTopicLink,
+    UserQuizHistoryRollup,
 )
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
 import logging
 
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,11 +44,13 @@ def init_database():
         # 모든 테이블 삭제
         logger.info("\n[1단계] 기존 테이블 삭제 중...")
         Base.metadata.drop_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
         logger.info("✓ 기존 테이블이 모두 삭제되었습니다.")
         
-        # 모든 테이블 재생성
-        logger.info("\n[2단계] 테이블 재생성 중...")
-        Base.metadata.create_all(bind=engine)
+        # 모든 테이블 재생성 (마이그레이션 기준이므로 alembic_version도 head로 기록됨)
+        logger.info("\n[2단계] 테이블 재생성 중 (alembic upgrade head)...")
+        command.upgrade(Config(os.path.join(BACKEND_DIR, "alembic.ini")), "head")
         logger.info("✓ 테이블이 모두 생성되었습니다.")
         
         logger.info("\n" + "=" * 60)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+퀴즈 풀이 기록(user_quiz_history) 월 파티션 확인 / 생성 / 보관 / 복원 스크립트.
+
+- 서버의 quiz_history_partitions 스레드가 앞으로의 월 파티션을 주기적으로 만들지만,
+  서버를 오래 내려 두었거나 과거 월을 복원하기 전에는 이 스크립트로 직접 만들 수 있습니다.
+- 보관(--archive)은 QUIZ_HISTORY_RETENTION_MONTHS보다 오래된 월 파티션의 집계를 user_quiz_history_rollups에 남기고
+  QUIZ_HISTORY_ARCHIVE_DIR/<파티션명>.csv.gz로 내린 뒤 테이블을 삭제합니다. (마이페이지/관리자 통계는 그대로 유지)
+
+사용법:
+    python scripts/quiz_history_partitions.py                              # 파티션/보관 대상/보관 파일 확인
+    python scripts/quiz_history_partitions.py --apply                      # 없는 월 파티션 생성
+    python scripts/quiz_history_partitions.py --apply --archive            # 보관 기간이 지난 파티션 보관
+    python scripts/quiz_history_partitions.py --apply --archive --retention-months 12
+    python scripts/quiz_history_partitions.py --apply --restore archives/quiz_history/user_quiz_history_p202401.csv.gz
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.database.connection import SessionLocal
+from app.services.quiz_history_partition_service import (
+    ARCHIVE_SUFFIX,
+    DEFAULT_PARTITION,
+    add_months,
+    month_start,
+    parse_partition_month,
+    partition_name,
+    quiz_history_partitions,
+)
+
+
+def archive_files(directory: str):
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        name for name in os.listdir(directory) if name.endswith(ARCHIVE_SUFFIX) and parse_partition_month(name)
+    )
+
+
+def run(args):
+    directory = args.archive_dir or settings.QUIZ_HISTORY_ARCHIVE_DIR
+    retention = args.retention_months if args.retention_months is not None else settings.QUIZ_HISTORY_RETENTION_MONTHS
+    cutoff = add_months(month_start(datetime.utcnow().date()), -retention)
+
+    db = SessionLocal()
+    try:
+        if args.restore:
+            print(f"복원할 보관 파일: {args.restore}")
+            if not args.apply:
+                print("--apply 옵션을 주면 파티션으로 다시 붙이고 해당 월 집계를 원본으로 대체합니다.")
+                return
+            name = quiz_history_partitions.restore_partition(db, args.restore)
+            print(f"✅ {name} 복원 완료")
+            return
+
+        partitions = quiz_history_partitions.list_partitions(db)
+        missing = quiz_history_partitions.missing_months(db)
+        expired = [p for p in partitions if p.month and p.month < cutoff]
+
+        print(f"월 파티션: {sum(1 for p in partitions if p.month)}개")
+        for partition in partitions:
+            mark = " (보관 대상)" if partition in expired else ""
+            print(f"  - {partition.name}: 약 {max(partition.rows, 0):,}건{mark}")
+        default = next((p for p in partitions if p.name == DEFAULT_PARTITION), None)
+        if default is None:
+            print(f"❌ 기본 파티션({DEFAULT_PARTITION})이 없습니다. alembic upgrade head를 확인하세요.")
+        elif default.rows > 0:
+            print(f"  기본 파티션에 약 {default.rows:,}건 — 해당 월 파티션을 만들면 옮겨집니다.")
+        print(f"생성할 월 파티션: {len(missing)}개")
+        for month in missing:
+            print(f"  - {partition_name(month)}")
+        print(f"보관 기간: {retention}개월 ({cutoff:%Y-%m} 이전 월 보관), 보관 대상: {len(expired)}개")
+        files = archive_files(directory)
+        print(f"보관 파일 ({directory}): {len(files)}개")
+        for name in files:
+            print(f"  - {name}")
+
+        if not args.apply:
+            print("--apply 옵션을 주면 없는 월 파티션을 생성합니다. (--archive를 함께 주면 보관 대상도 보관)")
+            return
+
+        created = quiz_history_partitions.ensure_partitions(db)
+        print(f"✅ 월 파티션 생성: {len(created)}개")
+
+        if args.archive:
+            for partition in expired:
+                print(f"  {partition.name} 보관 중...")
+                path = quiz_history_partitions.archive_partition(db, partition.month, directory)
+                print(f"  → {path}")
+            print(f"✅ 파티션 보관 완료: {len(expired)}개")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 파티션 작업 중 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="퀴즈 풀이 기록 월 파티션 관리")
+    parser.add_argument("--apply", action="store_true", help="실제로 생성/보관/복원")
+    parser.add_argument("--archive", action="store_true", help="보관 기간이 지난 월 파티션을 보관 파일로 내림")
+    parser.add_argument("--retention-months", type=int, help="보관 기간 (기본: QUIZ_HISTORY_RETENTION_MONTHS)")
+    parser.add_argument("--archive-dir", help="보관 파일 디렉터리 (기본: QUIZ_HISTORY_ARCHIVE_DIR)")
+    parser.add_argument("--restore", metavar="PATH", help="보관 파일을 월 파티션으로 복원")
+    run(parser.parse_args())
@@ -8,6 +8,7 @@ export default function DrawDetail() {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(true);
   const [draw, setDraw] = useState(null);
+  const [participants, setParticipants] = useState([]);
   const [error, setError] = useState(null);
   const [currentPage, setCurrentPage] = useState(parseInt(searchParams.get('page') || '1', 10));
   const itemsPerPage = 20;
@@ -40,10 +41,14 @@ export default function DrawDetail() {
     setLoading(true);
     setError(null);
     try {
-      const res = await apiClient.get(`/draw/${drawId}`);
+      // 대상자는 participant_number 기준 keyset 페이지로 받음 (번호가 1부터 연속이므로 after로 페이지 이동 가능)
+      const res = await apiClient.get(`/draw/${drawId}`, {
+        params: { after: (currentPage - 1) * itemsPerPage, limit: itemsPerPage },
+      });
       // API 응답 구조: { message: "...", data: {...} }
       const drawData = res.data.data || res.data;
       setDraw(drawData);
+      setParticipants(drawData.participants || []);
       setLoading(false);
     } catch (e) {
       console.error('추첨 상세 조회 실패:', e);
@@ -73,21 +78,28 @@ export default function DrawDetail() {
   };
 
   // 페이지네이션 계산
-  const paginatedParticipants = useMemo(() => {
-    if (!draw?.participants) return [];
-    const start = (currentPage - 1) * itemsPerPage;
-    const end = start + itemsPerPage;
-    return draw.participants.slice(start, end);
-  }, [draw?.participants, currentPage]);
+  const paginatedParticipants = participants;
 
   const totalPages = useMemo(() => {
-    if (!draw?.participants) return 1;
-    return Math.ceil((draw.participants.length || 0) / itemsPerPage);
-  }, [draw?.participants]);
+    if (!draw?.total_participants) return 1;
+    return Math.ceil(draw.total_participants / itemsPerPage);
+  }, [draw?.total_participants]);
 
-  const handlePageChange = (page) => {
+  const handlePageChange = async (page) => {
     setCurrentPage(page);
     setSearchParams({ page: String(page) });
+    try {
+      const res = await apiClient.get(`/draw/${drawId}/participants`, {
+        params: { after: (page - 1) * itemsPerPage, limit: itemsPerPage },
+      });
+      setParticipants(res.data.data || []);
+    } catch (e) {
+      console.error('추첨 대상자 조회 실패:', e);
+    }
+  };
+
+  const handleExport = (format) => {
+    window.location.href = `/api/draw/${drawId}/export?format=${format}`;
   };
 
   const getParticipantNumber = (participant, index) => {
@@ -268,6 +280,20 @@ export default function DrawDetail() {
                 총 {draw.total_participants || 0}명의 대상자 (페이지 {currentPage}/{totalPages})
               </p>
             </div>
+            <div className="flex items-center space-x-2">
+              <button
+                onClick={() => handleExport('csv')}
+                className="px-3 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
+              >
+                CSV 다운로드
+              </button>
+              <button
+                onClick={() => handleExport('xlsx')}
+                className="px-3 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50"
+              >
+                엑셀 다운로드
+              </button>
+            </div>
           </div>
         </div>
         
@@ -7,6 +7,7 @@ export default function DrawResult() {
   const location = useLocation();
   const [winners, setWinners] = useState([]);
   const [count, setCount] = useState(0);
+  const [seed, setSeed] = useState(null);
   const [totalParticipants, setTotalParticipants] = useState(0);
   const [saveModalOpen, setSaveModalOpen] = useState(false);
   const [errorModalOpen, setErrorModalOpen] = useState(false);
@@ -28,8 +29,9 @@ export default function DrawResult() {
   // location.state에서 데이터 로드
   useEffect(() => {
     if (location.state) {
-      const { winners: winnersData, totalParticipants: total, count: winnerCount } = location.state;
+      const { winners: winnersData, seed: drawSeed, totalParticipants: total, count: winnerCount } = location.state;
       setWinners(winnersData || []);
+      setSeed(drawSeed ?? null);
       setCount(winnerCount || winnersData?.length || 0);
       setTotalParticipants(total || 0);
       setDrawDatetime(new Date());
@@ -212,6 +214,7 @@ export default function DrawResult() {
         draw_datetime: drawDatetime.toISOString(),
         total_participants: totalParticipants,
         winner_count: count,
+        seed,
         winners: winners.map(w => ({
           name: w.name,
           email: w.email,
@@ -115,6 +115,7 @@ export default function DrawSelect() {
       navigate('/admin/draw/result', {
         state: {
           winners,
+          seed: res.data.seed,
           totalParticipants: allParticipants.length,
           count: winnerCount,
         },
@@ -30,6 +30,18 @@ export default function Notifications() {
     loadNotifications();
   }, []);
 
+  // 새 알림 실시간 수신 (SSE) — 폴링 없이 목록 앞에 추가
+  useEffect(() => {
+    const source = new EventSource("/api/notifications/stream", { withCredentials: true });
+    source.addEventListener("notification", (event) => {
+      const incoming = JSON.parse(event.data);
+      setNotifications((prev) =>
+        prev.some((n) => n.id === incoming.id) ? prev : [incoming, ...prev]
+      );
+    });
+    return () => source.close();
+  }, []);
+
   const showToast = (message, type = "info") => {
     setToast({ show: true, message, type });
     setTimeout(() => setToast({ show: false, message: "", type: "info" }), 3000);
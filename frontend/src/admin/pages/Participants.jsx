@@ -28,6 +28,7 @@ export default function Participants() {
   const [currentPage, setCurrentPage] = useState(parseInt(query.get('page') || '1', 10));
   const [totalPages, setTotalPages] = useState(1);
   const [totalCount, setTotalCount] = useState(0);
+  const [totalExact, setTotalExact] = useState(true);
   const [selectedIds, setSelectedIds] = useState(new Set());
   const limit = 10;
 
@@ -113,6 +114,7 @@ export default function Participants() {
       const res = await apiClient.get('/participants', { params });
       setParticipants(res.data.participants || []);
       setTotalCount(res.data.total || 0);
+      setTotalExact(res.data.total_exact !== false);
       setTotalPages(Math.ceil((res.data.total || 0) / limit));
     } catch (e) {
       console.error('대상자 목록 조회 실패:', e);
@@ -369,7 +371,7 @@ export default function Participants() {
                 <input
                   id="fileInput"
                   type="file"
-                  accept=".xlsx,.xls"
+                  accept=".xlsx,.xls,.csv,.tsv"
                   className="block w-full text-sm text-gray-500 file:mr-4 file:py-2 file:px-4 file:rounded-full file:border-0 file:text-sm file:font-semibold file:bg-primary file:text-white hover:file:bg-blue-700"
                   required
                 />
@@ -705,7 +707,7 @@ export default function Participants() {
           <div className="flex flex-col lg:flex-row lg:items-end gap-2">
             <div className="bg-white px-4 py-3 text-center border-t border-gray-200 rounded-lg shadow-sm border">
               <p className="text-sm text-gray-700">
-                총 <span className="font-medium text-primary">{totalCount}</span>명 중{' '}
+                총 {!totalExact && '약 '}<span className="font-medium text-primary">{totalCount}</span>명 중{' '}
                 <span className="font-medium text-primary">{(currentPage - 1) * limit + 1}</span> -{' '}
                 <span className="font-medium text-primary">{Math.min(currentPage * limit, totalCount)}</span>번째 표시
               </p>
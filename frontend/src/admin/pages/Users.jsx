@@ -10,6 +10,7 @@ export default function Users() {
   const [currentPage, setCurrentPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
   const [totalCount, setTotalCount] = useState(0);
+  const [totalExact, setTotalExact] = useState(true);
   const [filters, setFilters] = useState({
     search: '',
     role: '',
@@ -115,6 +116,7 @@ export default function Users() {
       const res = await apiClient.get('/admin/users/count', { params });
       const count = res.data.total_count || 0;
       setTotalCount(count);
+      setTotalExact(res.data.total_exact !== false);
       setTotalPages(Math.ceil(count / limit));
     } catch (e) {
       console.error('사용자 수 조회 실패:', e);
@@ -538,7 +540,7 @@ export default function Users() {
             <div className="hidden sm:flex-1 sm:flex sm:items-center sm:justify-between">
               <div>
                 <p className="text-sm text-gray-700">
-                  총 {totalCount}개 중 {((currentPage - 1) * limit) + 1}-{Math.min(currentPage * limit, totalCount)}개
+                  총 {!totalExact && '약 '}{totalCount}개 중 {((currentPage - 1) * limit) + 1}-{Math.min(currentPage * limit, totalCount)}개
                 </p>
               </div>
               <div>